@@ -23,12 +23,15 @@ from src.db.base import Base
 # Don't import models for migrations - they will be created in migration files
 # from src.db.models import *  # noqa: F401, F403
 from src.config import settings
+from src.db.engine import async_database_url
 
 # this is the Alembic Config object
 config = context.config
 
-# Override sqlalchemy.url with config
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+# Override sqlalchemy.url with config (% is escaped for ConfigParser)
+config.set_main_option(
+    "sqlalchemy.url", async_database_url(settings.DATABASE_URL).replace("%", "%%")
+)
 
 # Interpret the config file for Python logging.
 if config.config_file_name is not None:
@@ -0,0 +1,42 @@
+"""Add agent_session_summaries table for persisted conversation summaries
+
+Revision ID: 003_add_session_summaries
+Revises: 002_add_pgvector
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "003_add_session_summaries"
+down_revision: Union[str, None] = "002_add_pgvector"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create agent_session_summaries table
+    op.create_table(
+        "agent_session_summaries",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("session_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("agent_sessions.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("up_to_message_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("message_count", sa.Integer(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index(
+        "idx_agent_session_summaries_session_message",
+        "agent_session_summaries",
+        ["session_id", "up_to_message_id", "message_count"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_agent_session_summaries_session_message", table_name="agent_session_summaries")
+    op.drop_table("agent_session_summaries")
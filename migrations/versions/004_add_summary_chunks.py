@@ -0,0 +1,45 @@
+"""Add chunk range columns to agent_session_summaries for incremental compression
+
+Revision ID: 004_add_summary_chunks
+Revises: 003_add_session_summaries
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "004_add_summary_chunks"
+down_revision: Union[str, None] = "003_add_session_summaries"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("agent_session_summaries", sa.Column("start_message_id", postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column("agent_session_summaries", sa.Column("is_chunk", sa.Boolean(), nullable=False, server_default=sa.false()))
+
+    # Chunk and conversation summaries may cover the same window
+    op.drop_index("idx_agent_session_summaries_session_message", table_name="agent_session_summaries")
+    op.create_index(
+        "idx_agent_session_summaries_session_message",
+        "agent_session_summaries",
+        ["session_id", "up_to_message_id", "message_count", "is_chunk"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM agent_session_summaries WHERE is_chunk")
+    op.drop_index("idx_agent_session_summaries_session_message", table_name="agent_session_summaries")
+    op.create_index(
+        "idx_agent_session_summaries_session_message",
+        "agent_session_summaries",
+        ["session_id", "up_to_message_id", "message_count"],
+        unique=True,
+    )
+    op.drop_column("agent_session_summaries", "is_chunk")
+    op.drop_column("agent_session_summaries", "start_message_id")
@@ -0,0 +1,37 @@
+"""Extend the agent_messages (session_id, created_at) index with id for keyset paging
+
+Revision ID: 005_message_keyset_index
+Revises: 004_add_summary_chunks
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_message_keyset_index"
+down_revision: Union[str, None] = "004_add_summary_chunks"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (session_id, created_at, id) serves the (created_at, id) row-value
+    # cursor and still covers every session_id + created_at ordering;
+    # btree indexes scan backwards, so no separate DESC index is needed
+    op.create_index(
+        "idx_agent_messages_session_created_id",
+        "agent_messages",
+        ["session_id", "created_at", "id"],
+    )
+    op.drop_index("idx_agent_messages_session_created", table_name="agent_messages")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_agent_messages_session_created",
+        "agent_messages",
+        ["session_id", "created_at"],
+    )
+    op.drop_index("idx_agent_messages_session_created_id", table_name="agent_messages")
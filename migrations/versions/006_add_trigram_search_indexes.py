@@ -0,0 +1,38 @@
+"""Add pg_trgm GIN indexes for message content and session title search
+
+Revision ID: 006_add_trigram_search
+Revises: 005_message_keyset_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_add_trigram_search"
+down_revision: Union[str, None] = "005_message_keyset_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram indexes let ILIKE '%query%' use an index probe instead of a
+    # sequential scan, keeping substring search semantics unchanged
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_messages_content_trgm
+        ON agent_messages USING gin (content gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_sessions_title_trgm
+        ON agent_sessions USING gin (title gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_agent_sessions_title_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_agent_messages_content_trgm")
+
+    # Note: We don't drop the pg_trgm extension as it may be used elsewhere
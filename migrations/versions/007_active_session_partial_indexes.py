@@ -0,0 +1,36 @@
+"""Add partial indexes for listing active sessions newest first
+
+Revision ID: 007_active_session_indexes
+Revises: 006_add_trigram_search
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_active_session_indexes"
+down_revision: Union[str, None] = "006_add_trigram_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only active sessions are indexed, so these stay small and let the
+    # active-session listings read rows in order and stop at the LIMIT
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_sessions_active_user_created
+        ON agent_sessions (user_id, created_at DESC)
+        WHERE status = 'active'
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_sessions_active_created
+        ON agent_sessions (created_at DESC)
+        WHERE status = 'active'
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_agent_sessions_active_created")
+    op.execute("DROP INDEX IF EXISTS idx_agent_sessions_active_user_created")
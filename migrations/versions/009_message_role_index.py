@@ -0,0 +1,29 @@
+"""Index messages by session, role and time
+
+Revision ID: 009_message_role_index
+Revises: 007_active_session_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_message_role_index"
+down_revision: Union[str, None] = "007_active_session_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves every role-filtered read in order, including the latest user
+    # message id as an index-only scan
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_messages_session_role_created
+        ON agent_messages (session_id, role, created_at, id)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_agent_messages_session_role_created")
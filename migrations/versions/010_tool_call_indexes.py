@@ -0,0 +1,38 @@
+"""Add tool call indexes for session, pending and message lookups
+
+Revision ID: 010_tool_call_indexes
+Revises: 009_message_role_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010_tool_call_indexes"
+down_revision: Union[str, None] = "009_message_role_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_tool_calls_session_status_created
+        ON agent_tool_calls (session_id, status, created_at DESC)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_tool_calls_pending_created
+        ON agent_tool_calls (created_at)
+        WHERE status = 'pending'
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_tool_calls_message_created
+        ON agent_tool_calls (message_id, created_at)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_agent_tool_calls_message_created")
+    op.execute("DROP INDEX IF EXISTS idx_agent_tool_calls_pending_created")
+    op.execute("DROP INDEX IF EXISTS idx_agent_tool_calls_session_status_created")
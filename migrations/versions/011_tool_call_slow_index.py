@@ -0,0 +1,28 @@
+"""Add partial index for slow completed tool calls
+
+Revision ID: 011_tool_call_slow_index
+Revises: 010_tool_call_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011_tool_call_slow_index"
+down_revision: Union[str, None] = "010_tool_call_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_tool_calls_slow
+        ON agent_tool_calls (execution_time_ms DESC)
+        WHERE status = 'completed' AND execution_time_ms IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_agent_tool_calls_slow")
@@ -0,0 +1,146 @@
+"""Range-partition agent_tool_calls by month on created_at
+
+Revision ID: 012_partition_tool_calls
+Revises: 011_tool_call_slow_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_partition_tool_calls"
+down_revision: Union[str, None] = "011_tool_call_slow_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_indexes() -> None:
+    op.execute("CREATE INDEX ix_agent_tool_calls_session_id ON agent_tool_calls (session_id)")
+    op.execute("CREATE INDEX ix_agent_tool_calls_status ON agent_tool_calls (status)")
+    op.execute("""
+        CREATE INDEX idx_agent_tool_calls_session_status_created
+        ON agent_tool_calls (session_id, status, created_at DESC)
+    """)
+    op.execute("""
+        CREATE INDEX idx_agent_tool_calls_pending_created
+        ON agent_tool_calls (created_at)
+        WHERE status = 'pending'
+    """)
+    op.execute("""
+        CREATE INDEX idx_agent_tool_calls_message_created
+        ON agent_tool_calls (message_id, created_at)
+    """)
+    op.execute("""
+        CREATE INDEX idx_agent_tool_calls_slow
+        ON agent_tool_calls (execution_time_ms DESC)
+        WHERE status = 'completed' AND execution_time_ms IS NOT NULL
+    """)
+
+
+def upgrade() -> None:
+    # Partitioned tables can't be converted in place: rebuild and copy
+    op.execute("ALTER TABLE agent_tool_calls RENAME TO agent_tool_calls_unpartitioned")
+    op.execute("""
+        DO $$
+        DECLARE
+            idx record;
+        BEGIN
+            FOR idx IN
+                SELECT indexname FROM pg_indexes
+                WHERE tablename = 'agent_tool_calls_unpartitioned'
+                  AND indexname NOT LIKE '%_pkey'
+            LOOP
+                EXECUTE format('DROP INDEX %I', idx.indexname);
+            END LOOP;
+        END $$
+    """)
+    op.execute("ALTER TABLE agent_tool_calls_unpartitioned DROP CONSTRAINT agent_tool_calls_pkey")
+
+    op.execute("""
+        CREATE TABLE agent_tool_calls (
+            id UUID NOT NULL,
+            message_id UUID REFERENCES agent_messages (id) ON DELETE SET NULL,
+            session_id UUID NOT NULL REFERENCES agent_sessions (id) ON DELETE CASCADE,
+            tool_name VARCHAR(100) NOT NULL,
+            inputs JSONB NOT NULL,
+            outputs JSONB,
+            error_message TEXT,
+            status agenttoolcallstatus NOT NULL,
+            execution_time_ms INTEGER,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    # Monthly partitions (UTC bounds) from the oldest row up to two months
+    # ahead; the application keeps creating future ones periodically
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start timestamp;
+            last_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC') + interval '2 months';
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(created_at), now()) AT TIME ZONE 'UTC')
+            INTO month_start
+            FROM agent_tool_calls_unpartitioned;
+
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF agent_tool_calls FOR VALUES FROM (%L) TO (%L)',
+                    'agent_tool_calls_p' || to_char(month_start, 'YYYYMM'),
+                    month_start AT TIME ZONE 'UTC',
+                    (month_start + interval '1 month') AT TIME ZONE 'UTC'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$
+    """)
+    op.execute("CREATE TABLE agent_tool_calls_default PARTITION OF agent_tool_calls DEFAULT")
+
+    op.execute("""
+        INSERT INTO agent_tool_calls (
+            id, message_id, session_id, tool_name, inputs, outputs,
+            error_message, status, execution_time_ms, created_at, updated_at
+        )
+        SELECT
+            id, message_id, session_id, tool_name, inputs, outputs,
+            error_message, status, execution_time_ms, coalesce(created_at, now()), updated_at
+        FROM agent_tool_calls_unpartitioned
+    """)
+    op.execute("DROP TABLE agent_tool_calls_unpartitioned")
+
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE TABLE agent_tool_calls_unpartitioned (
+            id UUID NOT NULL,
+            message_id UUID REFERENCES agent_messages (id) ON DELETE SET NULL,
+            session_id UUID NOT NULL REFERENCES agent_sessions (id) ON DELETE CASCADE,
+            tool_name VARCHAR(100) NOT NULL,
+            inputs JSONB NOT NULL,
+            outputs JSONB,
+            error_message TEXT,
+            status agenttoolcallstatus NOT NULL,
+            execution_time_ms INTEGER,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+        )
+    """)
+    op.execute("""
+        INSERT INTO agent_tool_calls_unpartitioned
+        SELECT
+            id, message_id, session_id, tool_name, inputs, outputs,
+            error_message, status, execution_time_ms, created_at, updated_at
+        FROM agent_tool_calls
+    """)
+    # Dropping the parent drops every partition and its indexes
+    op.execute("DROP TABLE agent_tool_calls")
+    op.execute("ALTER TABLE agent_tool_calls_unpartitioned RENAME TO agent_tool_calls")
+    op.execute("ALTER TABLE agent_tool_calls ADD CONSTRAINT agent_tool_calls_pkey PRIMARY KEY (id)")
+
+    _create_indexes()
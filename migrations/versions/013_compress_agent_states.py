@@ -0,0 +1,35 @@
+"""Store checkpoint state as format-tagged compressed bytes
+
+Revision ID: 013_compress_agent_states
+Revises: 012_partition_tool_calls
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013_compress_agent_states"
+down_revision: Union[str, None] = "012_partition_tool_calls"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows keep their JSON, tagged as uncompressed (format 0)
+    op.execute("""
+        ALTER TABLE agent_states
+        ALTER COLUMN state TYPE BYTEA
+        USING '\\x00'::bytea || convert_to(state::text, 'UTF8')
+    """)
+
+
+def downgrade() -> None:
+    # Compressed checkpoints can't be decoded in SQL; they are dropped
+    op.execute("DELETE FROM agent_states WHERE get_byte(state, 0) <> 0")
+    op.execute("""
+        ALTER TABLE agent_states
+        ALTER COLUMN state TYPE JSONB
+        USING convert_from(substring(state FROM 2), 'UTF8')::jsonb
+    """)
@@ -0,0 +1,40 @@
+"""Index agent_states by thread and creation time
+
+Revision ID: 014_agent_states_thread_index
+Revises: 013_compress_agent_states
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014_agent_states_thread_index"
+down_revision: Union[str, None] = "013_compress_agent_states"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A thread keeps one row per checkpoint, so thread_id can't be unique
+    op.execute("ALTER TABLE agent_states DROP CONSTRAINT IF EXISTS agent_states_thread_id_key")
+    op.execute("DROP INDEX IF EXISTS ix_agent_states_thread_id")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_states_thread_created
+        ON agent_states (thread_id, created_at DESC)
+        INCLUDE (id)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_agent_states_thread_created")
+    # Keep only the latest checkpoint of each thread so thread_id is unique again
+    op.execute("""
+        DELETE FROM agent_states a
+        USING agent_states b
+        WHERE a.thread_id = b.thread_id
+          AND (a.created_at, a.id) < (b.created_at, b.id)
+    """)
+    op.execute("CREATE UNIQUE INDEX ix_agent_states_thread_id ON agent_states (thread_id)")
+    op.execute("ALTER TABLE agent_states ADD CONSTRAINT agent_states_thread_id_key UNIQUE (thread_id)")
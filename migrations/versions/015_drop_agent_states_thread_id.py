@@ -0,0 +1,41 @@
+"""Drop agent_states.thread_id in favour of session_id
+
+Revision ID: 015_drop_agent_states_thread_id
+Revises: 014_agent_states_thread_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015_drop_agent_states_thread_id"
+down_revision: Union[str, None] = "014_agent_states_thread_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # thread_id always held session_id as text
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_states_session_created
+        ON agent_states (session_id, created_at DESC)
+        INCLUDE (id)
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_agent_states_thread_created")
+    op.execute("DROP INDEX IF EXISTS ix_agent_states_session_id")
+    op.execute("ALTER TABLE agent_states DROP COLUMN thread_id")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE agent_states ADD COLUMN thread_id VARCHAR(255)")
+    op.execute("UPDATE agent_states SET thread_id = session_id::text")
+    op.execute("ALTER TABLE agent_states ALTER COLUMN thread_id SET NOT NULL")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_agent_states_session_id ON agent_states (session_id)")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_agent_states_thread_created
+        ON agent_states (thread_id, created_at DESC)
+        INCLUDE (id)
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_agent_states_session_created")
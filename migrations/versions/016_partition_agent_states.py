@@ -0,0 +1,78 @@
+"""Hash-partition agent_states by session_id
+
+Revision ID: 016_partition_agent_states
+Revises: 015_drop_agent_states_thread_id
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "016_partition_agent_states"
+down_revision: Union[str, None] = "015_drop_agent_states_thread_id"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS = 16
+
+
+def upgrade() -> None:
+    # Partitioned tables can't be converted in place: rebuild and copy
+    op.execute("ALTER TABLE agent_states RENAME TO agent_states_unpartitioned")
+    op.execute("DROP INDEX IF EXISTS idx_agent_states_session_created")
+    op.execute("ALTER TABLE agent_states_unpartitioned DROP CONSTRAINT agent_states_pkey")
+
+    op.execute("""
+        CREATE TABLE agent_states (
+            id UUID NOT NULL,
+            session_id UUID NOT NULL REFERENCES agent_sessions (id) ON DELETE CASCADE,
+            state BYTEA NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            PRIMARY KEY (id, session_id)
+        ) PARTITION BY HASH (session_id)
+    """)
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE agent_states_p{remainder} PARTITION OF agent_states "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+        )
+
+    op.execute("""
+        INSERT INTO agent_states (id, session_id, state, created_at)
+        SELECT id, session_id, state, created_at
+        FROM agent_states_unpartitioned
+    """)
+    op.execute("DROP TABLE agent_states_unpartitioned")
+
+    op.execute("""
+        CREATE INDEX idx_agent_states_session_created
+        ON agent_states (session_id, created_at DESC)
+        INCLUDE (id)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE TABLE agent_states_unpartitioned (
+            id UUID NOT NULL,
+            session_id UUID NOT NULL REFERENCES agent_sessions (id) ON DELETE CASCADE,
+            state BYTEA NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+        )
+    """)
+    op.execute("""
+        INSERT INTO agent_states_unpartitioned (id, session_id, state, created_at)
+        SELECT id, session_id, state, created_at
+        FROM agent_states
+    """)
+    # Dropping the parent drops every partition and its indexes
+    op.execute("DROP TABLE agent_states")
+    op.execute("ALTER TABLE agent_states_unpartitioned RENAME TO agent_states")
+    op.execute("ALTER TABLE agent_states ADD CONSTRAINT agent_states_pkey PRIMARY KEY (id)")
+    op.execute("""
+        CREATE INDEX idx_agent_states_session_created
+        ON agent_states (session_id, created_at DESC)
+        INCLUDE (id)
+    """)
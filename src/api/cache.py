@@ -0,0 +1,152 @@
+"""
+In-process response cache for read-heavy API endpoints.
+
+Entries are grouped by namespace (e.g. ``session:<id>``) so every cached
+response for a session can be invalidated at once when it changes.
+
+The cache lives in one process and is only invalidated by writes made
+in that process, so it is only coherent with a single worker
+(``WORKERS=1``); with more workers it is disabled.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+from src.config import settings
+
+
+class ResponseCache:
+    """
+    Bounded TTL cache keyed by (namespace, key).
+
+    Expired entries are dropped lazily on read; once ``max_entries`` is
+    exceeded the least recently used entry is evicted. A disabled cache
+    stores nothing and always misses.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.RESPONSE_CACHE_MAX_ENTRIES,
+        enabled: bool = True
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            enabled: Whether values are cached at all
+        """
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        # Namespace -> keys cached in it, so clearing one namespace doesn't
+        # scan the whole cache
+        self._namespaces: Dict[str, Set[Hashable]] = {}
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            namespace: Entry namespace
+            key: Entry key within the namespace
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._discard((namespace, key))
+            return None
+
+        self._entries.move_to_end((namespace, key))
+        return value
+
+    def set(self, namespace: str, key: Hashable, value: Any, expire: int) -> None:
+        """
+        Cache a value.
+
+        Args:
+            namespace: Entry namespace
+            key: Entry key within the namespace
+            value: Value to cache
+            expire: Time to live in seconds
+        """
+        if not self.enabled:
+            return
+        self._entries[(namespace, key)] = (time.monotonic() + expire, value)
+        self._entries.move_to_end((namespace, key))
+        self._namespaces.setdefault(namespace, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Drop cached values.
+
+        Args:
+            namespace: Namespace to clear, or None to clear everything
+        """
+        if namespace is None:
+            self._entries.clear()
+            self._namespaces.clear()
+            return
+
+        for key in self._namespaces.pop(namespace, ()):
+            del self._entries[(namespace, key)]
+
+    def _discard(self, entry_key: Tuple[str, Hashable]) -> None:
+        """Remove one entry and its namespace index record."""
+        del self._entries[entry_key]
+        namespace, key = entry_key
+        keys = self._namespaces[namespace]
+        keys.discard(key)
+        if not keys:
+            del self._namespaces[namespace]
+
+
+def session_namespace(session_id: str) -> str:
+    """
+    Build the cache namespace for a session.
+
+    Args:
+        session_id: Session UUID as string
+
+    Returns:
+        Namespace string
+    """
+    return f"session:{session_id}"
+
+
+def single_worker() -> bool:
+    """Whether the API is served by one worker process (see src.main)."""
+    return settings.DEBUG or (settings.WORKERS or os.cpu_count() or 1) == 1
+
+
+# Global cache instance
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get or create global response cache.
+
+    Returns:
+        ResponseCache instance
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(enabled=single_worker())
+    return _response_cache
+
+
+def reset_response_cache():
+    """Reset global response cache (for testing)."""
+    global _response_cache
+    _response_cache = None
@@ -4,13 +4,22 @@ from langchain_core.messages import HumanMessage, AIMessage
 from src.agent import agent_app
 from src.api.schemas import AgentRequest, AgentResponse
 from src.memory import get_conversation_memory
-from typing import Dict, Any, Optional
-import traceback
+from collections import deque
+from typing import Deque, Dict, Any, Optional
+from datetime import datetime, timezone
+import logging
 import json
 import asyncio
 
+import orjson
+
+logger = logging.getLogger("orbit.api.agent")
+
 router = APIRouter()
 
+# Maximum pending outgoing events per streaming connection
+STREAM_QUEUE_MAXSIZE = 256
+
 """
 WebSocket Streaming API
 ====================
@@ -56,41 +65,57 @@ Server sends:
 - "error": Error occurred
 """
 
+def _build_initial_state(message: str, session_id: str, user_id: str) -> Dict[str, Any]:
+    """
+    Build the initial agent state for a new user message.
+
+    Args:
+        message: User message content
+        session_id: Session identifier
+        user_id: User identifier
+
+    Returns:
+        Initial AgentState dictionary
+    """
+    return {
+        "messages": [HumanMessage(content=message)],
+        "intent": "unknown",
+        "command": "",
+        "plan": {},
+        "current_step": 0,
+        "tool_results": [],
+        "needs_confirmation": False,
+        "confirmation_prompt": None,
+        "is_complete": False,
+        "evaluation_outcome": None,
+        "session_id": session_id,
+        "user_id": user_id,
+        "iteration_count": 0,
+        # Email fields
+        "email_draft_id": None,
+        "email_to": None,
+        "email_subject": None,
+        "email_body": None,
+        "email_cc": None,
+        "email_attachments": None,
+        "email_needs_confirmation": False,
+        "email_confirmation_prompt": None,
+        "email_refinement_iteration": 0,
+        "email_sent_message_id": None,
+        "needs_content_generation": False,
+        "content_source": None,
+    }
+
+
 @router.post("/invoke", response_model=AgentResponse)
 async def invoke_agent(request: AgentRequest):
     """
     Invoke the Orbit Agent with a user message.
     """
     try:
-        # Initialize state
-        initial_state = {
-            "messages": [HumanMessage(content=request.message)],
-            "intent": "unknown",
-            "command": "",
-            "plan": {},
-            "current_step": 0,
-            "tool_results": [],
-            "needs_confirmation": False,
-            "confirmation_prompt": None,
-            "is_complete": False,
-            "evaluation_outcome": None,
-            "session_id": request.session_id,
-            "user_id": request.user_id,
-            "iteration_count": 0,
-            # Email fields
-            "email_draft_id": None,
-            "email_to": None,
-            "email_subject": None,
-            "email_body": None,
-            "email_cc": None,
-            "email_attachments": None,
-            "email_needs_confirmation": False,
-            "email_confirmation_prompt": None,
-            "email_refinement_iteration": 0,
-            "email_sent_message_id": None,
-            "needs_content_generation": False,
-            "content_source": None,
-        }
+        initial_state = _build_initial_state(
+            request.message, request.session_id, request.user_id
+        )
         
         # Config for checkpointer (required when using memory)
         config = {
@@ -139,7 +164,7 @@ async def invoke_agent(request: AgentRequest):
         )
         
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("Agent execution failed")
         raise HTTPException(status_code=500, detail=f"Agent execution failed: {str(e)}")
 
 
@@ -151,6 +176,7 @@ async def stream_agent(websocket: WebSocket):
     Real-time streaming of agent execution, tool calls, and responses.
     """
     await websocket.accept()
+    sender = None
 
     try:
         # Receive initial message
@@ -167,35 +193,7 @@ async def stream_agent(websocket: WebSocket):
             await websocket.close()
             return
 
-        # Initialize state
-        initial_state = {
-            "messages": [HumanMessage(content=message)],
-            "intent": "unknown",
-            "command": "",
-            "plan": {},
-            "current_step": 0,
-            "tool_results": [],
-            "needs_confirmation": False,
-            "confirmation_prompt": None,
-            "is_complete": False,
-            "evaluation_outcome": None,
-            "session_id": session_id,
-            "user_id": user_id,
-            "iteration_count": 0,
-            # Email fields
-            "email_draft_id": None,
-            "email_to": None,
-            "email_subject": None,
-            "email_body": None,
-            "email_cc": None,
-            "email_attachments": None,
-            "email_needs_confirmation": False,
-            "email_confirmation_prompt": None,
-            "email_refinement_iteration": 0,
-            "email_sent_message_id": None,
-            "needs_content_generation": False,
-            "content_source": None,
-        }
+        initial_state = _build_initial_state(message, session_id, user_id)
 
         # Send start message
         await websocket.send_json({
@@ -204,11 +202,17 @@ async def stream_agent(websocket: WebSocket):
             "timestamp": _get_timestamp()
         })
 
+        # Decouple agent progress from socket throughput: the graph only
+        # enqueues events, a separate task drains them to the client
+        event_queue = _StreamEventQueue(maxsize=STREAM_QUEUE_MAXSIZE)
+        sender = asyncio.create_task(_drain_events(websocket, event_queue))
+
         # Track previous state to detect changes
         previous_intent = None
         previous_plan = None
         previous_step = 0
         previous_evaluation = None
+        total_steps = 0
 
         # Config for checkpointer (required when using memory)
         config = {
@@ -219,10 +223,14 @@ async def stream_agent(websocket: WebSocket):
 
         # Stream execution with updates
         async for event in agent_app.astream(initial_state, config=config):
+            # Stop running the graph once the client is gone
+            if event_queue.closed:
+                raise WebSocketDisconnect(code=1006)
+
             # Check for intent changes
             current_intent = event.get("intent")
             if current_intent != previous_intent:
-                await websocket.send_json({
+                await event_queue.put_event({
                     "type": "intent",
                     "intent": current_intent,
                     "timestamp": _get_timestamp()
@@ -230,32 +238,35 @@ async def stream_agent(websocket: WebSocket):
                 previous_intent = current_intent
 
             # Check for plan creation
-            current_plan = event.get("plan", {})
+            current_plan = event.get("plan")
             if current_plan and current_plan != previous_plan:
-                await websocket.send_json({
+                await event_queue.put_event({
                     "type": "plan",
                     "plan": current_plan,
                     "timestamp": _get_timestamp()
                 })
                 previous_plan = current_plan
+                # Count steps once per plan rather than on every step event
+                steps = current_plan.get("steps")
+                total_steps = len(steps) if steps else 0
 
             # Check for step execution
             current_step = event.get("current_step", 0)
             if current_step != previous_step:
-                await websocket.send_json({
+                await event_queue.put_event({
                     "type": "step",
                     "step": current_step,
-                    "total_steps": len(current_plan.get("steps", [])),
+                    "total_steps": total_steps,
                     "timestamp": _get_timestamp()
                 })
                 previous_step = current_step
 
             # Check for tool results
-            tool_results = event.get("tool_results", [])
+            tool_results = event.get("tool_results")
             if tool_results:
-                latest_result = tool_results[-1] if tool_results else None
+                latest_result = tool_results[-1]
                 if latest_result:
-                    await websocket.send_json({
+                    await event_queue.put_event({
                         "type": "tool_result",
                         "result": latest_result,
                         "timestamp": _get_timestamp()
@@ -264,7 +275,7 @@ async def stream_agent(websocket: WebSocket):
             # Check for evaluation
             current_evaluation = event.get("evaluation_outcome")
             if current_evaluation and current_evaluation != previous_evaluation:
-                await websocket.send_json({
+                await event_queue.put_event({
                     "type": "evaluation",
                     "outcome": current_evaluation,
                     "reasoning": event.get("evaluation_reasoning"),
@@ -273,7 +284,7 @@ async def stream_agent(websocket: WebSocket):
                 previous_evaluation = current_evaluation
 
             # Check for new messages (assistant responses)
-            messages = event.get("messages", [])
+            messages = event.get("messages")
             if messages:
                 last_message = messages[-1]
                 if isinstance(last_message, AIMessage):
@@ -281,11 +292,18 @@ async def stream_agent(websocket: WebSocket):
                     content = last_message.content
                     if content:
                         # Send in chunks for streaming effect
-                        await _stream_message(websocket, content)
+                        await _stream_message(event_queue, content)
+
+        # Flush pending events before persisting and completing
+        await event_queue.join()
+        if event_queue.closed:
+            raise WebSocketDisconnect(code=1006)
 
         # Save conversation to memory
         try:
-            memory = await get_conversation_memory()
+            memory = getattr(websocket.app.state, "memory", None)
+            if memory is None:
+                memory = get_conversation_memory()
             await memory.add_message(
                 session_id=session_id,
                 role="user",
@@ -315,13 +333,15 @@ async def stream_agent(websocket: WebSocket):
     except WebSocketDisconnect:
         print(f"WebSocket disconnected: session_id={session_id}")
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("Agent stream failed")
         await websocket.send_json({
             "type": "error",
             "error": str(e),
             "timestamp": _get_timestamp()
         })
     finally:
+        if sender is not None:
+            sender.cancel()
         try:
             await websocket.close()
         except:
@@ -353,35 +373,7 @@ async def stream_agent_with_checkpoint(websocket: WebSocket):
             await websocket.close()
             return
 
-        # Initialize state
-        initial_state = {
-            "messages": [HumanMessage(content=message)],
-            "intent": "unknown",
-            "command": "",
-            "plan": {},
-            "current_step": 0,
-            "tool_results": [],
-            "needs_confirmation": False,
-            "confirmation_prompt": None,
-            "is_complete": False,
-            "evaluation_outcome": None,
-            "session_id": session_id,
-            "user_id": user_id,
-            "iteration_count": 0,
-            # Email fields
-            "email_draft_id": None,
-            "email_to": None,
-            "email_subject": None,
-            "email_body": None,
-            "email_cc": None,
-            "email_attachments": None,
-            "email_needs_confirmation": False,
-            "email_confirmation_prompt": None,
-            "email_refinement_iteration": 0,
-            "email_sent_message_id": None,
-            "needs_content_generation": False,
-            "content_source": None,
-        }
+        initial_state = _build_initial_state(message, session_id, user_id)
 
         # Config for checkpointer
         config = {
@@ -424,7 +416,7 @@ async def stream_agent_with_checkpoint(websocket: WebSocket):
     except WebSocketDisconnect:
         print(f"WebSocket disconnected (checkpoint): session_id={session_id}")
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("Agent stream failed")
         await websocket.send_json({
             "type": "error",
             "error": str(e),
@@ -437,27 +429,148 @@ async def stream_agent_with_checkpoint(websocket: WebSocket):
             pass
 
 
-async def _stream_message(websocket: WebSocket, content: str, chunk_size: int = 50):
+async def _stream_message(queue: "_StreamEventQueue", content: str, chunk_size: int = 50):
     """
     Stream message content in chunks.
 
     Args:
-        websocket: WebSocket connection
+        queue: Outgoing event queue for the connection
         content: Message content to stream
         chunk_size: Size of each chunk
     """
     for i in range(0, len(content), chunk_size):
         chunk = content[i:i + chunk_size]
-        await websocket.send_json({
+        await queue.put_event({
             "type": "chunk",
             "content": chunk,
             "timestamp": _get_timestamp()
         })
-        # Small delay for streaming effect
-        await asyncio.sleep(0.01)
+
+
+class _StreamEventQueue:
+    """
+    Bounded queue of outgoing WebSocket events.
+
+    When full, the oldest pending non-chunk event (intent, step, tool
+    result, ...) is discarded so a slow client never stalls the agent.
+    Message chunks are never dropped; if only chunks are pending the
+    producer waits for the sender to make room.
+
+    Once the sender finds the client gone it closes the queue: pending
+    events are discarded, join() returns and put_event() raises
+    WebSocketDisconnect so the producer stops running the graph.
+    """
+
+    def __init__(self, maxsize: int = STREAM_QUEUE_MAXSIZE):
+        self.maxsize = maxsize
+        self.closed = False
+        self._events: Deque[Dict[str, Any]] = deque()
+        # Events enqueued but not yet marked done by the sender
+        self._unfinished = 0
+        self._changed = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    async def put_event(self, event: Dict[str, Any]) -> None:
+        """
+        Enqueue an event, evicting the oldest droppable one if full.
+
+        Raises:
+            WebSocketDisconnect: If the client has gone away
+        """
+        async with self._changed:
+            if len(self._events) >= self.maxsize:
+                for pending in self._events:
+                    if pending.get("type") != "chunk":
+                        self._events.remove(pending)
+                        self._unfinished -= 1
+                        break
+            await self._changed.wait_for(
+                lambda: self.closed or len(self._events) < self.maxsize
+            )
+            if self.closed:
+                raise WebSocketDisconnect(code=1006)
+            self._events.append(event)
+            self._unfinished += 1
+            self._changed.notify_all()
+
+    async def get(self) -> Dict[str, Any]:
+        """Wait for and remove the oldest pending event."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._events)
+            return self._events.popleft()
+
+    async def task_done(self) -> None:
+        """Mark an event taken with get() as sent."""
+        async with self._changed:
+            self._unfinished -= 1
+            self._changed.notify_all()
+
+    async def join(self) -> None:
+        """Wait until every enqueued event is sent or the queue is closed."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.closed or not self._unfinished)
+
+    async def close(self) -> None:
+        """Discard pending events and refuse new ones."""
+        async with self._changed:
+            self.closed = True
+            self._events.clear()
+            self._unfinished = 0
+            self._changed.notify_all()
+
+
+def _encode_event_value(value: Any) -> Any:
+    """orjson default hook for event values it can't serialize natively."""
+    if hasattr(value, "model_dump"):  # Pydantic models, LangChain messages
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _encode_event(event: Dict[str, Any]) -> str:
+    """
+    Encode an event as a text frame.
+
+    An event that can't be encoded is replaced by an error event, so one
+    bad value doesn't end the stream.
+    """
+    try:
+        # orjson encodes in C; decode keeps these as text frames
+        return orjson.dumps(
+            event, default=_encode_event_value, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except TypeError as e:
+        logger.error(f"Failed to encode {event.get('type')!r} stream event: {e}")
+        return orjson.dumps({
+            "type": "error",
+            "error": f"Failed to encode {event.get('type')} event",
+            "timestamp": _get_timestamp()
+        }).decode()
+
+
+async def _drain_events(websocket: WebSocket, queue: _StreamEventQueue):
+    """
+    Send queued events to the client until cancelled or disconnected.
+
+    When a send fails because the client is gone the queue is closed,
+    which stops the producer and unblocks its queue.join().
+
+    Args:
+        websocket: WebSocket connection
+        queue: Outgoing event queue for the connection
+    """
+    while True:
+        event = await queue.get()
+        try:
+            await websocket.send_text(_encode_event(event))
+        except (WebSocketDisconnect, RuntimeError):
+            logger.warning("Stream client stopped receiving events")
+            await queue.close()
+            return
+        await queue.task_done()
 
 
 def _get_timestamp() -> str:
     """Get current ISO timestamp."""
-    from datetime import datetime, timezone
     return datetime.now(timezone.utc).isoformat()
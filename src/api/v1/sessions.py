@@ -4,24 +4,54 @@ Sessions API endpoints.
 Provides CRUD operations for agent sessions.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from typing import List, Optional
 from datetime import datetime, timezone, timedelta
 from uuid import UUID
 from pydantic import BaseModel, ConfigDict
+import orjson
 
-from sqlalchemy import select
+from sqlalchemy import select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import Session, SessionStatus, Message, MessageRole
 from src.db.repositories import SessionRepository, MessageRepository
-from src.memory import get_conversation_memory
-from src.db.engine import get_session
+from src.memory import ConversationMemory, get_conversation_memory
+from src.db.engine import get_db
+from src.api.cache import get_response_cache, session_namespace
 from src.config import settings
 
 router = APIRouter()
 
 
+async def get_memory(request: Request) -> ConversationMemory:
+    """
+    Resolve the conversation memory cached on app state at startup.
+
+    Falls back to the global getter when the lifespan hook has not run
+    (e.g. a TestClient used without a context manager).
+    """
+    memory = getattr(request.app.state, "memory", None)
+    if memory is None:
+        memory = get_conversation_memory()
+    return memory
+
+
+def _session_payload(session: Session, message_count: Optional[int] = None) -> dict:
+    """Build a SessionResponse-shaped dict for direct JSON encoding."""
+    return {
+        "id": str(session.id),
+        "user_id": session.user_id,
+        "title": session.title,
+        "status": session.status.value,
+        "meta": session.meta,
+        "created_at": session.created_at.isoformat(),
+        "updated_at": session.updated_at.isoformat(),
+        "message_count": message_count,
+    }
+
+
 # ============================================================================
 # Request/Response Schemas
 # ============================================================================
@@ -38,7 +68,7 @@ class SessionCreateRequest(BaseModel):
 class SessionUpdateRequest(BaseModel):
     """Request schema for updating a session."""
     title: Optional[str] = None
-    status: Optional[str] = None
+    status: Optional[SessionStatus] = None
 
     model_config = ConfigDict(extra="allow")
 
@@ -71,9 +101,9 @@ class MessageResponse(BaseModel):
 
 class MessageCreateRequest(BaseModel):
     """Request schema for creating a message."""
-    role: str
+    role: MessageRole
     content: str
-    meta: dict = {}
+    meta: Optional[dict] = None
 
     model_config = ConfigDict(extra="allow")
 
@@ -83,7 +113,10 @@ class MessageCreateRequest(BaseModel):
 # ============================================================================
 
 @router.post("", response_model=SessionResponse)
-async def create_session(request: SessionCreateRequest):
+async def create_session(
+    request: SessionCreateRequest,
+    memory: ConversationMemory = Depends(get_memory)
+):
     """
     Create a new session.
 
@@ -94,7 +127,6 @@ async def create_session(request: SessionCreateRequest):
         Created session
     """
     try:
-        memory = await get_conversation_memory()
         session = await memory.create_session(
             user_id=request.user_id,
             title=request.title,
@@ -119,7 +151,11 @@ async def create_session(request: SessionCreateRequest):
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
-async def get_session(session_id: str):
+async def get_session(
+    session_id: str,
+    memory: ConversationMemory = Depends(get_memory),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Get a session by ID.
 
@@ -130,7 +166,6 @@ async def get_session(session_id: str):
         Session details
     """
     try:
-        memory = await get_conversation_memory()
         session = await memory.get_session(session_id)
 
         if not session:
@@ -139,12 +174,8 @@ async def get_session(session_id: str):
                 detail=f"Session not found: {session_id}"
             )
 
-        # Get message count
-        session_db = await memory._get_db_session()
-        stmt = select(Message).where(Message.session_id == session.id)
-        result = await session_db.execute(stmt)
-        messages = result.scalars().all()
-        message_count = len(messages)
+        # Count messages in SQL instead of loading them
+        message_count = await MessageRepository(db).count_by_session_id(session.id)
 
         return SessionResponse(
             id=str(session.id),
@@ -165,17 +196,22 @@ async def get_session(session_id: str):
         )
 
 
-@router.get("", response_model=List[SessionResponse])
+@router.get("", response_class=StreamingResponse)
 async def list_sessions(
     user_id: str = Query(..., description="User ID to filter sessions"),
-    status_filter: Optional[str] = Query(None, description="Filter by status"),
+    status_filter: Optional[SessionStatus] = Query(None, description="Filter by status"),
     limit: int = Query(10, ge=1, le=100, description="Maximum sessions to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
-    days: Optional[int] = Query(None, ge=1, le=365, description="Limit to sessions from last N days")
+    days: Optional[int] = Query(None, ge=1, le=365, description="Limit to sessions from last N days"),
+    memory: ConversationMemory = Depends(get_memory),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     List sessions for a user.
 
+    Sessions are streamed as NDJSON (one SessionResponse object per line)
+    so the client receives the first row before the whole page is read.
+
     Args:
         user_id: User identifier
         status_filter: Optional status filter (active, archived, deleted)
@@ -184,22 +220,23 @@ async def list_sessions(
         days: Only return sessions from last N days
 
     Returns:
-        List of sessions
+        NDJSON stream of sessions
     """
     try:
-        memory = await get_conversation_memory()
-        session_db = await memory._get_db_session()
+        # Count messages per session in the same query
+        message_count = (
+            select(func.count(Message.id))
+            .where(Message.session_id == Session.id)
+            .correlate(Session)
+            .scalar_subquery()
+        )
 
         # Build base query
-        stmt = select(Session).where(Session.user_id == user_id)
+        stmt = select(Session, message_count).where(Session.user_id == user_id)
 
         # Apply status filter
         if status_filter:
-            try:
-                status = SessionStatus(status_filter)
-                stmt = stmt.where(Session.status == status)
-            except ValueError:
-                pass  # Invalid status, ignore
+            stmt = stmt.where(Session.status == status_filter)
 
         # Apply date filter
         if days:
@@ -211,40 +248,28 @@ async def list_sessions(
         stmt = stmt.limit(limit)
         stmt = stmt.offset(offset)
 
-        result = await session_db.execute(stmt)
-        sessions = result.scalars().all()
-
-        # Get message counts for each session
-        responses = []
-        for session in sessions:
-            msg_stmt = select(Message).where(Message.session_id == session.id)
-            msg_result = await session_db.execute(msg_stmt)
-            messages = msg_result.scalars().all()
-
-            responses.append(SessionResponse(
-                id=str(session.id),
-                user_id=session.user_id,
-                title=session.title,
-                status=session.status.value,
-                meta=session.meta,
-                created_at=session.created_at.isoformat(),
-                updated_at=session.updated_at.isoformat(),
-                message_count=len(messages)
-            ))
-
-        return responses
+        # Execute eagerly so query errors still surface as a 500
+        result = await db.stream(stmt)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to list sessions: {str(e)}"
         )
 
+    async def _generate():
+        async for session, count in result:
+            yield orjson.dumps(_session_payload(session, count)) + b"\n"
+
+    return StreamingResponse(_generate(), media_type="application/x-ndjson")
+
 
 @router.get("/recent", response_model=List[SessionResponse])
 async def get_recent_sessions(
     user_id: str = Query(..., description="User ID"),
     limit: int = Query(10, ge=1, le=50, description="Maximum sessions to return"),
-    days: int = Query(7, ge=1, le=90, description="Days to look back")
+    days: int = Query(7, ge=1, le=90, description="Days to look back"),
+    memory: ConversationMemory = Depends(get_memory),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get recent sessions for a user.
@@ -258,13 +283,17 @@ async def get_recent_sessions(
         List of recent sessions
     """
     try:
-        memory = await get_conversation_memory()
         sessions = await memory.get_recent_sessions(
             user_id=user_id,
             limit=limit,
             days=days
         )
 
+        # Count messages for all sessions in one grouped query
+        message_counts = await MessageRepository(db).count_per_session(
+            [session.id for session in sessions]
+        )
+
         responses = []
         for session in sessions:
             responses.append(SessionResponse(
@@ -274,7 +303,8 @@ async def get_recent_sessions(
                 status=session.status.value,
                 meta=session.meta,
                 created_at=session.created_at.isoformat(),
-                updated_at=session.updated_at.isoformat()
+                updated_at=session.updated_at.isoformat(),
+                message_count=message_counts[session.id]
             ))
 
         return responses
@@ -286,7 +316,12 @@ async def get_recent_sessions(
 
 
 @router.patch("/{session_id}", response_model=SessionResponse)
-async def update_session(session_id: str, request: SessionUpdateRequest):
+async def update_session(
+    session_id: str,
+    request: SessionUpdateRequest,
+    memory: ConversationMemory = Depends(get_memory),
+    db: AsyncSession = Depends(get_db, scope="function")
+):
     """
     Update a session.
 
@@ -298,8 +333,6 @@ async def update_session(session_id: str, request: SessionUpdateRequest):
         Updated session
     """
     try:
-        memory = await get_conversation_memory()
-
         # Update title if provided
         if request.title:
             session = await memory.update_session_title(
@@ -316,22 +349,13 @@ async def update_session(session_id: str, request: SessionUpdateRequest):
 
         # Update status if provided
         if request.status:
-            session_db = await memory._get_db_session()
-            try:
-                status = SessionStatus(request.status)
-                stmt = (
-                    update(Session)
-                    .where(Session.id == session.id)
-                    .values(status=status)
-                )
-                await session_db.execute(stmt)
-                await session_db.commit()
-                session.status = status
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid status: {request.status}"
-                )
+            stmt = (
+                update(Session)
+                .where(Session.id == session.id)
+                .values(status=request.status)
+            )
+            await db.execute(stmt)
+            session.status = request.status
 
         return SessionResponse(
             id=str(session.id),
@@ -352,7 +376,10 @@ async def update_session(session_id: str, request: SessionUpdateRequest):
 
 
 @router.post("/{session_id}/archive", response_model=SessionResponse)
-async def archive_session(session_id: str):
+async def archive_session(
+    session_id: str,
+    memory: ConversationMemory = Depends(get_memory)
+):
     """
     Archive a session.
 
@@ -363,7 +390,6 @@ async def archive_session(session_id: str):
         Archived session
     """
     try:
-        memory = await get_conversation_memory()
         session = await memory.archive_session(session_id)
 
         return SessionResponse(
@@ -385,7 +411,8 @@ async def archive_session(session_id: str):
 @router.delete("/{session_id}")
 async def delete_session(
     session_id: str,
-    soft_delete: bool = Query(True, description="Perform soft delete")
+    soft_delete: bool = Query(True, description="Perform soft delete"),
+    memory: ConversationMemory = Depends(get_memory)
 ):
     """
     Delete a session.
@@ -398,7 +425,6 @@ async def delete_session(
         Success message
     """
     try:
-        memory = await get_conversation_memory()
         await memory.delete_session(session_id, soft_delete=soft_delete)
 
         return {
@@ -417,92 +443,92 @@ async def delete_session(
 # Messages Endpoints
 # ============================================================================
 
-@router.get("/{session_id}/messages", response_model=List[MessageResponse])
+@router.get("/{session_id}/messages", response_class=StreamingResponse)
 async def get_session_messages(
     session_id: str,
     limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum messages to return"),
-    role_filter: Optional[str] = Query(None, description="Filter by message role")
+    role_filter: Optional[MessageRole] = Query(None, description="Filter by message role"),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get messages for a session.
 
+    Messages are streamed as NDJSON (one MessageResponse object per line)
+    straight from the database cursor, so the first row ships before the
+    rest are read and the full list is never held in memory.
+
     Args:
         session_id: Session UUID
         limit: Maximum messages to return
         role_filter: Filter by role (user, assistant, system, tool)
 
     Returns:
-        List of messages
+        NDJSON stream of messages
     """
-    try:
-        memory = await get_conversation_memory()
+    cache = get_response_cache()
+    cache_key = ("messages", limit, role_filter)
+    cached = cache.get(session_namespace(session_id), cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/x-ndjson")
 
-        # Get messages
-        messages = await memory.get_conversation_history(
+    try:
+        # Execute eagerly so query errors still surface as a 500
+        rows = await MessageRepository(db).stream_conversation_rows(
             session_id=session_id,
-            limit=limit
+            limit=limit,
+            role=role_filter
         )
-
-        # Apply role filter if specified
-        if role_filter:
-            try:
-                role = MessageRole(role_filter)
-                messages = [m for m in messages if m.role == role]
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid role: {role_filter}"
-                )
-
-        # Convert to response format
-        responses = []
-        for msg in messages:
-            responses.append(MessageResponse(
-                id=str(msg.id),
-                session_id=str(msg.session_id),
-                role=msg.role.value,
-                content=msg.content,
-                meta=msg.meta,
-                created_at=msg.created_at.isoformat()
-            ))
-
-        return responses
-    except HTTPException:
-        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get messages: {str(e)}"
         )
 
+    async def _generate():
+        # Keep the encoded body for the cache unless it grows too large
+        body: Optional[List[bytes]] = []
+        size = 0
+        async for row in rows:
+            line = orjson.dumps(dict(row)) + b"\n"
+            if body is not None:
+                size += len(line)
+                if size <= settings.RESPONSE_CACHE_MAX_BODY_BYTES:
+                    body.append(line)
+                else:
+                    body = None
+            yield line
+
+        if body is not None:
+            cache.set(
+                session_namespace(session_id),
+                cache_key,
+                b"".join(body),
+                expire=settings.SESSION_MESSAGES_CACHE_TTL
+            )
+
+    return StreamingResponse(_generate(), media_type="application/x-ndjson")
+
 
 @router.post("/{session_id}/messages", response_model=MessageResponse)
-async def add_message(session_id: str, request: MessageCreateRequest):
+async def add_message(
+    session_id: str,
+    request: MessageCreateRequest,
+    memory: ConversationMemory = Depends(get_memory)
+):
     """
     Add a message to a session.
 
     Args:
         session_id: Session UUID
-        request: Message creation data
+        request: Message creation data (role is validated by the schema)
 
     Returns:
         Created message
     """
     try:
-        memory = await get_conversation_memory()
-
-        # Validate role
-        try:
-            msg_role = MessageRole(request.role)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid role: {request.role}"
-            )
-
         message = await memory.add_message(
             session_id=session_id,
-            role=msg_role,
+            role=request.role,
             content=request.content,
             meta=request.meta
         )
@@ -527,7 +553,8 @@ async def add_message(session_id: str, request: MessageCreateRequest):
 @router.get("/{session_id}/summary")
 async def get_session_summary(
     session_id: str,
-    max_messages: int = Query(20, ge=5, le=100, description="Maximum messages to summarize")
+    max_messages: int = Query(20, ge=5, le=100, description="Maximum messages to summarize"),
+    memory: ConversationMemory = Depends(get_memory)
 ):
     """
     Get a conversation summary for a session.
@@ -539,8 +566,13 @@ async def get_session_summary(
     Returns:
         Conversation summary
     """
+    cache = get_response_cache()
+    cache_key = ("summary", max_messages)
+    cached = cache.get(session_namespace(session_id), cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        memory = await get_conversation_memory()
         summary = await memory.summarize_conversation(
             session_id=session_id,
             max_messages=max_messages
@@ -553,10 +585,17 @@ async def get_session_summary(
                 "message": "Unable to generate summary (insufficient messages or error)"
             }
 
-        return {
+        response = {
             "session_id": session_id,
             "summary": summary
         }
+        cache.set(
+            session_namespace(session_id),
+            cache_key,
+            response,
+            expire=settings.SESSION_SUMMARY_CACHE_TTL
+        )
+        return response
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -567,22 +606,23 @@ async def get_session_summary(
 @router.post("/{session_id}/compress")
 async def compress_session(
     session_id: str,
-    max_messages: int = Query(20, ge=5, le=100, description="Messages to keep uncompressed")
+    max_messages: int = Query(20, ge=5, le=100, description="Messages to keep uncompressed"),
+    memory: ConversationMemory = Depends(get_memory)
 ):
     """
     Compress session by summarizing old messages.
 
-    Replaces old messages with a summary, keeping recent messages intact.
+    Summarizes older messages in rolling chunks, keeping recent messages
+    intact. Stored messages are not deleted.
 
     Args:
         session_id: Session UUID
         max_messages: Maximum messages to keep uncompressed
 
     Returns:
-        Result with new message count
+        Result with the compressed context message count
     """
     try:
-        memory = await get_conversation_memory()
         messages = await memory.summarize_and_compress(
             session_id=session_id,
             max_messages=max_messages
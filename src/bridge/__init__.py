@@ -11,6 +11,20 @@ but from different contexts:
 """
 
 from .schemas import BridgeCommandRequest, BridgeCommandResponse
-from .orchestrator_client import OrchestratorClient
+from .orchestrator_client import (
+    OrchestratorClient,
+    BridgeBatchBuilder,
+    get_orchestrator_client,
+    close_orchestrator_client,
+    reset_orchestrator_client,
+)
 
-__all__ = ['OrchestratorClient', 'BridgeCommandRequest', 'BridgeCommandResponse']
+__all__ = [
+    'OrchestratorClient',
+    'BridgeBatchBuilder',
+    'get_orchestrator_client',
+    'close_orchestrator_client',
+    'reset_orchestrator_client',
+    'BridgeCommandRequest',
+    'BridgeCommandResponse',
+]
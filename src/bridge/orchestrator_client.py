@@ -1,12 +1,38 @@
+import asyncio
 import httpx
 import logging
-from typing import Dict, Any, Optional, List
+import orjson
+import os
+import shlex
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple
 
 from src.config import settings
 from src.bridge.schemas import BridgeCommandRequest, BridgeCommandResponse
 
 logger = logging.getLogger("orbit.bridge")
 
+# Connection pool shared by all Bridge requests
+BRIDGE_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+
+# Commands that can't change the filesystem, as long as their arguments
+# carry no shell operators; anything else clears the listing cache. Not
+# listed on purpose: env (runs another command), find (-delete, -exec),
+# tree (-o writes a file) and file (-C writes a magic file)
+_READ_ONLY_COMMANDS = frozenset({
+    "cat", "date", "df", "du", "echo", "grep", "head",
+    "ls", "pwd", "stat", "tail", "uname", "wc", "which", "whoami",
+})
+_SHELL_OPERATOR_CHARS = frozenset(";&|><`$")
+
+# Request bodies are serialized with orjson and sent as raw content
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class OrchestratorClient:
     """
@@ -37,14 +63,33 @@ class OrchestratorClient:
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
+        # Whether the Bridge exposes /api/v1/files and /api/v1/commands/batch
+        # (None until first probed)
+        self._files_api: Optional[bool] = None
+        self._batch_api: Optional[bool] = None
+        # Read-only commands waiting to be coalesced into one batch request
+        self._pending: List[Tuple[BridgeCommandRequest, asyncio.Future]] = []
+        self._pending_timer: Optional[asyncio.TimerHandle] = None
+        # Running coalesced sends; the loop only keeps weak references
+        self._flush_tasks: Set[asyncio.Task] = set()
+        # Normalized path -> (expires_at, listing), LRU ordered
+        self._listing_cache: "OrderedDict[str, Tuple[float, BridgeCommandResponse]]" = OrderedDict()
+        # Bumped by every invalidation; a listing fetched across a bump
+        # may predate the change and is not cached
+        self._listing_generation = 0
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=30.0,
+            http2=settings.BRIDGE_HTTP2,
+            limits=BRIDGE_POOL_LIMITS,
             headers={"Authorization": f"Bearer {api_key}"} if api_key else {},
         )
 
     async def close(self):
-        """Close the underlying HTTP client."""
+        """Send any coalesced commands still waiting, then close the HTTP client."""
+        self._dispatch_pending()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
         await self.client.aclose()
 
     async def execute_command(
@@ -63,15 +108,28 @@ class OrchestratorClient:
             args = []
 
         payload = BridgeCommandRequest(command=cmd, args=args, cwd=cwd, trusted=trusted)
+        if _is_read_only(payload):
+            return await self._execute(payload)
+
+        # The command may touch any directory (relative to any cwd), so
+        # drop every cached listing once it has run
+        try:
+            return await self._execute(payload)
+        finally:
+            self.clear_listings()
 
+    async def _execute(self, payload: BridgeCommandRequest) -> BridgeCommandResponse:
+        """Send a single command request to the Bridge."""
         try:
-            logger.info(f"Executing command via bridge: {cmd} {args}")
+            logger.info(f"Executing command via bridge: {payload.command} {payload.args}")
             response = await self.client.post(
-                "/api/v1/commands/execute", json=payload.model_dump()
+                "/api/v1/commands/execute",
+                content=orjson.dumps(payload.model_dump()),
+                headers=JSON_HEADERS,
             )
 
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return BridgeCommandResponse(**data)
 
@@ -84,13 +142,306 @@ class OrchestratorClient:
             logger.error(f"Bridge Request Error: {e}")
             raise Exception(f"Failed to connect to Bridge: {e}") from e
 
+    async def execute_batch(
+        self, commands: List[BridgeCommandRequest]
+    ) -> List[BridgeCommandResponse]:
+        """
+        Execute several commands in one Bridge request.
+
+        Saves a round-trip per command for sequences like list_files
+        followed by several read_file calls. Commands run in order. If the
+        Bridge has no batch endpoint (404/405), that is remembered and the
+        commands are sent one by one.
+
+        Args:
+            commands: Commands to execute, in order
+
+        Returns:
+            One response per command, in the same order
+        """
+        if not commands:
+            return []
+
+        if all(_is_read_only(command) for command in commands):
+            return await self._execute_batch(commands)
+        try:
+            return await self._execute_batch(commands)
+        finally:
+            self.clear_listings()
+
+    async def _execute_batch(
+        self, commands: List[BridgeCommandRequest]
+    ) -> List[BridgeCommandResponse]:
+        """Send a batch request, falling back to one request per command."""
+
+        if self._batch_api is not False:
+            try:
+                logger.info(f"Executing {len(commands)} commands via bridge batch")
+                response = await self.client.post(
+                    "/api/v1/commands/batch",
+                    content=orjson.dumps([command.model_dump() for command in commands]),
+                    headers=JSON_HEADERS,
+                )
+                if response.status_code in (404, 405):
+                    logger.info("Bridge has no batch endpoint, sending commands individually")
+                    self._batch_api = False
+                else:
+                    response.raise_for_status()
+                    self._batch_api = True
+                    return [
+                        BridgeCommandResponse(**data) for data in orjson.loads(response.content)
+                    ]
+
+            except httpx.HTTPStatusError as e:
+                logger.error(
+                    f"Bridge HTTP Error: {e.response.status_code} - {e.response.text}"
+                )
+                raise Exception(f"Bridge batch failed: {e.response.text}") from e
+            except httpx.RequestError as e:
+                logger.error(f"Bridge Request Error: {e}")
+                raise Exception(f"Failed to connect to Bridge: {e}") from e
+
+        return [await self._execute(command) for command in commands]
+
+    async def _submit(self, payload: BridgeCommandRequest) -> BridgeCommandResponse:
+        """
+        Send a read-only command, coalesced with concurrent ones.
+
+        Commands submitted within BRIDGE_COALESCE_WINDOW_MS of the first
+        pending one (or until BRIDGE_COALESCE_MAX_BATCH are pending) go
+        out as one batch request, so e.g. several concurrent read_file
+        calls cost one Bridge round-trip. A lone command is sent as a
+        plain request.
+
+        Args:
+            payload: Command request
+
+        Returns:
+            Response for this command
+        """
+        window = settings.BRIDGE_COALESCE_WINDOW_MS / 1000
+        if window <= 0:
+            return await self._execute(payload)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((payload, future))
+
+        if len(self._pending) >= settings.BRIDGE_COALESCE_MAX_BATCH:
+            self._dispatch_pending()
+        elif self._pending_timer is None:
+            self._pending_timer = loop.call_later(window, self._dispatch_pending)
+
+        return await future
+
+    def _dispatch_pending(self) -> None:
+        """Take the pending commands and start sending them."""
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+            self._pending_timer = None
+
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.create_task(self._flush_pending(pending))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_pending(
+        self, pending: List[Tuple[BridgeCommandRequest, asyncio.Future]]
+    ) -> None:
+        """
+        Send coalesced commands and resolve their futures in order.
+
+        Args:
+            pending: (command, future) pairs in submission order
+        """
+        commands = [command for command, _ in pending]
+
+        try:
+            if len(commands) == 1:
+                responses = [await self._execute(commands[0])]
+            else:
+                responses = await self.execute_batch(commands)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), response in zip(pending, responses):
+            if not future.done():
+                future.set_result(response)
+
+    def batch(self) -> "BridgeBatchBuilder":
+        """
+        Start a batch of commands sent together on context exit.
+
+        Example:
+            async with client.batch() as batch:
+                listing = batch.list_files("src")
+                readme = batch.read_file("README.md")
+            print(readme.result().stdout)
+
+        Returns:
+            BridgeBatchBuilder bound to this client
+        """
+        return BridgeBatchBuilder(self)
+
+    async def _files_request(
+        self, method: str, url: str, payload: Dict[str, Any]
+    ) -> Optional[BridgeCommandResponse]:
+        """
+        Call a Bridge file endpoint.
+
+        File operations go through dedicated endpoints so they don't spawn
+        a shell per call. Bridges without those endpoints answer 404/405;
+        that is remembered and None is returned so callers fall back to
+        shell commands.
+
+        Args:
+            method: HTTP method
+            url: Endpoint path
+            payload: JSON body
+
+        Returns:
+            Bridge response, or None if the file endpoints are unavailable
+        """
+        if self._files_api is False:
+            return None
+
+        try:
+            response = await self.client.request(
+                method, url, content=orjson.dumps(payload), headers=JSON_HEADERS
+            )
+            if response.status_code in (404, 405):
+                logger.info("Bridge has no file endpoints, using shell commands")
+                self._files_api = False
+                return None
+
+            response.raise_for_status()
+            self._files_api = True
+            return BridgeCommandResponse(**orjson.loads(response.content))
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"Bridge HTTP Error: {e.response.status_code} - {e.response.text}"
+            )
+            raise Exception(f"Bridge file operation failed: {e.response.text}") from e
+        except httpx.RequestError as e:
+            logger.error(f"Bridge Request Error: {e}")
+            raise Exception(f"Failed to connect to Bridge: {e}") from e
+
     async def list_files(self, path: str = ".") -> BridgeCommandResponse:
-        """Helper to list files in a directory."""
-        return await self.execute_command("ls", ["-la", path])
+        """
+        Helper to list files in a directory (coalesced with concurrent reads).
+
+        Successful listings are reused for BRIDGE_LIST_CACHE_TTL seconds.
+        write_file, create_directory and delete_path drop the entries they
+        affect; any other command that may change files drops them all.
+        """
+        key = os.path.normpath(path)
+        cached = self._listing_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._listing_cache.move_to_end(key)
+            return cached[1].model_copy()
+
+        generation = self._listing_generation
+        response = await self._submit(BridgeCommandRequest(command="ls", args=["-la", path]))
+        if (
+            response.exit_code == 0
+            and settings.BRIDGE_LIST_CACHE_TTL > 0
+            and generation == self._listing_generation
+        ):
+            self._listing_cache[key] = (
+                time.monotonic() + settings.BRIDGE_LIST_CACHE_TTL,
+                response.model_copy(),
+            )
+            self._listing_cache.move_to_end(key)
+            if len(self._listing_cache) > settings.BRIDGE_LIST_CACHE_SIZE:
+                self._listing_cache.popitem(last=False)
+        return response
 
-    async def read_file(self, path: str) -> BridgeCommandResponse:
-        """Helper to read a file."""
-        return await self.execute_command("cat", [path])
+    async def _mutate(
+        self, path: str, operation: Awaitable[BridgeCommandResponse]
+    ) -> BridgeCommandResponse:
+        """
+        Run a filesystem change, invalidating the listings it affects.
+
+        Listings are dropped both before and after the change, so one
+        fetched while the change is in flight is not served afterwards.
+
+        Args:
+            path: Path being changed
+            operation: Bridge call making the change
+
+        Returns:
+            Bridge response of the operation
+        """
+        self.invalidate_listing(path)
+        try:
+            return await operation
+        finally:
+            self.invalidate_listing(path)
+
+    def invalidate_listing(self, path: str) -> None:
+        """
+        Drop cached listings that a change to path can make stale.
+
+        Covers the path itself, the directories above it (whose listings
+        show it) and, for a removed directory, everything below it.
+
+        Args:
+            path: File or directory that was created, written or deleted
+        """
+        self._listing_generation += 1
+        if not self._listing_cache:
+            return
+
+        key = os.path.normpath(path)
+        stale = {key}
+        parent = os.path.dirname(key)
+        while parent and parent not in stale:
+            stale.add(parent)
+            parent = os.path.dirname(parent)
+        if not os.path.isabs(key):
+            stale.add(".")
+
+        prefix = key.rstrip("/") + "/"
+        for cached in list(self._listing_cache):
+            if cached in stale or cached.startswith(prefix):
+                del self._listing_cache[cached]
+
+    def clear_listings(self) -> None:
+        """Drop every cached listing, e.g. after an arbitrary command."""
+        self._listing_generation += 1
+        self._listing_cache.clear()
+
+    async def read_file(
+        self, path: str, max_bytes: Optional[int] = None
+    ) -> BridgeCommandResponse:
+        """
+        Helper to read a file (coalesced with concurrent reads).
+
+        Args:
+            path: File path
+            max_bytes: Only transfer this many bytes of the file; the
+                response's truncated flag tells whether there was more
+
+        Returns:
+            Bridge response with the (possibly capped) content as stdout
+        """
+        if max_bytes is None:
+            return await self._submit(BridgeCommandRequest(command="cat", args=[path]))
+
+        # Read one byte past the cap so a longer file can be detected
+        response = await self._submit(
+            BridgeCommandRequest(command="head", args=["-c", str(max_bytes + 1), path])
+        )
+        content = response.stdout.encode("utf-8")
+        if len(content) > max_bytes:
+            response.stdout = content[:max_bytes].decode("utf-8", errors="ignore")
+            response.truncated = True
+        return response
 
     async def write_file(
         self,
@@ -100,6 +451,19 @@ class OrchestratorClient:
         create_dirs: bool = False,
     ) -> BridgeCommandResponse:
         """Helper to write a file."""
+        return await self._mutate(path, self._write_file(path, content, mode, create_dirs))
+
+    async def _write_file(
+        self, path: str, content: str, mode: str, create_dirs: bool
+    ) -> BridgeCommandResponse:
+        response = await self._files_request(
+            "POST",
+            "/api/v1/files",
+            {"path": path, "content": content, "mode": mode, "create_dirs": create_dirs},
+        )
+        if response is not None:
+            return response
+
         if create_dirs:
             import os
 
@@ -119,7 +483,7 @@ class OrchestratorClient:
         # We use single quotes here because Node.js/Desktop gateway likely wraps 
         # the entire argument string in double quotes when reassembling it, and 
         # nested double quotes cause Bash parsing EOF errors.
-        shell_cmd = f"echo '{b64_content}' | base64 --decode {redirect} '{path}'"
+        shell_cmd = f"echo '{b64_content}' | base64 --decode {redirect} {shlex.quote(path)}"
 
         return await self.execute_command("sh", ["-c", shell_cmd], trusted=True)
 
@@ -127,6 +491,19 @@ class OrchestratorClient:
         self, path: str, create_parents: bool = True, mode: str = "0755"
     ) -> BridgeCommandResponse:
         """Helper to create a directory."""
+        return await self._mutate(path, self._create_directory(path, create_parents, mode))
+
+    async def _create_directory(
+        self, path: str, create_parents: bool, mode: str
+    ) -> BridgeCommandResponse:
+        response = await self._files_request(
+            "POST",
+            "/api/v1/files/mkdir",
+            {"path": path, "create_parents": create_parents, "mode": mode},
+        )
+        if response is not None:
+            return response
+
         args = []
         if mode:
             args.extend(["-m", mode])
@@ -140,6 +517,19 @@ class OrchestratorClient:
         self, path: str, recursive: bool = False, force: bool = False
     ) -> BridgeCommandResponse:
         """Helper to delete a file or directory."""
+        return await self._mutate(path, self._delete_path(path, recursive, force))
+
+    async def _delete_path(
+        self, path: str, recursive: bool, force: bool
+    ) -> BridgeCommandResponse:
+        response = await self._files_request(
+            "DELETE",
+            "/api/v1/files",
+            {"path": path, "recursive": recursive, "force": force},
+        )
+        if response is not None:
+            return response
+
         args = [path]
         if recursive:
             args.append("-r")
@@ -149,9 +539,109 @@ class OrchestratorClient:
         return await self.execute_command("rm", args)
 
     async def get_file_info(self, path: str) -> BridgeCommandResponse:
-        """Helper to get file information."""
-        return await self.execute_command("stat", [path])
+        """Helper to get file information (coalesced with concurrent reads)."""
+        return await self._submit(BridgeCommandRequest(command="stat", args=[path]))
+
+
+def _is_read_only(command: BridgeCommandRequest) -> bool:
+    """Whether a command is known not to change the filesystem."""
+    return command.command in _READ_ONLY_COMMANDS and all(
+        _SHELL_OPERATOR_CHARS.isdisjoint(arg) for arg in command.args
+    )
+
+
+class BridgeBatchBuilder:
+    """
+    Queues Bridge commands and sends them in one batch request.
+
+    Each queued call returns a future that resolves once the batch is
+    flushed on leaving the ``async with`` block.
+    """
+
+    def __init__(self, client: OrchestratorClient):
+        self.client = client
+        self._commands: List[BridgeCommandRequest] = []
+        self._futures: List[asyncio.Future] = []
+
+    def execute_command(
+        self, cmd: str, args: list = None, cwd: str = None, trusted: bool = False
+    ) -> asyncio.Future:
+        """Queue a shell command; see OrchestratorClient.execute_command."""
+        self._commands.append(
+            BridgeCommandRequest(command=cmd, args=args or [], cwd=cwd, trusted=trusted)
+        )
+        future = asyncio.get_running_loop().create_future()
+        self._futures.append(future)
+        return future
+
+    def list_files(self, path: str = ".") -> asyncio.Future:
+        """Queue a directory listing."""
+        return self.execute_command("ls", ["-la", path])
+
+    def read_file(self, path: str) -> asyncio.Future:
+        """Queue a file read."""
+        return self.execute_command("cat", [path])
+
+    def get_file_info(self, path: str) -> asyncio.Future:
+        """Queue a file stat."""
+        return self.execute_command("stat", [path])
+
+    async def flush(self) -> List[BridgeCommandResponse]:
+        """Send all queued commands and resolve their futures."""
+        commands, futures = self._commands, self._futures
+        self._commands, self._futures = [], []
+
+        try:
+            responses = await self.client.execute_batch(commands)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            raise
+
+        for future, response in zip(futures, responses):
+            future.set_result(response)
+        return responses
+
+    async def __aenter__(self) -> "BridgeBatchBuilder":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            for future in self._futures:
+                future.cancel()
+            return
+        await self.flush()
+
+
+# Global client instance
+_orchestrator_client: Optional[OrchestratorClient] = None
+
+
+def get_orchestrator_client() -> OrchestratorClient:
+    """
+    Get or create the shared Bridge client.
+
+    The client is created on first use so importing this module does not
+    open a connection pool; all callers then share that pool.
+
+    Returns:
+        OrchestratorClient instance
+    """
+    global _orchestrator_client
+    if _orchestrator_client is None:
+        _orchestrator_client = OrchestratorClient()
+    return _orchestrator_client
+
+
+async def close_orchestrator_client():
+    """Close the shared Bridge client if it was created."""
+    global _orchestrator_client
+    if _orchestrator_client is not None:
+        await _orchestrator_client.close()
+        _orchestrator_client = None
 
 
-# Global instance
-orchestrator_client = OrchestratorClient()
+def reset_orchestrator_client():
+    """Reset the shared Bridge client (for testing)."""
+    global _orchestrator_client
+    _orchestrator_client = None
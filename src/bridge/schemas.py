@@ -16,6 +16,7 @@ class BridgeCommandResponse(BaseModel):
     stderr: str
     exit_code: int
     duration_ms: int
+    truncated: bool = False  # stdout was capped (e.g. read_file max_bytes)
 
 
 class BridgeError(BaseModel):
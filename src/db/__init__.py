@@ -8,6 +8,7 @@ from src.db.base import Base
 from src.db.models import (
     Session,
     Message,
+    SessionSummary,
     ToolCall,
     AgentState,
     Embedding,
@@ -22,7 +23,14 @@ from src.db.models import (
 from src.db.repositories.session_repo import SessionRepository
 from src.db.repositories.message_repo import MessageRepository
 from src.db.repositories.tool_call_repo import ToolCallRepository
-from src.db.engine import engine, async_session, get_db, init_db
+from src.db.repositories.summary_repo import SessionSummaryRepository
+from src.db.engine import engine, async_session, get_db, init_db, parallel_sessions
+from src.db.write_buffer import (
+    CheckpointWriteBuffer,
+    MessageWriteBuffer,
+    get_checkpoint_write_buffer,
+    get_message_write_buffer,
+)
 
 __all__ = [
     # Base class
@@ -30,6 +38,7 @@ __all__ = [
     # Models
     "Session",
     "Message",
+    "SessionSummary",
     "ToolCall",
     "AgentState",
     "Embedding",
@@ -45,9 +54,16 @@ __all__ = [
     "SessionRepository",
     "MessageRepository",
     "ToolCallRepository",
+    "SessionSummaryRepository",
     # Engine/Session
     "engine",
     "async_session",
     "get_db",
     "init_db",
+    "parallel_sessions",
+    # Write buffering
+    "MessageWriteBuffer",
+    "get_message_write_buffer",
+    "CheckpointWriteBuffer",
+    "get_checkpoint_write_buffer",
 ]
\ No newline at end of file
@@ -1,27 +1,100 @@
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator, List
 
 from src.config import settings
 
+
+def async_database_url(url: str) -> str:
+    """
+    Point a PostgreSQL URL at the asyncpg driver.
+
+    Hosted providers (e.g. Neon) hand out plain ``postgresql://`` URLs
+    with libpq options. Those would select the synchronous psycopg2
+    driver, and asyncpg rejects ``sslmode``/``channel_binding``, so the
+    driver is switched and ``sslmode`` is passed on as asyncpg's ``ssl``.
+
+    Args:
+        url: Database URL from settings
+
+    Returns:
+        URL using postgresql+asyncpg (other backends are returned as is)
+    """
+    db_url = make_url(url)
+    if db_url.get_backend_name() != "postgresql":
+        return url
+
+    query = dict(db_url.query)
+    sslmode = query.pop("sslmode", None)
+    query.pop("channel_binding", None)
+    if sslmode and "ssl" not in query:
+        query["ssl"] = sslmode
+
+    db_url = db_url.set(drivername="postgresql+asyncpg", query=query)
+    return db_url.render_as_string(hide_password=False)
+
+
+def _json_serializer(value) -> str:
+    """Serialize JSON/JSONB column values with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
 engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,  # Only log SQL in debug mode
+    async_database_url(settings.DATABASE_URL),
+    echo=settings.SQL_ECHO,  # Per-statement logging is opt-in, not tied to DEBUG
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=20,  # Number of connections to keep in pool
-    max_overflow=10,  # Allow pool to grow by this many connections
+    pool_size=settings.DB_POOL_SIZE,  # Number of connections to keep in pool
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Allow pool to grow by this many connections
+    pool_recycle=1800,  # Replace connections older than 30 minutes
+    pool_use_lifo=True,  # Reuse the warmest connection; surplus ones idle out
+    pool_timeout=10,  # Fail fast when the pool is exhausted
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # Compiled SQL reused across calls
+    json_serializer=_json_serializer,  # orjson for tool inputs/outputs and metadata
+    json_deserializer=orjson.loads,
+    connect_args={
+        # Cache prepared statements so repeated queries skip parsing
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
 )
 
 # Create async session factory
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def pool_status() -> dict:
+    """
+    Report connection pool usage.
+
+    Returns:
+        Dictionary with pool size, idle (checked_in) and in-use
+        (checked_out) connections, and connections opened beyond size
+    """
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        # QueuePool counts overflow from -size until the pool is full
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
 async def init_db():
-    """Initialize database connection pool."""
-    # Test connection
-    async with engine.begin() as conn:
-        await conn.execute("SELECT 1")
+    """
+    Verify the database is reachable.
+
+    Opens one pooled connection at startup. Request handlers don't need
+    this: pool_pre_ping already checks connections on checkout.
+    """
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -34,9 +107,45 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             repo = SessionRepository(db)
             sessions = await repo.get_active_sessions(user_id="user123")
             return sessions
+
+    The whole request shares one transaction: it commits when the
+    dependency exits and rolls back if the request raised. Routes that
+    must see the commit before responding should depend on it with
+    ``Depends(get_db, scope="function")``.
     """
     async with async_session() as session:
-        yield session
+        async with session.begin():
+            yield session
+
+
+@asynccontextmanager
+async def parallel_sessions(count: int) -> AsyncIterator[List[AsyncSession]]:
+    """
+    Open several independent sessions for concurrent reads.
+
+    One AsyncSession runs one query at a time, so independent reads on it
+    pay a round-trip each. Sessions from this helper use separate pooled
+    connections, letting the reads overlap:
+
+        async with parallel_sessions(2) as (s1, s2):
+            count, calls = await asyncio.gather(
+                ToolCallRepository(s1).count_by_session_id(sid),
+                ToolCallRepository(s2).get_by_session_id(sid, limit=50),
+            )
+
+    Only use it for read-only work; each session has its own transaction.
+
+    Args:
+        count: Number of sessions to open
+
+    Yields:
+        List of AsyncSession instances, closed on exit
+    """
+    async with AsyncExitStack() as stack:
+        yield [
+            await stack.enter_async_context(async_session())
+            for _ in range(count)
+        ]
 
 
 async def get_session() -> AsyncSession:
@@ -50,5 +159,4 @@ async def get_session() -> AsyncSession:
         The caller is responsible for closing the session.
         Prefer get_db() for FastAPI routes.
     """
-    async_session_local = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    return async_session_local()
+    return async_session()
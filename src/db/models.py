@@ -10,7 +10,9 @@ from typing import Optional, List, Any
 from uuid import uuid4
 
 from sqlalchemy import (
-    String, Text, Integer, DateTime, JSON, ForeignKey, Index, func, Enum as SQLEnum
+    String, Text, Integer, Boolean, DateTime, JSON, LargeBinary, ForeignKey, Index, func, text,
+    DDL, event,
+    Enum as SQLEnum
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB
@@ -18,6 +20,11 @@ from sqlalchemy.dialects.postgresql import UUID, JSONB
 from src.db.base import Base
 
 
+def _enum_values(enum_cls: type) -> List[str]:
+    """Persist enum members by value, matching the Postgres enum types."""
+    return [member.value for member in enum_cls]
+
+
 # Enums for status fields
 class SessionStatus(str, Enum):
     """Status for sessions."""
@@ -77,7 +84,7 @@ class Session(Base):
     user_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     title: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     status: Mapped[SessionStatus] = mapped_column(
-        SQLEnum(SessionStatus, name="agentsessionstatus"),
+        SQLEnum(SessionStatus, name="agentsessionstatus", values_callable=_enum_values),
         default=SessionStatus.ACTIVE,
         nullable=False,
         index=True
@@ -118,6 +125,30 @@ class Session(Base):
         cascade="all, delete-orphan"
     )
 
+    # Indexes
+    __table_args__ = (
+        # Trigram index so ILIKE '%query%' title search can use an index
+        Index(
+            "idx_agent_sessions_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"}
+        ),
+        # Small partial indexes serving the newest-active-sessions listings
+        # in order, so they need neither a sort nor a scan of old sessions
+        Index(
+            "idx_agent_sessions_active_user_created",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("status = 'active'")
+        ),
+        Index(
+            "idx_agent_sessions_active_created",
+            text("created_at DESC"),
+            postgresql_where=text("status = 'active'")
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Session(id={self.id}, user_id={self.user_id}, status={self.status.value})>"
 
@@ -137,12 +168,12 @@ class Message(Base):
     id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     session_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("sessions.id", ondelete="CASCADE"),
+        ForeignKey("agent_sessions.id", ondelete="CASCADE"),
         nullable=False,
         index=True
     )
     role: Mapped[MessageRole] = mapped_column(
-        SQLEnum(MessageRole, name="agentmessagerole"),
+        SQLEnum(MessageRole, name="agentmessagerole", values_callable=_enum_values),
         nullable=False
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -163,13 +194,71 @@ class Message(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_messages_session_created", "session_id", "created_at"),
+        Index("idx_agent_messages_session_created_id", "session_id", "created_at", "id"),
+        # Serves role-filtered reads in order (user/assistant listings,
+        # latest user message as an index-only scan)
+        Index(
+            "idx_agent_messages_session_role_created",
+            "session_id",
+            "role",
+            "created_at",
+            "id"
+        ),
+        # Trigram index so ILIKE '%query%' content search can use an index
+        Index(
+            "idx_agent_messages_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"}
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<Message(id={self.id}, role={self.role.value}, session_id={self.session_id})>"
 
 
+class SessionSummary(Base):
+    """
+    Stores a generated conversation summary.
+
+    Each row summarizes the ``message_count`` messages of a session that
+    end at ``up_to_message_id``, so a summary can be reused until a new
+    message arrives. Chunk summaries (``is_chunk``) cover the range
+    starting at ``start_message_id`` and are used for incremental
+    compression.
+    """
+    __tablename__ = "agent_session_summaries"
+
+    id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    session_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("agent_sessions.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    # Not foreign keys: summarized messages may later be deleted
+    start_message_id: Mapped[Optional[UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    up_to_message_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    message_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    is_chunk: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false", nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now()
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index(
+            "idx_agent_session_summaries_session_message",
+            "session_id", "up_to_message_id", "message_count", "is_chunk",
+            unique=True
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SessionSummary(id={self.id}, session_id={self.session_id}, up_to_message_id={self.up_to_message_id})>"
+
+
 # ============================================================================
 # Tool Call Models
 # ============================================================================
@@ -185,12 +274,12 @@ class ToolCall(Base):
     id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     message_id: Mapped[Optional[UUID]] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("messages.id", ondelete="SET NULL"),
+        ForeignKey("agent_messages.id", ondelete="SET NULL"),
         nullable=True
     )
     session_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("sessions.id", ondelete="CASCADE"),
+        ForeignKey("agent_sessions.id", ondelete="CASCADE"),
         nullable=False,
         index=True
     )
@@ -199,13 +288,15 @@ class ToolCall(Base):
     outputs: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     status: Mapped[ToolCallStatus] = mapped_column(
-        SQLEnum(ToolCallStatus, name="agenttoolcallstatus"),
+        SQLEnum(ToolCallStatus, name="agenttoolcallstatus", values_callable=_enum_values),
         nullable=False,
         index=True
     )
     execution_time_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Partition key, so it is part of the table's primary key
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
@@ -218,6 +309,35 @@ class ToolCall(Base):
     session: Mapped["Session"] = relationship("Session", back_populates="tool_calls")
     message: Mapped[Optional["Message"]] = relationship("Message", back_populates="tool_calls")
 
+    # Indexes
+    __table_args__ = (
+        # Per-session listings, optionally by status, newest first
+        Index(
+            "idx_agent_tool_calls_session_status_created",
+            "session_id",
+            "status",
+            text("created_at DESC")
+        ),
+        # Queue-style scan of pending calls, oldest first
+        Index(
+            "idx_agent_tool_calls_pending_created",
+            "created_at",
+            postgresql_where=text("status = 'pending'")
+        ),
+        Index("idx_agent_tool_calls_message_created", "message_id", "created_at"),
+        # Slowest completed calls, read in order by get_slow_calls
+        Index(
+            "idx_agent_tool_calls_slow",
+            text("execution_time_ms DESC"),
+            postgresql_where=text("status = 'completed' AND execution_time_ms IS NOT NULL")
+        ),
+        # Monthly partitions (agent_tool_calls_pYYYYMM) so old calls are
+        # dropped a partition at a time
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    # Rows are still identified by id alone
+    __mapper_args__ = {"primary_key": [id]}
+
     def __repr__(self) -> str:
         return f"<ToolCall(id={self.id}, tool_name={self.tool_name}, status={self.status.value})>"
 
@@ -235,14 +355,16 @@ class AgentState(Base):
     __tablename__ = "agent_states"
 
     id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    # The checkpointer's thread ID (one thread per session). Partition
+    # key, so it is part of the table's primary key
     session_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("sessions.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        ForeignKey("agent_sessions.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False
     )
-    thread_id: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
-    state: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Format-tagged, zstd-compressed JSON (see src.memory.checkpointer)
+    state: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now()
@@ -251,8 +373,35 @@ class AgentState(Base):
     # Relationships
     session: Mapped["Session"] = relationship("Session", back_populates="agent_states")
 
+    # Indexes
+    __table_args__ = (
+        # A thread's checkpoints, newest first (latest-checkpoint and list lookups)
+        Index(
+            "idx_agent_states_session_created",
+            "session_id",
+            text("created_at DESC"),
+            postgresql_include=["id"]
+        ),
+        # Hash partitions (agent_states_pN) keep each thread's index small;
+        # every checkpoint query filters on session_id, so one is scanned
+        {"postgresql_partition_by": "HASH (session_id)"},
+    )
+    # Rows are still identified by id alone
+    __mapper_args__ = {"primary_key": [id]}
+
     def __repr__(self) -> str:
-        return f"<AgentState(id={self.id}, thread_id={self.thread_id})>"
+        return f"<AgentState(id={self.id}, session_id={self.session_id})>"
+
+
+# Number of agent_states hash partitions (see migration 016)
+AGENT_STATE_PARTITIONS = 16
+
+# Partitions are created with the table when it is built from the models
+for _remainder in range(AGENT_STATE_PARTITIONS):
+    event.listen(AgentState.__table__, "after_create", DDL(
+        f"CREATE TABLE agent_states_p{_remainder} PARTITION OF agent_states "
+        f"FOR VALUES WITH (MODULUS {AGENT_STATE_PARTITIONS}, REMAINDER {_remainder})"
+    ).execute_if(dialect="postgresql"))
 
 
 # ============================================================================
@@ -271,7 +420,7 @@ class Embedding(Base):
     id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     session_id: Mapped[Optional[UUID]] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("sessions.id", ondelete="SET NULL"),
+        ForeignKey("agent_sessions.id", ondelete="SET NULL"),
         nullable=True,
         index=True
     )
@@ -314,13 +463,13 @@ class WorkflowExecution(Base):
     id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     session_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("sessions.id", ondelete="CASCADE"),
+        ForeignKey("agent_sessions.id", ondelete="CASCADE"),
         nullable=False,
         index=True
     )
     workflow_name: Mapped[str] = mapped_column(String(100), nullable=False)
     status: Mapped[WorkflowStatus] = mapped_column(
-        SQLEnum(WorkflowStatus, name="agentworkflowstatus"),
+        SQLEnum(WorkflowStatus, name="agentworkflowstatus", values_callable=_enum_values),
         default=WorkflowStatus.PENDING,
         nullable=False,
         index=True
@@ -362,13 +511,13 @@ class WorkflowStep(Base):
     id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     workflow_execution_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("workflow_executions.id", ondelete="CASCADE"),
+        ForeignKey("agent_workflow_executions.id", ondelete="CASCADE"),
         nullable=False
     )
     step_name: Mapped[str] = mapped_column(String(100), nullable=False)
     step_order: Mapped[int] = mapped_column(Integer, nullable=False)
     status: Mapped[WorkflowStepStatus] = mapped_column(
-        SQLEnum(WorkflowStepStatus, name="agentworkflowstepstatus"),
+        SQLEnum(WorkflowStepStatus, name="agentworkflowstepstatus", values_callable=_enum_values),
         default=WorkflowStepStatus.PENDING,
         nullable=False
     )
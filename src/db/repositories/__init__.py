@@ -7,9 +7,11 @@ Provides repository pattern for database operations.
 from src.db.repositories.session_repo import SessionRepository
 from src.db.repositories.message_repo import MessageRepository
 from src.db.repositories.tool_call_repo import ToolCallRepository
+from src.db.repositories.summary_repo import SessionSummaryRepository
 
 __all__ = [
     "SessionRepository",
     "MessageRepository",
     "ToolCallRepository",
+    "SessionSummaryRepository",
 ]
@@ -4,16 +4,53 @@ Message repository for database operations.
 Provides CRUD operations for agent_messages table.
 """
 
-from typing import Optional, List
-from uuid import UUID
+from typing import Any, Optional, List, Dict, AsyncIterator, Tuple
+from uuid import UUID, uuid4
 from datetime import datetime
 
-from sqlalchemy import select, func, and_, desc
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    Row, Select, RowMapping, String, Text, bindparam, cast, exists, select, insert, update, delete, func,
+    and_, desc, literal, tuple_
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, distinct_on
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
+from sqlalchemy.orm import contains_eager, selectinload
 
 from src.db.models import Message, MessageRole, Session
 from src.db.base import Base
 
+# Rows fetched per round-trip when streaming large result sets
+STREAM_YIELD_PER = 200
+
+# Prebuilt statements for lookups made on every chat turn. Values are
+# passed as typed bind parameters, so each statement is built once and
+# its compiled form and prepared statement are reused.
+_BY_ID = select(Message).where(
+    Message.id == bindparam("message_id", type_=Message.id.type)
+)
+_EXISTS = select(exists().where(
+    Message.id == bindparam("message_id", type_=Message.id.type)
+))
+_COUNT_BY_SESSION = select(func.count()).select_from(Message).where(
+    Message.session_id == bindparam("session_id", type_=Message.session_id.type)
+)
+_LAST_USER_MESSAGE = (
+    select(Message)
+    .where(and_(
+        Message.session_id == bindparam("session_id", type_=Message.session_id.type),
+        Message.role == MessageRole.USER
+    ))
+    .order_by(Message.created_at.desc())
+    .limit(1)
+)
+_LAST_USER_MESSAGE_ID = _LAST_USER_MESSAGE.with_only_columns(Message.id)
+_FIRST_MESSAGE_AT = (
+    select(Message.created_at)
+    .where(Message.session_id == bindparam("session_id", type_=Message.session_id.type))
+    .order_by(Message.created_at.asc())
+    .limit(1)
+)
+
 
 class MessageRepository:
     """Repository for Message model."""
@@ -41,6 +78,9 @@ class MessageRepository:
         """
         Create a new message.
 
+        Uses a single INSERT ... RETURNING for the server-generated
+        created_at instead of flushing and re-selecting the row.
+
         Args:
             session_id: Parent session UUID
             role: Message role (user/assistant/system/tool)
@@ -48,18 +88,49 @@ class MessageRepository:
             meta: Optional metadata dictionary
 
         Returns:
-            Created Message instance
+            Created Message instance (not attached to the session)
         """
-        message = Message(
-            session_id=session_id,
-            role=role,
-            content=content,
-            meta=meta or {}
-        )
-        self.session.add(message)
-        await self.session.flush()
-        await self.session.refresh(message)
-        return message
+        values = {
+            "id": uuid4(),
+            "session_id": session_id,
+            "role": role,
+            "content": content,
+            "meta": meta or {},
+        }
+        stmt = insert(Message).values(**values).returning(Message.created_at)
+        result = await self.session.execute(stmt)
+        return Message(**values, created_at=result.scalar_one())
+
+    async def create_many(self, rows: List[dict]) -> List[Message]:
+        """
+        Create several messages with one batched INSERT ... RETURNING.
+
+        SQLAlchemy's insertmanyvalues support packs the rows into
+        multi-row VALUES clauses instead of one statement per row.
+
+        Args:
+            rows: Dicts with session_id, role, content and optional meta
+                (and optionally a pre-generated id)
+
+        Returns:
+            Created Message instances, in the same order as rows
+        """
+        if not rows:
+            return []
+
+        values = [
+            {
+                "id": row.get("id") or uuid4(),
+                "session_id": row["session_id"],
+                "role": row["role"],
+                "content": row["content"],
+                "meta": row.get("meta") or {},
+            }
+            for row in rows
+        ]
+        stmt = insert(Message).returning(Message, sort_by_parameter_order=True)
+        result = await self.session.scalars(stmt, values)
+        return result.all()
 
     async def get_by_id(self, message_id: UUID) -> Optional[Message]:
         """
@@ -71,8 +142,7 @@ class MessageRepository:
         Returns:
             Message if found, None otherwise
         """
-        stmt = select(Message).where(Message.id == message_id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_BY_ID, {"message_id": message_id})
         return result.scalar_one_or_none()
 
     async def get_by_session_id(
@@ -107,7 +177,53 @@ class MessageRepository:
             stmt = stmt.where(Message.role == role)
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def get_by_session_id_before(
+        self,
+        session_id: UUID,
+        cursor_ts: Optional[datetime] = None,
+        cursor_id: Optional[UUID] = None,
+        limit: int = 100,
+        role: Optional[MessageRole] = None
+    ) -> Tuple[List[Message], Optional[Tuple[datetime, UUID]]]:
+        """
+        Page through a session's messages newest first using a keyset cursor.
+
+        Unlike OFFSET paging, each page is a range scan on the
+        (session_id, created_at, id) index, so deep pages cost the same
+        as the first one.
+
+        Args:
+            session_id: Session UUID
+            cursor_ts: created_at of the last message of the previous page
+            cursor_id: id of the last message of the previous page
+            limit: Maximum number of results
+            role: Optional role filter
+
+        Returns:
+            Tuple of (messages newest first, cursor for the next page or
+            None when there are no more messages)
+        """
+        stmt = select(Message).where(Message.session_id == session_id)
+        if role is not None:
+            stmt = stmt.where(Message.role == role)
+        if cursor_ts is not None and cursor_id is not None:
+            stmt = stmt.where(
+                tuple_(Message.created_at, Message.id) < tuple_(
+                    literal(cursor_ts, Message.created_at.type),
+                    literal(cursor_id, Message.id.type)
+                )
+            )
+        stmt = stmt.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit)
+
+        result = await self.session.execute(stmt)
+        messages = result.scalars().all()
+
+        next_cursor = None
+        if len(messages) == limit:
+            next_cursor = (messages[-1].created_at, messages[-1].id)
+        return messages, next_cursor
 
     async def get_user_messages(
         self,
@@ -160,30 +276,238 @@ class MessageRepository:
     async def get_conversation(
         self,
         session_id: UUID,
-        limit: int = 100
+        limit: Optional[int] = 100,
+        before: Optional[datetime] = None,
+        role: Optional[MessageRole] = None,
+        include_tool_calls: bool = False,
+        after: Optional[datetime] = None
     ) -> List[Message]:
         """
         Get full conversation (user + assistant messages) for a session.
 
+        Filtering and the limit are applied in SQL, so only the requested
+        rows are transferred. When a limit is given the most recent
+        messages are returned.
+
         Args:
             session_id: Session UUID
-            limit: Maximum number of results
+            limit: Maximum number of results (None for all)
+            before: Only return messages created before this timestamp
+            role: Only return messages with this role instead of the
+                default user + assistant conversation
+            include_tool_calls: Batch-load Message.tool_calls with one
+                extra SELECT instead of lazy-loading per message
+            after: Only return messages created after this timestamp
+
+        Returns:
+            List of Message instances ordered chronologically
+        """
+        stmt = self._conversation_query(session_id, before, after, role)
+        if include_tool_calls:
+            stmt = stmt.options(selectinload(Message.tool_calls))
+
+        if limit is None:
+            # Unbounded reads (e.g. a long session's first compression) are
+            # fetched from a server-side cursor STREAM_YIELD_PER rows at a
+            # time instead of buffering the whole result in the driver
+            stmt = stmt.order_by(Message.created_at.asc()).execution_options(
+                yield_per=STREAM_YIELD_PER
+            )
+            result = await self.session.stream_scalars(stmt)
+            messages = []
+            async for partition in result.partitions():
+                messages.extend(partition)
+            return messages
+
+        stmt = stmt.order_by(Message.created_at.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        messages = result.scalars().all()
+        messages.reverse()
+        return messages
+
+    async def get_conversation_after_message(
+        self,
+        session_id: UUID,
+        message_id: UUID,
+        fallback_after: datetime
+    ) -> List[Message]:
+        """
+        Get a conversation's messages newer than a given message.
+
+        The message's timestamp is looked up in a subquery, so this is a
+        single round-trip. If the message no longer exists, messages
+        after ``fallback_after`` are returned instead.
+
+        Args:
+            session_id: Session UUID
+            message_id: UUID of the last message to exclude
+            fallback_after: Timestamp used when the message is missing
 
         Returns:
             List of Message instances ordered chronologically
         """
+        after = func.coalesce(
+            select(Message.created_at)
+            .where(Message.id == message_id)
+            .correlate(None)
+            .scalar_subquery(),
+            literal(fallback_after, Message.created_at.type)
+        )
         stmt = (
-            select(Message)
-            .where(and_(
-                Message.session_id == session_id,
-                Message.role.in_([MessageRole.USER, MessageRole.ASSISTANT])
-            ))
+            self._conversation_query(session_id, None, None, None)
+            .where(Message.created_at > after)
             .order_by(Message.created_at.asc())
-            .limit(limit)
         )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def get_conversation_projected(
+        self,
+        session_id: UUID,
+        limit: Optional[int] = 100
+    ) -> List[Row]:
+        """
+        Get a conversation's roles and contents only.
+
+        Selects just the two columns needed to build LLM messages, so no
+        ORM objects are built and the meta JSONB is not transferred.
+        When a limit is given the most recent messages are returned.
+
+        Args:
+            session_id: Session UUID
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            List of (role, content) rows ordered chronologically
+        """
+        stmt = self._conversation_query(
+            session_id, None, None, None,
+            Message.role, Message.content, Message.created_at
+        )
+        latest = stmt.order_by(Message.created_at.desc()).limit(limit).subquery()
+        stmt = select(latest.c.role, latest.c.content).order_by(latest.c.created_at.asc())
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.all()
+
+    async def stream_conversation_rows(
+        self,
+        session_id: UUID,
+        limit: Optional[int] = 100,
+        before: Optional[datetime] = None,
+        role: Optional[MessageRole] = None,
+        after: Optional[datetime] = None
+    ) -> AsyncIterator[RowMapping]:
+        """
+        Stream a conversation as response-shaped rows.
+
+        Takes the same filters as get_conversation. Each row maps id,
+        session_id, role, content, meta and created_at, with the UUIDs
+        cast to text in SQL, so no ORM objects or UUID instances are
+        built per row. The query is executed before returning, so errors
+        surface to the caller; rows are then fetched from the cursor as
+        the iterator is consumed.
+
+        Args:
+            session_id: Session UUID
+            limit: Maximum number of results (None for all)
+            before: Only return messages created before this timestamp
+            role: Only return messages with this role instead of the
+                default user + assistant conversation
+            after: Only return messages created after this timestamp
+
+        Returns:
+            Async iterator of row mappings ordered chronologically
+        """
+        stmt = self._conversation_query(
+            session_id, before, after, role,
+            cast(Message.id, String).label("id"),
+            cast(Message.session_id, String).label("session_id"),
+            Message.role.label("role"),
+            Message.content.label("content"),
+            Message.meta.label("meta"),
+            Message.created_at.label("created_at"),
+        )
+        if limit is not None:
+            # Pick the most recent rows, then stream them oldest first
+            latest = stmt.order_by(Message.created_at.desc()).limit(limit).subquery()
+            stmt = select(latest).order_by(latest.c.created_at.asc())
+        else:
+            stmt = stmt.order_by(Message.created_at.asc())
+
+        stmt = stmt.execution_options(yield_per=STREAM_YIELD_PER)
+        result = await self.session.stream(stmt)
+        return result.mappings()
+
+    async def get_conversation_reverse_chunked(
+        self,
+        session_id: UUID,
+        chunk_size: int = 50
+    ) -> AsyncIterator[Message]:
+        """
+        Iterate a conversation newest first, fetching it in chunks.
+
+        Each chunk is a keyset-paged ``ORDER BY created_at DESC LIMIT``
+        query, so a caller that stops early (e.g. once a token budget is
+        filled) never transfers the older messages.
+
+        Args:
+            session_id: Session UUID
+            chunk_size: Messages fetched per query
+
+        Yields:
+            User and assistant Message instances, newest first
+        """
+        stmt = self._conversation_query(session_id, None, None, None).order_by(
+            Message.created_at.desc(), Message.id.desc()
+        ).limit(chunk_size)
+        cursor = None
+
+        while True:
+            page = stmt
+            if cursor is not None:
+                page = stmt.where(
+                    tuple_(Message.created_at, Message.id) < tuple_(
+                        literal(cursor[0], Message.created_at.type),
+                        literal(cursor[1], Message.id.type)
+                    )
+                )
+
+            result = await self.session.execute(page)
+            messages = result.scalars().all()
+            for message in messages:
+                yield message
+
+            if len(messages) < chunk_size:
+                return
+            cursor = (messages[-1].created_at, messages[-1].id)
+
+    def _conversation_query(
+        self,
+        session_id: UUID,
+        before: Optional[datetime],
+        after: Optional[datetime],
+        role: Optional[MessageRole],
+        *columns
+    ) -> Select:
+        """
+        Build the filtered, unordered SELECT shared by conversation reads.
+
+        Selects whole Message entities unless specific columns are given.
+        """
+        if role is not None:
+            role_clause = Message.role == role
+        else:
+            role_clause = Message.role.in_([MessageRole.USER, MessageRole.ASSISTANT])
+
+        stmt = select(*(columns or (Message,))).where(
+            and_(Message.session_id == session_id, role_clause)
+        )
+        if before is not None:
+            stmt = stmt.where(Message.created_at < before)
+        if after is not None:
+            stmt = stmt.where(Message.created_at > after)
+        return stmt
 
     async def get_last_user_message(
         self,
@@ -198,19 +522,36 @@ class MessageRepository:
         Returns:
             Last user Message if found, None otherwise
         """
-        stmt = (
-            select(Message)
-            .where(and_(
-                Message.session_id == session_id,
-                Message.role == MessageRole.USER
-            ))
-            .order_by(Message.created_at.desc())
-            .limit(1)
-        )
-
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_LAST_USER_MESSAGE, {"session_id": session_id})
         return result.scalar_one_or_none()
 
+    async def last_user_message_id(self, session_id: UUID) -> Optional[UUID]:
+        """
+        Get the ID of the last user message for a session.
+
+        Answered from the (session_id, role, created_at, id) index alone,
+        without reading the message row.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Message UUID, or None if the session has no user messages
+        """
+        return await self.session.scalar(_LAST_USER_MESSAGE_ID, {"session_id": session_id})
+
+    async def first_message_at(self, session_id: UUID) -> Optional[datetime]:
+        """
+        Get when the first message of a session was created.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Creation timestamp, or None if the session has no messages
+        """
+        return await self.session.scalar(_FIRST_MESSAGE_AT, {"session_id": session_id})
+
     async def get_first_message(
         self,
         session_id: UUID
@@ -251,18 +592,79 @@ class MessageRepository:
         Returns:
             Updated Message if found, None otherwise
         """
-        message = await self.get_by_id(message_id)
-        if message is None:
-            return None
+        values = {
+            key: value
+            for key, value in (("content", content), ("meta", meta))
+            if value is not None
+        }
+        if not values:
+            return await self.get_by_id(message_id)
 
-        if content is not None:
-            message.content = content
-        if meta is not None:
-            message.meta = meta
+        stmt = (
+            update(Message)
+            .where(Message.id == message_id)
+            .values(**values)
+            .returning(Message)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def patch_meta(self, message_id: UUID, patch: dict) -> bool:
+        """
+        Merge keys into a message's metadata.
+
+        Sends only the changed keys and merges them in SQL with jsonb
+        ``||``, instead of rewriting the whole metadata object.
+
+        Args:
+            message_id: Message UUID
+            patch: Top-level keys to add or replace
+
+        Returns:
+            True if the message was found, False otherwise
+        """
+        stmt = (
+            update(Message)
+            .where(Message.id == message_id)
+            .values(meta=Message.meta.op("||")(literal(patch, JSONB)))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
 
-        await self.session.flush()
-        await self.session.refresh(message)
-        return message
+    async def set_meta_value(
+        self,
+        message_id: UUID,
+        path: List[str],
+        value: Any
+    ) -> bool:
+        """
+        Set one nested metadata value with jsonb_set.
+
+        Missing intermediate objects are not created, matching jsonb_set.
+
+        Args:
+            message_id: Message UUID
+            path: Keys leading to the value, e.g. ["tool", "status"]
+            value: JSON-serializable value to store
+
+        Returns:
+            True if the message was found, False otherwise
+        """
+        stmt = (
+            update(Message)
+            .where(Message.id == message_id)
+            .values(meta=func.jsonb_set(
+                Message.meta,
+                literal(path, ARRAY(Text)),
+                literal(value, JSONB),
+                True
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
 
     async def delete(self, message_id: UUID) -> bool:
         """
@@ -276,13 +678,13 @@ class MessageRepository:
         Returns:
             True if deleted, False if not found
         """
-        message = await self.get_by_id(message_id)
-        if message is None:
-            return False
-
-        await self.session.delete(message)
-        await self.session.flush()
-        return True
+        stmt = (
+            delete(Message)
+            .where(Message.id == message_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
 
     # ========================================
     # Query Operations
@@ -303,11 +705,11 @@ class MessageRepository:
         Returns:
             Number of messages
         """
-        stmt = select(func.count()).select_from(Message).where(Message.session_id == session_id)
+        stmt = _COUNT_BY_SESSION
         if role is not None:
             stmt = stmt.where(Message.role == role)
 
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(stmt, {"session_id": session_id})
         return result.scalar_one()
 
     async def count_by_session_ids(
@@ -327,6 +729,33 @@ class MessageRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one()
 
+    async def count_per_session(
+        self,
+        session_ids: List[UUID]
+    ) -> Dict[UUID, int]:
+        """
+        Count messages for each of several sessions in one query.
+
+        Args:
+            session_ids: List of session UUIDs
+
+        Returns:
+            Mapping of session UUID to message count (0 for sessions
+            without messages)
+        """
+        counts = {session_id: 0 for session_id in session_ids}
+        if not session_ids:
+            return counts
+
+        stmt = (
+            select(Message.session_id, func.count())
+            .where(Message.session_id.in_(session_ids))
+            .group_by(Message.session_id)
+        )
+        result = await self.session.execute(stmt)
+        counts.update(result.tuples().all())
+        return counts
+
     async def exists(self, message_id: UUID) -> bool:
         """
         Check if a message exists.
@@ -337,7 +766,8 @@ class MessageRepository:
         Returns:
             True if message exists, False otherwise
         """
-        return await self.get_by_id(message_id) is not None
+        result = await self.session.execute(_EXISTS, {"message_id": message_id})
+        return bool(result.scalar())
 
     async def search_by_content(
         self,
@@ -354,27 +784,98 @@ class MessageRepository:
             limit: Maximum number of results
 
         Returns:
-            List of matching Message instances
+            List of matching Message instances with Message.session loaded
+        """
+        stmt = self._search_query(user_id, query).limit(limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def stream_by_content(
+        self,
+        user_id: str,
+        query: str,
+        limit: Optional[int] = None
+    ) -> AsyncScalarResult[Message]:
+        """
+        Stream messages matching a content search, newest first.
+
+        Same results as search_by_content, but rows are fetched from a
+        server-side cursor STREAM_YIELD_PER at a time, so callers that
+        stop early never load the rest. Close the result when stopping
+        before it is exhausted.
+
+        Args:
+            user_id: User identifier
+            query: Search query string
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            Async iterator of Message instances with Message.session loaded
         """
-        # Get user's sessions
-        from src.db.repositories.session_repo import SessionRepository
+        stmt = self._search_query(user_id, query)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return await self.session.stream_scalars(
+            stmt.execution_options(yield_per=STREAM_YIELD_PER)
+        )
 
-        # Get messages from user's sessions that match query
-        search_pattern = f"%{query}%"
+    async def search_by_content_for_user(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 10
+    ) -> List[Message]:
+        """
+        Find the latest matching message of each of a user's sessions.
+
+        Deduplication by session and the limit are applied in SQL with
+        ``DISTINCT ON (session_id)``, so one query returns at most one
+        message per session regardless of how many messages match.
+
+        Args:
+            user_id: User identifier
+            query: Search query string
+            limit: Maximum number of sessions
+
+        Returns:
+            List of Message instances with Message.session loaded, newest
+            first
+        """
+        latest = (
+            self._search_query(user_id, query)
+            .with_only_columns(Message.id)
+            .ext(distinct_on(Message.session_id))
+            .order_by(None)
+            .order_by(Message.session_id, Message.created_at.desc())
+            .subquery()
+        )
         stmt = (
             select(Message)
-            .join(Session, Message.session_id == Session.id)
+            .join(latest, Message.id == latest.c.id)
+            .join(Message.session)
+            .options(contains_eager(Message.session))
+            .order_by(Message.created_at.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    def _search_query(self, user_id: str, query: str) -> Select:
+        """Build the content search SELECT shared by search reads."""
+        # Get messages from user's sessions that match query; the joined
+        # Session row populates Message.session without extra queries.
+        # autoescape makes % and _ in the query match literally.
+        return (
+            select(Message)
+            .join(Message.session)
             .where(and_(
                 Session.user_id == user_id,
-                Message.content.ilike(search_pattern)
+                Message.content.icontains(query, autoescape=True)
             ))
+            .options(contains_eager(Message.session))
             .order_by(Message.created_at.desc())
-            .limit(limit)
         )
 
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
-
     async def get_recent_messages(
         self,
         limit: int = 50
@@ -395,7 +896,32 @@ class MessageRepository:
         )
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def stream_recent_rows(
+        self,
+        limit: int = 50
+    ) -> AsyncIterator[RowMapping]:
+        """
+        Stream recent messages across all sessions as lightweight rows.
+
+        Selects only id, session_id, role, content and created_at, so no
+        ORM objects are built or added to the identity map.
+
+        Args:
+            limit: Maximum number of results
+
+        Returns:
+            Async iterator of row mappings, newest first
+        """
+        stmt = (
+            select(*self._row_columns())
+            .order_by(Message.created_at.desc())
+            .limit(limit)
+            .execution_options(yield_per=STREAM_YIELD_PER)
+        )
+        result = await self.session.stream(stmt)
+        return result.mappings()
 
     async def get_messages_after_timestamp(
         self,
@@ -424,7 +950,48 @@ class MessageRepository:
         )
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def stream_rows_after_timestamp(
+        self,
+        session_id: UUID,
+        timestamp: datetime
+    ) -> AsyncIterator[RowMapping]:
+        """
+        Stream a session's messages created after a timestamp as rows.
+
+        Row-based counterpart of get_messages_after_timestamp for
+        incremental reads that only need the message columns.
+
+        Args:
+            session_id: Session UUID
+            timestamp: Timestamp to filter from
+
+        Returns:
+            Async iterator of row mappings ordered chronologically
+        """
+        stmt = (
+            select(*self._row_columns())
+            .where(and_(
+                Message.session_id == session_id,
+                Message.created_at > timestamp
+            ))
+            .order_by(Message.created_at.asc())
+            .execution_options(yield_per=STREAM_YIELD_PER)
+        )
+        result = await self.session.stream(stmt)
+        return result.mappings()
+
+    @staticmethod
+    def _row_columns() -> Tuple:
+        """Columns selected by the row-based list reads."""
+        return (
+            Message.id,
+            Message.session_id,
+            Message.role,
+            Message.content,
+            Message.created_at,
+        )
 
     async def get_messages_with_tool_calls(
         self,
@@ -439,16 +1006,19 @@ class MessageRepository:
             session_id: Session UUID
 
         Returns:
-            List of Message instances with tool calls
+            List of Message instances with tool calls loaded
         """
-        from src.db.models import ToolCall
-
+        # EXISTS filter keeps one row per message; tool calls are then
+        # loaded for all of them in a single extra SELECT
         stmt = (
             select(Message)
-            .join(ToolCall, Message.id == ToolCall.message_id)
-            .where(Message.session_id == session_id)
+            .where(and_(
+                Message.session_id == session_id,
+                Message.tool_calls.any()
+            ))
+            .options(selectinload(Message.tool_calls))
             .order_by(Message.created_at.asc())
         )
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
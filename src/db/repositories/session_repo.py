@@ -5,14 +5,33 @@ Provides CRUD operations for agent_sessions table.
 """
 
 from typing import Optional, List
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, exists, update, delete, func, and_, bindparam, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import Session, SessionStatus
 from src.db.base import Base
 
+# Prebuilt statements for per-request lookups, filled via typed bind parameters
+_BY_ID = select(Session).where(
+    Session.id == bindparam("session_id", type_=Session.id.type)
+)
+_EXISTS = select(exists().where(
+    Session.id == bindparam("session_id", type_=Session.id.type)
+))
+
+
+def _status_is(status: SessionStatus):
+    """
+    Build a status filter with the value rendered inline.
+
+    A bound parameter would let PostgreSQL cache a generic plan that
+    cannot use the partial indexes on active sessions; the inline
+    literal keeps them usable (there are only a few status values).
+    """
+    return Session.status == literal(status, Session.status.type, literal_execute=True)
+
 
 class SessionRepository:
     """Repository for Session model."""
@@ -34,28 +53,34 @@ class SessionRepository:
         self,
         user_id: str,
         title: Optional[str] = None,
-        meta: Optional[dict] = None
+        meta: Optional[dict] = None,
+        flush: bool = False
     ) -> Session:
         """
         Create a new session.
 
+        The row is written with the surrounding transaction; pass
+        ``flush=True`` only when it must exist in the database before then.
+
         Args:
             user_id: User identifier
             title: Optional session title
             meta: Optional metadata dictionary
+            flush: Flush the insert immediately
 
         Returns:
             Created Session instance
         """
         session = Session(
+            id=uuid4(),
             user_id=user_id,
             title=title,
             status=SessionStatus.ACTIVE,
             meta=meta or {}
         )
         self.session.add(session)
-        await self.session.flush()
-        await self.session.refresh(session)
+        if flush:
+            await self.session.flush()
         return session
 
     async def get_by_id(self, session_id: UUID) -> Optional[Session]:
@@ -68,8 +93,7 @@ class SessionRepository:
         Returns:
             Session if found, None otherwise
         """
-        stmt = select(Session).where(Session.id == session_id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_BY_ID, {"session_id": session_id})
         return result.scalar_one_or_none()
 
     async def get_by_user_id(
@@ -99,10 +123,10 @@ class SessionRepository:
             .offset(offset)
         )
         if status is not None:
-            stmt = stmt.where(Session.status == status)
+            stmt = stmt.where(_status_is(status))
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_active_sessions(
         self,
@@ -144,38 +168,43 @@ class SessionRepository:
         Returns:
             Updated Session if found, None otherwise
         """
-        session = await self.get_by_id(session_id)
-        if session is None:
-            return None
+        values = {
+            key: value
+            for key, value in (("title", title), ("status", status), ("meta", meta))
+            if value is not None
+        }
+        if not values:
+            return await self.get_by_id(session_id)
 
-        if title is not None:
-            session.title = title
-        if status is not None:
-            session.status = status
-        if meta is not None:
-            session.meta = meta
-
-        await self.session.flush()
-        await self.session.refresh(session)
-        return session
+        stmt = (
+            update(Session)
+            .where(Session.id == session_id)
+            .values(**values)
+            .returning(Session)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def delete(self, session_id: UUID) -> bool:
         """
         Delete a session by ID.
 
+        Child rows are removed by the ON DELETE CASCADE foreign keys.
+
         Args:
             session_id: Session UUID
 
         Returns:
             True if deleted, False if not found
         """
-        session = await self.get_by_id(session_id)
-        if session is None:
-            return False
-
-        await self.session.delete(session)
-        await self.session.flush()
-        return True
+        stmt = (
+            delete(Session)
+            .where(Session.id == session_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
 
     async def soft_delete(self, session_id: UUID) -> Optional[Session]:
         """
@@ -228,7 +257,7 @@ class SessionRepository:
         """
         stmt = select(func.count()).select_from(Session).where(Session.user_id == user_id)
         if status is not None:
-            stmt = stmt.where(Session.status == status)
+            stmt = stmt.where(_status_is(status))
 
         result = await self.session.execute(stmt)
         return result.scalar_one()
@@ -243,7 +272,8 @@ class SessionRepository:
         Returns:
             True if session exists, False otherwise
         """
-        return await self.get_by_id(session_id) is not None
+        result = await self.session.execute(_EXISTS, {"session_id": session_id})
+        return bool(result.scalar())
 
     async def search_by_title(
         self,
@@ -262,19 +292,19 @@ class SessionRepository:
         Returns:
             List of matching Session instances
         """
-        search_pattern = f"%{query}%"
+        # autoescape makes % and _ in the query match literally
         stmt = (
             select(Session)
             .where(and_(
                 Session.user_id == user_id,
-                Session.title.ilike(search_pattern)
+                Session.title.icontains(query, autoescape=True)
             ))
             .order_by(Session.created_at.desc())
             .limit(limit)
         )
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_recent_sessions(
         self,
@@ -291,10 +321,10 @@ class SessionRepository:
         """
         stmt = (
             select(Session)
-            .where(Session.status == SessionStatus.ACTIVE)
+            .where(_status_is(SessionStatus.ACTIVE))
             .order_by(Session.created_at.desc())
             .limit(limit)
         )
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
@@ -0,0 +1,185 @@
+"""
+Session summary repository for database operations.
+
+Provides CRUD operations for agent_session_summaries table.
+"""
+
+from typing import Optional, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, insert, and_, desc, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import Message, SessionSummary
+
+
+class SessionSummaryRepository:
+    """Repository for SessionSummary model."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository with a database session.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+
+    # ========================================
+    # CRUD Operations
+    # ========================================
+
+    async def create(
+        self,
+        session_id: UUID,
+        up_to_message_id: UUID,
+        message_count: int,
+        content: str,
+        start_message_id: Optional[UUID] = None,
+        is_chunk: bool = False,
+        flush: bool = False
+    ) -> SessionSummary:
+        """
+        Create a new session summary.
+
+        Args:
+            session_id: Parent session UUID
+            up_to_message_id: UUID of the newest summarized message
+            message_count: Number of messages summarized
+            content: Summary text
+            start_message_id: UUID of the oldest summarized message
+            is_chunk: Whether this is an incremental compression chunk
+            flush: Flush the insert immediately instead of with the transaction
+
+        Returns:
+            Created SessionSummary instance
+        """
+        summary = SessionSummary(
+            id=uuid4(),
+            session_id=session_id,
+            start_message_id=start_message_id,
+            up_to_message_id=up_to_message_id,
+            message_count=message_count,
+            content=content,
+            is_chunk=is_chunk
+        )
+        self.session.add(summary)
+        if flush:
+            await self.session.flush()
+        return summary
+
+    async def create_chunks(
+        self,
+        session_id: UUID,
+        chunks: List[dict]
+    ) -> List[SessionSummary]:
+        """
+        Create several compression chunk summaries with one INSERT.
+
+        Args:
+            session_id: Parent session UUID
+            chunks: Dicts with start_message_id, up_to_message_id,
+                message_count and content, oldest chunk first
+
+        Returns:
+            Created SessionSummary instances, oldest first
+        """
+        if not chunks:
+            return []
+
+        values = [
+            {
+                "id": uuid4(),
+                "session_id": session_id,
+                "start_message_id": chunk["start_message_id"],
+                "up_to_message_id": chunk["up_to_message_id"],
+                "message_count": chunk["message_count"],
+                "content": chunk["content"],
+                "is_chunk": True,
+            }
+            for chunk in chunks
+        ]
+        stmt = insert(SessionSummary).values(values).returning(SessionSummary)
+        result = await self.session.scalars(stmt)
+        # RETURNING order isn't guaranteed; return rows in input order
+        by_id = {summary.id: summary for summary in result.all()}
+        return [by_id[value["id"]] for value in values]
+
+    async def get(
+        self,
+        session_id: UUID,
+        up_to_message_id: UUID,
+        message_count: int
+    ) -> Optional[SessionSummary]:
+        """
+        Get the conversation summary covering an exact message window.
+
+        Args:
+            session_id: Session UUID
+            up_to_message_id: UUID of the newest summarized message
+            message_count: Number of messages summarized
+
+        Returns:
+            SessionSummary if found, None otherwise
+        """
+        stmt = select(SessionSummary).where(
+            and_(
+                SessionSummary.session_id == session_id,
+                SessionSummary.up_to_message_id == up_to_message_id,
+                SessionSummary.message_count == message_count,
+                SessionSummary.is_chunk.is_(False)
+            )
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_latest(self, session_id: UUID) -> Optional[SessionSummary]:
+        """
+        Get the most recently created summary for a session.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            SessionSummary if any exists, None otherwise
+        """
+        stmt = (
+            select(SessionSummary)
+            .where(SessionSummary.session_id == session_id)
+            .order_by(desc(SessionSummary.created_at))
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_chunks(self, session_id: UUID) -> List[SessionSummary]:
+        """
+        Get the compression chunk summaries for a session.
+
+        Chunks are ordered by the position of their newest summarized
+        message in the conversation, not by when they were stored, so
+        chunks written by overlapping compressions still come out in
+        conversation order. A chunk whose message was deleted falls back
+        to its own creation time.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            List of chunk SessionSummary instances, oldest first
+        """
+        stmt = (
+            select(SessionSummary)
+            .outerjoin(Message, Message.id == SessionSummary.up_to_message_id)
+            .where(and_(
+                SessionSummary.session_id == session_id,
+                SessionSummary.is_chunk.is_(True)
+            ))
+            .order_by(
+                func.coalesce(Message.created_at, SessionSummary.created_at).asc(),
+                Message.id.asc(),
+                SessionSummary.created_at.asc()
+            )
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
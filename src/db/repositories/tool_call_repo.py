@@ -4,16 +4,54 @@ Tool call repository for database operations.
 Provides CRUD operations for agent_tool_calls table.
 """
 
+import logging
+import re
 from typing import Optional, List
-from uuid import UUID
-from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, func, and_, desc
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    Integer, Select, select, insert, update, delete, func, and_, bindparam, desc, literal, text
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
 
 from src.db.models import ToolCall, ToolCallStatus, Message, Session
 from src.db.base import Base
 
+logger = logging.getLogger("orbit.db.tool_calls")
+
+# Rows fetched per round-trip when streaming large result sets
+STREAM_YIELD_PER = 500
+
+# agent_tool_calls is range-partitioned by month on created_at
+_PARTITION_PREFIX = f"{ToolCall.__tablename__}_p"
+_PARTITION_NAME = re.compile(rf"^{_PARTITION_PREFIX}(\d{{4}})(\d{{2}})$")
+_LIST_PARTITIONS = text(
+    "SELECT c.relname FROM pg_inherits i "
+    "JOIN pg_class c ON c.oid = i.inhrelid "
+    f"WHERE i.inhparent = '{ToolCall.__tablename__}'::regclass"
+)
+
+
+def _month_start(year: int, month: int) -> datetime:
+    """Return the first instant of a month in UTC, normalizing overflowed months."""
+    year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+    return datetime(year, month, 1, tzinfo=timezone.utc)
+
+
+# Prebuilt statements for the hot lookups, filled via typed bind parameters
+_COUNT_BY_SESSION = select(func.count()).select_from(ToolCall).where(
+    ToolCall.session_id == bindparam("session_id", type_=ToolCall.session_id.type)
+)
+_BY_SESSION = (
+    select(ToolCall)
+    .where(ToolCall.session_id == bindparam("session_id", type_=ToolCall.session_id.type))
+    .order_by(ToolCall.created_at.desc())
+    .limit(bindparam("limit", type_=Integer))
+    .offset(bindparam("offset", type_=Integer))
+)
+
 
 class ToolCallRepository:
     """Repository for ToolCall model."""
@@ -36,7 +74,8 @@ class ToolCallRepository:
         session_id: UUID,
         tool_name: str,
         inputs: dict,
-        message_id: Optional[UUID] = None
+        message_id: Optional[UUID] = None,
+        flush: bool = False
     ) -> ToolCall:
         """
         Create a new tool call with PENDING status.
@@ -46,11 +85,13 @@ class ToolCallRepository:
             tool_name: Name of the tool being called
             inputs: Input parameters for the tool
             message_id: Optional related message UUID
+            flush: Flush the insert immediately instead of with the transaction
 
         Returns:
             Created ToolCall instance
         """
         tool_call = ToolCall(
+            id=uuid4(),
             session_id=session_id,
             tool_name=tool_name,
             inputs=inputs,
@@ -58,23 +99,56 @@ class ToolCallRepository:
             message_id=message_id
         )
         self.session.add(tool_call)
-        await self.session.flush()
-        await self.session.refresh(tool_call)
+        if flush:
+            await self.session.flush()
         return tool_call
 
+    async def create_many(self, rows: List[dict]) -> List[ToolCall]:
+        """
+        Create several PENDING tool calls with one batched INSERT ... RETURNING.
+
+        Meant for an agent step that issues several tool calls at once.
+
+        Args:
+            rows: Dicts with session_id, tool_name, inputs and optional
+                message_id (and optionally a pre-generated id)
+
+        Returns:
+            Created ToolCall instances, in the same order as rows
+        """
+        if not rows:
+            return []
+
+        values = [
+            {
+                "id": row.get("id") or uuid4(),
+                "session_id": row["session_id"],
+                "tool_name": row["tool_name"],
+                "inputs": row["inputs"],
+                "status": ToolCallStatus.PENDING,
+                "message_id": row.get("message_id"),
+            }
+            for row in rows
+        ]
+        stmt = insert(ToolCall).returning(ToolCall, sort_by_parameter_order=True)
+        result = await self.session.scalars(stmt, values)
+        return result.all()
+
     async def get_by_id(self, tool_call_id: UUID) -> Optional[ToolCall]:
         """
         Get a tool call by ID.
 
+        Served from the session's identity map when the call was already
+        loaded, created or updated in this session (e.g. by the mark_*
+        methods), so repeated lookups within a turn skip the SELECT.
+
         Args:
             tool_call_id: ToolCall UUID
 
         Returns:
             ToolCall if found, None otherwise
         """
-        stmt = select(ToolCall).where(ToolCall.id == tool_call_id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self.session.get(ToolCall, UUID(str(tool_call_id)))
 
     async def get_by_session_id(
         self,
@@ -97,20 +171,77 @@ class ToolCallRepository:
         Returns:
             List of ToolCall instances
         """
+        stmt = _BY_SESSION
+        if status is not None:
+            stmt = stmt.where(ToolCall.status == status)
+        if tool_name is not None:
+            stmt = stmt.where(ToolCall.tool_name == tool_name)
+
+        result = await self.session.execute(
+            stmt, {"session_id": session_id, "limit": limit, "offset": offset}
+        )
+        return result.scalars().all()
+
+    async def get_ids_by_session_id(
+        self,
+        session_id: UUID,
+        status: Optional[ToolCallStatus] = None
+    ) -> List[UUID]:
+        """
+        Get IDs of a session's tool calls, newest first.
+
+        ID-only counterpart of get_by_session_id for callers that don't
+        read the inputs/outputs payloads.
+
+        Args:
+            session_id: Session UUID
+            status: Optional status filter
+
+        Returns:
+            List of ToolCall UUIDs
+        """
         stmt = (
-            select(ToolCall)
+            select(ToolCall.id)
             .where(ToolCall.session_id == session_id)
             .order_by(ToolCall.created_at.desc())
-            .limit(limit)
-            .offset(offset)
         )
         if status is not None:
             stmt = stmt.where(ToolCall.status == status)
-        if tool_name is not None:
-            stmt = stmt.where(ToolCall.tool_name == tool_name)
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def stream_by_session_id(
+        self,
+        session_id: UUID,
+        status: Optional[ToolCallStatus] = None,
+        yield_per: int = STREAM_YIELD_PER
+    ) -> AsyncScalarResult[ToolCall]:
+        """
+        Stream all of a session's tool calls, newest first.
+
+        For exports and analytics over large sessions: rows come from a
+        server-side cursor ``yield_per`` at a time instead of being loaded
+        at once. Close the result when stopping before it is exhausted.
+
+        Args:
+            session_id: Session UUID
+            status: Optional status filter
+            yield_per: Rows fetched per round-trip
+
+        Returns:
+            Async iterator of ToolCall instances
+        """
+        stmt = (
+            select(ToolCall)
+            .where(ToolCall.session_id == session_id)
+            .order_by(ToolCall.created_at.desc())
+            .execution_options(yield_per=yield_per)
+        )
+        if status is not None:
+            stmt = stmt.where(ToolCall.status == status)
+
+        return await self.session.stream_scalars(stmt)
 
     async def get_by_message_id(
         self,
@@ -132,7 +263,7 @@ class ToolCallRepository:
         )
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def update_status(
         self,
@@ -155,21 +286,24 @@ class ToolCallRepository:
         Returns:
             Updated ToolCall if found, None otherwise
         """
-        tool_call = await self.get_by_id(tool_call_id)
-        if tool_call is None:
-            return None
-
-        tool_call.status = status
-        if outputs is not None:
-            tool_call.outputs = outputs
-        if execution_time_ms is not None:
-            tool_call.execution_time_ms = execution_time_ms
-        if error_message is not None:
-            tool_call.error_message = error_message
+        values = {"status": status}
+        for key, value in (
+            ("outputs", outputs),
+            ("execution_time_ms", execution_time_ms),
+            ("error_message", error_message),
+        ):
+            if value is not None:
+                values[key] = value
 
-        await self.session.flush()
-        await self.session.refresh(tool_call)
-        return tool_call
+        stmt = (
+            update(ToolCall)
+            .where(ToolCall.id == tool_call_id)
+            .values(**values)
+            .returning(ToolCall)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def mark_running(self, tool_call_id: UUID) -> Optional[ToolCall]:
         """
@@ -240,13 +374,15 @@ class ToolCallRepository:
         Returns:
             True if deleted, False if not found
         """
-        tool_call = await self.get_by_id(tool_call_id)
-        if tool_call is None:
-            return False
-
-        await self.session.delete(tool_call)
-        await self.session.flush()
-        return True
+        # "evaluate" also drops the row from the identity map, so get_by_id
+        # does not return it afterwards
+        stmt = (
+            delete(ToolCall)
+            .where(ToolCall.id == UUID(str(tool_call_id)))
+            .execution_options(synchronize_session="evaluate")
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
 
     # ========================================
     # Query Operations
@@ -267,11 +403,11 @@ class ToolCallRepository:
         Returns:
             Number of tool calls
         """
-        stmt = select(func.count()).select_from(ToolCall).where(ToolCall.session_id == session_id)
+        stmt = _COUNT_BY_SESSION
         if status is not None:
             stmt = stmt.where(ToolCall.status == status)
 
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(stmt, {"session_id": session_id})
         return result.scalar_one()
 
     async def count_by_tool_name(
@@ -309,15 +445,37 @@ class ToolCallRepository:
         Returns:
             List of pending ToolCall instances
         """
-        stmt = (
-            select(ToolCall)
-            .where(ToolCall.status == ToolCallStatus.PENDING)
-            .order_by(ToolCall.created_at.asc())
-            .limit(limit)
-        )
+        stmt = self._pending_query(ToolCall).limit(limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
 
+    async def get_pending_ids(self, limit: int = 50) -> List[UUID]:
+        """
+        Get IDs of pending tool calls, oldest first.
+
+        Use this instead of get_pending_calls when dispatching by ID:
+        no ToolCall objects are built or added to the identity map.
+
+        Args:
+            limit: Maximum number of results
+
+        Returns:
+            List of pending ToolCall UUIDs
+        """
+        stmt = self._pending_query(ToolCall.id).limit(limit)
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    def _pending_query(self, *columns) -> Select:
+        """Build the oldest-first pending calls SELECT."""
+        return (
+            select(*columns)
+            .where(ToolCall.status == literal(
+                # Inline so generic plans can use the partial pending index
+                ToolCallStatus.PENDING, ToolCall.status.type, literal_execute=True
+            ))
+            .order_by(ToolCall.created_at.asc())
+        )
 
     async def get_failed_calls(
         self,
@@ -374,25 +532,27 @@ class ToolCallRepository:
         Returns:
             Dictionary with call counts by status and tool name
         """
-        # Count by status
-        status_stmt = (
-            select(ToolCall.status, func.count())
-            .where(ToolCall.session_id == session_id)
-            .group_by(ToolCall.status)
-        )
-
-        status_result = await self.session.execute(status_stmt)
-        status_counts = {row[0]: row[1] for row in status_result}
-
-        # Count by tool name
-        tool_stmt = (
-            select(ToolCall.tool_name, func.count())
+        # Both counts in one scan: GROUPING SETS yields one row per status
+        # and one per tool name; GROUPING(status) is 0 on the status rows
+        stmt = (
+            select(
+                ToolCall.status,
+                ToolCall.tool_name,
+                func.count(),
+                func.grouping(ToolCall.status)
+            )
             .where(ToolCall.session_id == session_id)
-            .group_by(ToolCall.tool_name)
+            .group_by(func.grouping_sets(ToolCall.status, ToolCall.tool_name))
         )
 
-        tool_result = await self.session.execute(tool_stmt)
-        tool_counts = {row[0]: row[1] for row in tool_result}
+        status_counts = {}
+        tool_counts = {}
+        result = await self.session.execute(stmt)
+        for status, tool_name, count, status_grouping in result:
+            if status_grouping == 0:
+                status_counts[status] = count
+            else:
+                tool_counts[tool_name] = count
 
         return {
             "by_status": status_counts,
@@ -435,6 +595,50 @@ class ToolCallRepository:
             "max_ms": row[2],
         }
 
+    async def get_session_dashboard(self, session_id: UUID) -> dict:
+        """
+        Get all tool call metrics for a session in one query.
+
+        Combines count_by_session_id, the per-status counts of
+        get_tool_statistics and get_execution_time_stats into a single
+        scan using aggregate FILTER clauses.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Dictionary with total, by_status counts and avg/min/max
+            execution times of completed calls
+        """
+        completed = and_(
+            ToolCall.status == ToolCallStatus.COMPLETED,
+            ToolCall.execution_time_ms.is_not(None)
+        )
+        stmt = (
+            select(
+                func.count().label("total"),
+                *(
+                    func.count().filter(ToolCall.status == status).label(status.value)
+                    for status in ToolCallStatus
+                ),
+                func.avg(ToolCall.execution_time_ms).filter(completed).label("avg_ms"),
+                func.min(ToolCall.execution_time_ms).filter(completed).label("min_ms"),
+                func.max(ToolCall.execution_time_ms).filter(completed).label("max_ms"),
+            )
+            .where(ToolCall.session_id == session_id)
+        )
+
+        result = await self.session.execute(stmt)
+        row = result.one()._mapping
+
+        return {
+            "total": row["total"],
+            "by_status": {status: row[status.value] for status in ToolCallStatus},
+            "avg_ms": row["avg_ms"],
+            "min_ms": row["min_ms"],
+            "max_ms": row["max_ms"],
+        }
+
     async def get_recent_calls(
         self,
         limit: int = 50
@@ -455,7 +659,7 @@ class ToolCallRepository:
         )
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_calls_in_date_range(
         self,
@@ -474,6 +678,44 @@ class ToolCallRepository:
         Returns:
             List of ToolCall instances within range
         """
+        stmt = self._date_range_query(start_date, end_date, status)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def stream_calls_in_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        status: Optional[ToolCallStatus] = None,
+        yield_per: int = STREAM_YIELD_PER
+    ) -> AsyncScalarResult[ToolCall]:
+        """
+        Stream tool calls within a date range, newest first.
+
+        Streaming counterpart of get_calls_in_date_range; see
+        stream_by_session_id.
+
+        Args:
+            start_date: Start of date range
+            end_date: End of date range
+            status: Optional status filter
+            yield_per: Rows fetched per round-trip
+
+        Returns:
+            Async iterator of ToolCall instances
+        """
+        stmt = self._date_range_query(start_date, end_date, status)
+        return await self.session.stream_scalars(
+            stmt.execution_options(yield_per=yield_per)
+        )
+
+    def _date_range_query(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        status: Optional[ToolCallStatus]
+    ) -> Select:
+        """Build the date range SELECT shared by list and stream reads."""
         stmt = (
             select(ToolCall)
             .where(and_(
@@ -482,12 +724,9 @@ class ToolCallRepository:
             ))
             .order_by(ToolCall.created_at.desc())
         )
-
         if status is not None:
             stmt = stmt.where(ToolCall.status == status)
-
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return stmt
 
     async def get_slow_calls(
         self,
@@ -507,22 +746,121 @@ class ToolCallRepository:
         stmt = (
             select(ToolCall)
             .where(and_(
-                ToolCall.status == ToolCallStatus.COMPLETED,
-                ToolCall.execution_time_ms > threshold_ms
+                ToolCall.execution_time_ms > threshold_ms,
+                # Inline so generic plans can use the partial slow-call index
+                ToolCall.status == literal(
+                    ToolCallStatus.COMPLETED, ToolCall.status.type, literal_execute=True
+                )
             ))
             .order_by(desc(ToolCall.execution_time_ms))
             .limit(limit)
         )
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def ensure_partitions(self, months_ahead: int = 2) -> List[str]:
+        """
+        Create the monthly partitions for this month and the next ones.
+
+        Also creates the default partition, which catches rows outside
+        every monthly range. Rows the default partition already holds for
+        a new month are moved into that month's partition. Each partition
+        is created in its own savepoint, so one failure doesn't stop the
+        others. Safe to call repeatedly; call it periodically so a
+        long-running process never writes a whole month into the default
+        partition.
+
+        Args:
+            months_ahead: Number of future months to create (default: 2)
+
+        Returns:
+            Names of the partitions created
+        """
+        table = ToolCall.__tablename__
+        now = datetime.now(timezone.utc)
+
+        await self.session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+        ))
+        existing = set((await self.session.execute(_LIST_PARTITIONS)).scalars())
+
+        created = []
+        for offset in range(months_ahead + 1):
+            start = _month_start(now.year, now.month + offset)
+            end = _month_start(start.year, start.month + 1)
+            name = f"{_PARTITION_PREFIX}{start:%Y%m}"
+            if name in existing:
+                continue
+            try:
+                async with self.session.begin_nested():
+                    await self._create_partition(name, start, end)
+            except SQLAlchemyError as e:
+                logger.warning(f"Could not create tool call partition {name}: {e}")
+            else:
+                created.append(name)
+        return created
+
+    async def _create_partition(self, name: str, start: datetime, end: datetime) -> None:
+        """
+        Create one monthly partition.
+
+        Postgres refuses to create a partition over rows that the default
+        partition holds for its range. In that case the partition is built
+        as a plain table, the rows are moved into it and it is attached.
+
+        Args:
+            name: Partition table name
+            start: First instant of the month
+            end: First instant of the next month
+        """
+        table = ToolCall.__tablename__
+        default = f"{table}_default"
+        bounds = f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        in_range = f"created_at >= '{start.isoformat()}' AND created_at < '{end.isoformat()}'"
+
+        has_rows = await self.session.scalar(
+            text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_range})")
+        )
+        if not has_rows:
+            await self.session.execute(text(f'CREATE TABLE "{name}" PARTITION OF {table} {bounds}'))
+            return
+
+        # Hold off inserts into the default partition until the move is done
+        await self.session.execute(text(f"LOCK TABLE {default} IN EXCLUSIVE MODE"))
+        await self.session.execute(text(
+            f'CREATE TABLE "{name}" (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        ))
+        await self.session.execute(text(f'INSERT INTO "{name}" SELECT * FROM {default} WHERE {in_range}'))
+        await self.session.execute(text(f"DELETE FROM {default} WHERE {in_range}"))
+        await self.session.execute(text(f'ALTER TABLE {table} ATTACH PARTITION "{name}" {bounds}'))
+
+    async def _expired_partitions(self, cutoff: datetime) -> List[str]:
+        """List monthly partitions whose whole range is older than cutoff."""
+        result = await self.session.execute(_LIST_PARTITIONS)
+
+        expired = []
+        for name in result.scalars():
+            match = _PARTITION_NAME.match(name)
+            if match is None:
+                continue
+            end = _month_start(int(match.group(1)), int(match.group(2)) + 1)
+            if end <= cutoff:
+                expired.append(name)
+        return expired
 
     async def cleanup_old_calls(
         self,
         days: int = 30
     ) -> int:
         """
-        Delete old completed/failed tool calls.
+        Delete old tool calls.
+
+        Upcoming monthly partitions are created first (see
+        ensure_partitions). Monthly partitions entirely older than the
+        cutoff are dropped whole, whatever the status of their calls.
+        Completed/failed calls older than the cutoff in the remaining
+        partitions are deleted row by row.
 
         Useful for database cleanup/maintenance.
 
@@ -532,21 +870,24 @@ class ToolCallRepository:
         Returns:
             Number of deleted records
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        await self.ensure_partitions()
+
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        deleted = 0
+
+        for name in await self._expired_partitions(cutoff_date):
+            count = await self.session.scalar(text(f'SELECT count(*) FROM "{name}"'))
+            await self.session.execute(text(f'DROP TABLE "{name}"'))
+            deleted += count
 
         stmt = (
-            select(ToolCall)
+            delete(ToolCall)
             .where(and_(
                 ToolCall.created_at < cutoff_date,
                 ToolCall.status.in_([ToolCallStatus.COMPLETED, ToolCallStatus.FAILED])
             ))
+            .execution_options(synchronize_session=False)
         )
 
         result = await self.session.execute(stmt)
-        tool_calls = list(result.scalars().all())
-
-        for tool_call in tool_calls:
-            await self.session.delete(tool_call)
-
-        await self.session.flush()
-        return len(tool_calls)
+        return deleted + result.rowcount
@@ -0,0 +1,402 @@
+"""
+Write-behind buffers for message and checkpoint inserts.
+
+Coalesce concurrent writes into a single multi-row INSERT so the
+per-statement round-trip and commit cost is shared across callers.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import Insert, insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.db.engine import async_session
+from src.db.models import AgentState, Message, MessageRole, Session, SessionStatus
+from src.db.repositories.message_repo import MessageRepository
+
+logger = logging.getLogger("orbit.db.write_buffer")
+
+
+def upsert_checkpoint_sessions(session_ids: Iterable[UUID]) -> Insert:
+    """
+    Build an INSERT creating the sessions of checkpoint threads.
+
+    Sessions that already exist are left untouched (ON CONFLICT DO
+    NOTHING), so no SELECT is needed beforehand.
+
+    Args:
+        session_ids: Thread/session IDs
+
+    Returns:
+        INSERT statement
+    """
+    return pg_insert(Session).values([
+        {"id": session_id, "user_id": "system", "status": SessionStatus.ACTIVE}
+        for session_id in session_ids
+    ]).on_conflict_do_nothing(index_elements=[Session.id])
+
+
+def insert_checkpoints(rows: List[Dict[str, Any]]) -> Insert:
+    """
+    Build one statement inserting checkpoints and their sessions.
+
+    The session upsert runs as a data-modifying CTE of the agent_states
+    INSERT, so both go to the server in a single round-trip. Foreign keys
+    are checked at the end of the statement, after the CTE has run.
+
+    Args:
+        rows: agent_states rows, including session_id
+
+    Returns:
+        INSERT statement
+    """
+    sessions = upsert_checkpoint_sessions({row["session_id"] for row in rows})
+    return insert(AgentState).values(rows).add_cte(sessions.cte("checkpoint_sessions"))
+
+
+# Lets a checkpoint transaction commit without waiting for its WAL flush
+_ASYNC_COMMIT = text("SET LOCAL synchronous_commit = off")
+
+
+async def write_checkpoints(session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert checkpoints in the session's current transaction.
+
+    Batches of CHECKPOINT_COPY_MIN_ROWS or more are written with COPY.
+    Unless CHECKPOINT_SYNCHRONOUS_COMMIT is set, the transaction commits
+    asynchronously: the commit returns before the WAL is flushed to disk,
+    so a database crash can lose the last few checkpoints (never corrupt
+    them).
+
+    Args:
+        session: Session whose transaction is committed by the caller
+        rows: agent_states rows, including session_id
+    """
+    if not settings.CHECKPOINT_SYNCHRONOUS_COMMIT:
+        await session.execute(_ASYNC_COMMIT)
+
+    if len(rows) < settings.CHECKPOINT_COPY_MIN_ROWS:
+        await session.execute(insert_checkpoints(rows))
+        return
+
+    # Large batches are streamed with COPY, which skips per-row parsing;
+    # COPY can't carry the session upsert, so that goes first
+    await session.execute(upsert_checkpoint_sessions({row["session_id"] for row in rows}))
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        AgentState.__tablename__,
+        records=[(row["id"], row["session_id"], row["state"]) for row in rows],
+        columns=["id", "session_id", "state"],
+    )
+
+
+# Queued by stop() to tell the flusher to finish after the rows ahead of it
+_STOP = object()
+
+
+class _WriteBuffer(ABC):
+    """
+    Background flusher shared by the write buffers.
+
+    Drains up to ``max_batch`` queued items (or whatever arrived within
+    ``max_delay`` seconds of the first one) and hands them to ``_flush``.
+    """
+
+    def __init__(
+        self,
+        max_batch: int,
+        max_delay: float,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            max_batch: Maximum rows per INSERT
+            max_delay: Maximum seconds to wait for a batch to fill
+            session_factory: Factory for the sessions used by flushes
+        """
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flusher is running and accepting rows."""
+        return not self._stopping and self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flusher on the current event loop."""
+        if not self.running:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush pending rows and stop the background flusher."""
+        if self._task is None:
+            return
+        self._stopping = True
+
+        # Let the flusher write everything queued ahead of the sentinel
+        if not self._task.done():
+            self._queue.put_nowait(_STOP)
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # Write whatever was enqueued while stopping
+        pending = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                pending.append(item)
+        for i in range(0, len(pending), self.max_batch):
+            await self._flush(pending[i:i + self.max_batch])
+
+    def _check_accepting(self) -> None:
+        """Refuse new rows once stop() has begun."""
+        if self._stopping:
+            raise RuntimeError("Write buffer is stopped")
+
+    async def _run(self) -> None:
+        """Collect rows into batches and flush them until stopped."""
+        loop = asyncio.get_running_loop()
+        batch: List[Any] = []
+        try:
+            while True:
+                item = await self._queue.get()
+                if item is _STOP:
+                    return
+                batch = [item]
+                deadline = loop.time() + self.max_delay
+                stop = False
+
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+
+                await self._flush(batch)
+                batch = []
+                if stop:
+                    return
+        finally:
+            # Cancelled while collecting or flushing: the rows in hand
+            # are neither written nor queued any more
+            if batch:
+                self._abandon(batch, RuntimeError("Write buffer stopped before the batch was written"))
+
+    @abstractmethod
+    async def _flush(self, batch: List[Any]) -> None:
+        """Write one batch of queued items."""
+
+    @abstractmethod
+    def _abandon(self, batch: List[Any], error: Exception) -> None:
+        """Give up on a batch that will not be written."""
+
+
+class MessageWriteBuffer(_WriteBuffer):
+    """
+    Batches message inserts issued within a short window.
+
+    Callers enqueue a row and await a future; the background flusher
+    inserts each batch with one statement and resolves each caller's
+    future with its persisted Message.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = settings.MESSAGE_WRITE_BATCH_SIZE,
+        max_delay: float = settings.MESSAGE_WRITE_MAX_DELAY_MS / 1000,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+    ):
+        super().__init__(max_batch, max_delay, session_factory)
+
+    async def add(
+        self,
+        session_id: UUID,
+        role: MessageRole,
+        content: str,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> Message:
+        """
+        Enqueue a message and wait until its batch is committed.
+
+        Args:
+            session_id: Parent session UUID
+            role: Message role
+            content: Message content
+            meta: Optional metadata dictionary
+
+        Returns:
+            Persisted Message
+        """
+        self._check_accepting()
+        row = {
+            "id": uuid4(),
+            "session_id": session_id,
+            "role": role,
+            "content": content,
+            "meta": meta or {},
+        }
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((row, future))
+        return await future
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """
+        Insert one batch and resolve its futures.
+
+        Args:
+            batch: List of (row, future) pairs
+        """
+        rows = [row for row, _ in batch]
+
+        try:
+            async with self._session_factory() as session:
+                created = await MessageRepository(session).create_many(rows)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to flush {len(rows)} buffered messages: {e}")
+            self._abandon(batch, e)
+            return
+
+        for (_, future), message in zip(batch, created):
+            if not future.done():
+                future.set_result(message)
+
+    def _abandon(
+        self,
+        batch: List[Tuple[Dict[str, Any], asyncio.Future]],
+        error: Exception
+    ) -> None:
+        """Fail the waiting callers of a batch that was not written."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+
+class CheckpointWriteBuffer(_WriteBuffer):
+    """
+    Batches checkpoint (agent_states) inserts issued within a short window.
+
+    Unlike messages, callers don't wait for the write: rows are queued
+    with their IDs already assigned and flushed in the background, so a
+    checkpoint may not be readable until its batch is committed. A failed
+    batch is retried CHECKPOINT_WRITE_RETRIES times with backoff; rows
+    that still can't be written are logged, dropped and counted in
+    ``failed_rows``.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = settings.CHECKPOINT_WRITE_BATCH_SIZE,
+        max_delay: float = settings.CHECKPOINT_WRITE_MAX_DELAY_MS / 1000,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+        max_retries: int = settings.CHECKPOINT_WRITE_RETRIES,
+    ):
+        super().__init__(max_batch, max_delay, session_factory)
+        self.max_retries = max_retries
+        # Checkpoint rows dropped after exhausting their retries
+        self.failed_rows = 0
+
+    async def add(self, row: Dict[str, Any]) -> None:
+        """
+        Enqueue an agent_states row for the next batch.
+
+        Args:
+            row: Column values, including id and session_id
+        """
+        self._check_accepting()
+        await self._queue.put(row)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Insert one batch of checkpoints, creating missing sessions first.
+
+        Args:
+            batch: List of agent_states rows
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._session_factory() as session, session.begin():
+                    await write_checkpoints(session, batch)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self._abandon(batch, e)
+                    return
+                delay = 0.1 * 2 ** attempt
+                logger.warning(
+                    f"Failed to flush {len(batch)} buffered checkpoints "
+                    f"(attempt {attempt + 1}), retrying in {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+    def _abandon(self, batch: List[Dict[str, Any]], error: Exception) -> None:
+        """Drop a batch that could not be written and count its rows."""
+        self.failed_rows += len(batch)
+        logger.error(f"Dropped {len(batch)} buffered checkpoints: {error}")
+
+
+# Global buffer instances
+_message_write_buffer: Optional[MessageWriteBuffer] = None
+_checkpoint_write_buffer: Optional[CheckpointWriteBuffer] = None
+
+
+def get_message_write_buffer() -> MessageWriteBuffer:
+    """
+    Get or create global message write buffer.
+
+    Returns:
+        MessageWriteBuffer instance
+    """
+    global _message_write_buffer
+    if _message_write_buffer is None:
+        _message_write_buffer = MessageWriteBuffer()
+    return _message_write_buffer
+
+
+def reset_message_write_buffer():
+    """Reset global message write buffer (for testing)."""
+    global _message_write_buffer
+    _message_write_buffer = None
+
+
+def get_checkpoint_write_buffer() -> CheckpointWriteBuffer:
+    """
+    Get or create global checkpoint write buffer.
+
+    Returns:
+        CheckpointWriteBuffer instance
+    """
+    global _checkpoint_write_buffer
+    if _checkpoint_write_buffer is None:
+        _checkpoint_write_buffer = CheckpointWriteBuffer()
+    return _checkpoint_write_buffer
+
+
+def reset_checkpoint_write_buffer():
+    """Reset global checkpoint write buffer (for testing)."""
+    global _checkpoint_write_buffer
+    _checkpoint_write_buffer = None
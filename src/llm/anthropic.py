@@ -1,9 +1,12 @@
 from langchain_anthropic import ChatAnthropic
 from src.config import settings
 
-def get_anthropic_model(model_name: str = "claude-3-opus-20240229", temperature: float = 0):
+def get_anthropic_model(model_name: str = "claude-3-opus-20240229", temperature: float = 0, max_tokens: int = None):
+    # ChatAnthropic requires an int, so only override its default when set
+    extra = {"max_tokens": max_tokens} if max_tokens is not None else {}
     return ChatAnthropic(
         model=model_name,
         temperature=temperature,
-        anthropic_api_key=settings.ANTHROPIC_API_KEY
+        anthropic_api_key=settings.ANTHROPIC_API_KEY,
+        **extra
     )
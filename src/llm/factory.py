@@ -1,26 +1,58 @@
+from functools import lru_cache
+
 from src.config import settings
 from .openai import get_openai_model
 from .anthropic import get_anthropic_model
 from .gemini import get_gemini_model
 from .glm import get_glm_model
 
-def llm_factory(provider: str = None, model_name: str = None, temperature: float = 0):
+def llm_factory(
+    provider: str = None,
+    model_name: str = None,
+    temperature: float = 0,
+    max_tokens: int = None,
+):
     """
     Factory function to create LLM instances based on the provider.
+
+    max_tokens caps the completion length; None keeps the provider default.
+    Instances are cached per configuration, so callers share one client
+    (and its HTTP connection pool) instead of building one per request.
     """
     provider = provider or settings.DEFAULT_LLM_PROVIDER
 
     if provider == "openai":
         default_model = "gpt-4-turbo-preview"
-        return get_openai_model(model_name or settings.DEFAULT_LLM_MODEL or default_model, temperature)
     elif provider == "anthropic":
         default_model = "claude-3-opus-20240229"
-        return get_anthropic_model(model_name or settings.DEFAULT_LLM_MODEL or default_model, temperature)
     elif provider == "gemini":
         default_model = "gemini-2.5-flash"
-        return get_gemini_model(model_name or settings.DEFAULT_LLM_MODEL or default_model, temperature)
     elif provider == "glm":
         default_model = "glm-4.5"
-        return get_glm_model(model_name or settings.DEFAULT_LLM_MODEL or default_model, temperature)
     else:
         raise ValueError(f"Unsupported LLM provider: {provider}")
+
+    return _build_llm(
+        provider,
+        model_name or settings.DEFAULT_LLM_MODEL or default_model,
+        temperature,
+        max_tokens,
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_llm(provider: str, model_name: str, temperature: float, max_tokens: int):
+    """Create the chat model for a resolved configuration (cached)."""
+    if provider == "openai":
+        return get_openai_model(model_name, temperature, max_tokens)
+    elif provider == "anthropic":
+        return get_anthropic_model(model_name, temperature, max_tokens)
+    elif provider == "gemini":
+        return get_gemini_model(model_name, temperature, max_tokens)
+    else:
+        return get_glm_model(model_name, temperature, max_tokens)
+
+
+def clear_llm_cache():
+    """Drop cached LLM instances (for testing or after settings change)."""
+    _build_llm.cache_clear()
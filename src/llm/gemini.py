@@ -1,9 +1,10 @@
 from langchain_google_genai import ChatGoogleGenerativeAI
 from src.config import settings
 
-def get_gemini_model(model_name: str = "gemini-2.5-flash", temperature: float = 0):
+def get_gemini_model(model_name: str = "gemini-2.5-flash", temperature: float = 0, max_tokens: int = None):
     return ChatGoogleGenerativeAI(
         model=model_name,
         temperature=temperature,
+        max_output_tokens=max_tokens,
         google_api_key=settings.GOOGLE_API_KEY
     )
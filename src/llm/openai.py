@@ -1,9 +1,10 @@
 from langchain_openai import ChatOpenAI
 from src.config import settings
 
-def get_openai_model(model_name: str = "gpt-4-turbo-preview", temperature: float = 0):
+def get_openai_model(model_name: str = "gpt-4-turbo-preview", temperature: float = 0, max_tokens: int = None):
     return ChatOpenAI(
         model=model_name,
         temperature=temperature,
+        max_tokens=max_tokens,
         openai_api_key=settings.OPENAI_API_KEY
     )
@@ -1,47 +1,120 @@
+import asyncio
+import logging
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 import uvicorn
 
 from src.api.router import api_router
 from src.config import settings
 from src.mcp.client import get_mcp_client, MCPClientManager
+from src.memory import get_conversation_memory
+from src.db.write_buffer import get_checkpoint_write_buffer, get_message_write_buffer
+from src.db.engine import async_session, pool_status
+from src.db.repositories import ToolCallRepository
+from src.bridge.orchestrator_client import close_orchestrator_client
+
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logging.getLogger("orbit").setLevel(settings.LOG_LEVEL)
+logger = logging.getLogger("orbit.main")
+
+# Static response bodies, built once instead of per request
+_ROOT_BODY = {
+    "service": "Orbit AI Agent",
+    "version": "0.1.0",
+    "status": "running"
+}
+
+# Health body until the lifespan has initialized MCP servers
+_HEALTH_BODY = {
+    "status": "healthy",
+    "version": "0.1.0",
+    "llm_provider": settings.DEFAULT_LLM_PROVIDER,
+    "mcp_servers": "not_configured",
+}
+
+
+async def _maintain_tool_call_partitions():
+    """Create upcoming tool call partitions now and then periodically."""
+    while True:
+        try:
+            async with async_session() as session, session.begin():
+                created = await ToolCallRepository(session).ensure_partitions()
+            if created:
+                logger.info(f"Created tool call partitions: {', '.join(created)}")
+        except Exception as e:
+            logger.warning(f"Could not create tool call partitions: {e}")
+        await asyncio.sleep(settings.TOOL_CALL_PARTITION_INTERVAL)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown logic"""
-    print("🚀 Orbit Agent starting up...")
-    print(f"📍 Port: {settings.PORT}")
-    print(f"🤖 Default LLM: {settings.DEFAULT_LLM_PROVIDER}")
+    logger.info(
+        f"Orbit Agent starting up (port {settings.PORT}, "
+        f"default LLM {settings.DEFAULT_LLM_PROVIDER})"
+    )
+
+    # Resolve the conversation memory singleton once so handlers can
+    # read it from app.state instead of awaiting the getter per request
+    app.state.memory = get_conversation_memory()
+
+    # Keep the upcoming monthly tool call partitions created
+    partition_task = asyncio.create_task(_maintain_tool_call_partitions())
+
+    # Start the background flusher that batches message inserts
+    message_write_buffer = get_message_write_buffer()
+    message_write_buffer.start()
+    checkpoint_write_buffer = get_checkpoint_write_buffer()
+    if settings.CHECKPOINT_BATCH_WRITES:
+        checkpoint_write_buffer.start()
 
     # Initialize MCP servers
     mcp_client = get_mcp_client()
     mcp_servers_initialized = False
 
     if settings.MCP_SERVERS_ENABLED:
-        print("🔌 Initializing MCP servers...")
+        logger.info("Initializing MCP servers...")
         try:
             mcp_servers_initialized = await mcp_client.initialize_servers()
             if mcp_servers_initialized:
-                print("✅ MCP servers initialized successfully")
+                logger.info("MCP servers initialized successfully")
             else:
-                print("⚠️  No MCP servers configured")
+                logger.warning("No MCP servers configured")
         except Exception as e:
-            print(f"❌ MCP initialization failed: {e}")
+            logger.error(f"MCP initialization failed: {e}")
             mcp_servers_initialized = False
 
+    app.state.health = {
+        **_HEALTH_BODY,
+        "mcp_servers": "initialized" if mcp_servers_initialized else "not_configured",
+    }
+
     yield
 
     # Shutdown MCP servers
     if mcp_servers_initialized:
-        print("🔌 Shutting down MCP servers...")
+        logger.info("Shutting down MCP servers...")
         try:
             await mcp_client.shutdown_servers()
-            print("✅ MCP servers shut down")
+            logger.info("MCP servers shut down")
         except Exception as e:
-            print(f"❌ MCP shutdown failed: {e}")
+            logger.error(f"MCP shutdown failed: {e}")
+
+    partition_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await partition_task
+
+    # Flush buffered message and checkpoint writes
+    await message_write_buffer.stop()
+    await checkpoint_write_buffer.stop()
 
-    print("🛑 Orbit Agent shutting down...")
+    # Release pooled Bridge connections
+    await close_orchestrator_client()
+
+    logger.info("Orbit Agent shut down")
 
 
 app = FastAPI(
@@ -53,10 +126,11 @@ app = FastAPI(
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=settings.CORS_MAX_AGE,
 )
 
 # Include API routes
@@ -65,27 +139,32 @@ app.include_router(api_router, prefix="/api/v1")
 # Root health check
 @app.get("/")
 async def root():
-    return {
-        "service": "Orbit AI Agent",
-        "version": "0.1.0",
-        "status": "running"
-    }
+    return _ROOT_BODY
 
 
 @app.get("/health")
 async def health_check():
+    # Static fields are computed at startup; only pool usage is live.
+    # Fall back to the import-time body when the lifespan has not run
+    health = getattr(app.state, "health", _HEALTH_BODY)
     return {
-        "status": "healthy",
-        "version": "0.1.0",
-        "llm_provider": settings.DEFAULT_LLM_PROVIDER,
-        "mcp_servers": "initialized" if mcp_servers_initialized else "not_configured"
+        **health,
+        "db_pool": pool_status(),
+        "checkpoint_write_failures": get_checkpoint_write_buffer().failed_rows,
     }
 
 
 if __name__ == "__main__":
+    # Reload mode only supports a single worker
+    workers = 1 if settings.DEBUG else (settings.WORKERS or os.cpu_count() or 1)
     uvicorn.run(
         "src.main:app",
         host="0.0.0.0",
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        workers=workers,
+        # uvloop when installed (not on Windows), else the asyncio loop
+        loop="auto",
+        http="httptools",
+        ws="websockets",
     )
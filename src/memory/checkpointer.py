@@ -4,21 +4,195 @@ PostgreSQL checkpointer for LangGraph.
 Enables pause/resume functionality by storing agent checkpoints in PostgreSQL.
 """
 
-from typing import Dict, Any, Optional, Tuple, List, TypedDict, Annotated
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from collections.abc import Mapping
+from typing import (
+    AsyncIterator, Callable, Dict, Any, Iterator, Optional, Tuple, List, TypedDict, Annotated
+)
 from datetime import datetime, timezone
 from uuid import uuid4, UUID
-import json
 
+import orjson
+import zstandard as zstd
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import BaseCheckpointSaver, Checkpoint, CheckpointMetadata
 
-from sqlalchemy import select, update, delete, and_
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Integer, Select, select, update, delete, and_, bindparam, func, literal_column
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.db.models import Session, AgentState as DBAgentState
-from src.db.engine import get_session
+from src.db.models import AgentState as DBAgentState
+from src.db.engine import async_session
+from src.db.write_buffer import get_checkpoint_write_buffer, write_checkpoints
 from src.config import settings
 
+# Checkpoints are encoded in one orjson pass; datetime, UUID, dataclass
+# and numpy values are handled natively
+_STATE_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# agent_states.state is a 1-byte format tag followed by the payload
+_STATE_FORMAT_JSON = 0  # Plain JSON (rows migrated from the JSONB column)
+_STATE_FORMAT_ZSTD = 1  # zstd-compressed JSON
+_STATE_COMPRESSION_LEVEL = 3
+
+# Encoded states at least this large are decoded in a worker thread so
+# the event loop isn't blocked
+_STATE_OFFLOAD_BYTES = 64 * 1024
+
+# zstd (de)compressors aren't thread-safe; keep one pair per thread
+_codecs = threading.local()
+
+
+def _zstd_codecs() -> Tuple[zstd.ZstdCompressor, zstd.ZstdDecompressor]:
+    """Return this thread's zstd compressor and decompressor."""
+    if not hasattr(_codecs, "compressor"):
+        _codecs.compressor = zstd.ZstdCompressor(level=_STATE_COMPRESSION_LEVEL)
+        _codecs.decompressor = zstd.ZstdDecompressor()
+    return _codecs.compressor, _codecs.decompressor
+
+# Prebuilt statements for the checkpoint reads, filled via typed bind
+# parameters so their compiled form is reused across calls
+_STATE_BY_ID = select(DBAgentState.state).where(
+    DBAgentState.id == bindparam("checkpoint_id", type_=DBAgentState.id.type)
+)
+
+
+def _list_states(before: bool) -> Select:
+    """
+    Build the alist query: a thread's newest checkpoints, oldest first.
+
+    The newest rows are picked in thread/created_at index order and
+    re-sorted ascending in SQL. With ``before``, only checkpoints older
+    than the ``before_id`` one are listed; an unknown ``before_id``
+    doesn't filter anything.
+    """
+    newest = (
+        select(DBAgentState.id, DBAgentState.session_id, DBAgentState.created_at, DBAgentState.state)
+        .where(DBAgentState.session_id == bindparam("thread_id", type_=DBAgentState.session_id.type))
+        .order_by(DBAgentState.created_at.desc())
+        .limit(bindparam("limit", type_=Integer))
+    )
+    if before:
+        before_created_at = select(DBAgentState.created_at).where(
+            DBAgentState.id == bindparam("before_id", type_=DBAgentState.id.type)
+        ).scalar_subquery()
+        newest = newest.where(DBAgentState.created_at < func.coalesce(
+            before_created_at, literal_column("'infinity'::timestamptz")
+        ))
+
+    newest = newest.subquery()
+    return select(newest.c.id, newest.c.session_id, newest.c.state).order_by(newest.c.created_at)
+
+
+_LIST_STATES = _list_states(before=False)
+_LIST_STATES_BEFORE = _list_states(before=True)
+_LATEST_STATE = (
+    select(DBAgentState.state)
+    .where(DBAgentState.session_id == bindparam("thread_id", type_=DBAgentState.session_id.type))
+    .order_by(DBAgentState.created_at.desc())
+    .limit(1)
+)
+
+
+# Encoders used by the orjson default hook, resolved once per exact type
+_STATE_ENCODERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _encode_state_value(value: Any) -> Any:
+    """orjson default hook for values it can't serialize natively."""
+    value_type = type(value)
+    encoder = _STATE_ENCODERS.get(value_type)
+    if encoder is None:
+        if not hasattr(value_type, 'model_dump'):  # Pydantic models
+            raise TypeError(f"Type is not JSON serializable: {value_type.__name__}")
+        encoder = _STATE_ENCODERS[value_type] = value_type.model_dump
+    return encoder(value)
+
+
+def _pack_state(state: Dict[str, Any]) -> bytes:
+    """Encode a checkpoint row's state as compressed JSON."""
+    payload = orjson.dumps(state, default=_encode_state_value, option=_STATE_OPTIONS)
+    compressor, _ = _zstd_codecs()
+    return bytes([_STATE_FORMAT_ZSTD]) + compressor.compress(payload)
+
+
+def _unpack_state(data: bytes) -> Dict[str, Any]:
+    """Decode a checkpoint row's state written by _pack_state."""
+    state_format, payload = data[0], memoryview(data)[1:]
+    if state_format == _STATE_FORMAT_ZSTD:
+        _, decompressor = _zstd_codecs()
+        payload = decompressor.decompress(payload)
+    elif state_format != _STATE_FORMAT_JSON:
+        raise ValueError(f"Unknown checkpoint state format: {state_format}")
+    return orjson.loads(payload)
+
+
+async def _unpack_states(blobs: List[bytes]) -> List[Dict[str, Any]]:
+    """Decode several states, off the event loop when they are large."""
+    if sum(len(blob) for blob in blobs) < _STATE_OFFLOAD_BYTES:
+        return [_unpack_state(blob) for blob in blobs]
+    return await asyncio.to_thread(lambda: [_unpack_state(blob) for blob in blobs])
+
+
+class _LazyState:
+    """Stored checkpoint state, decoded on first use."""
+
+    __slots__ = ("_raw", "_decoded")
+
+    def __init__(self, raw: bytes):
+        self._raw = raw
+        self._decoded: Optional[Dict[str, Any]] = None
+
+    def decoded(self) -> Dict[str, Any]:
+        """Decode the state once and return it."""
+        if self._decoded is None:
+            self._decoded = _unpack_state(self._raw)
+            self._raw = None
+        return self._decoded
+
+
+class _LazyView(Mapping):
+    """
+    Read-only mapping over one part of a lazily decoded state.
+
+    The checkpoint and metadata views of a row share one _LazyState, so
+    the row is decoded at most once, and only if either view is read.
+    """
+
+    __slots__ = ("_state", "_key", "_convert", "_value")
+
+    def __init__(
+        self,
+        state: _LazyState,
+        key: str,
+        convert: Callable[[Dict[str, Any]], Dict[str, Any]]
+    ):
+        self._state = state
+        self._key = key
+        self._convert = convert
+        self._value: Optional[Dict[str, Any]] = None
+
+    def _resolve(self) -> Dict[str, Any]:
+        if self._value is None:
+            self._value = self._convert(self._state.decoded().get(self._key, {}))
+        return self._value
+
+    def __getitem__(self, key: str) -> Any:
+        return self._resolve()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._resolve())
+
+    def __len__(self) -> int:
+        return len(self._resolve())
+
+    def __repr__(self) -> str:
+        return repr(self._resolve())
+
 
 class CheckpointData(TypedDict):
     """Checkpoint data stored in database."""
@@ -39,21 +213,94 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
     Allows resuming conversations from any checkpoint.
     """
 
-    def __init__(self, db_session: AsyncSession = None):
+    def __init__(
+        self,
+        db_session: AsyncSession = None,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+    ):
         """
         Initialize PostgreSQL checkpointer.
 
         Args:
-            db_session: Async SQLAlchemy session (optional)
+            db_session: Async SQLAlchemy session (optional); when omitted
+                each call uses its own pooled session
+            session_factory: Factory for the per-call sessions
         """
         self.db_session = db_session
+        self._session_factory = session_factory
+        # checkpoint_id -> (expires_at, thread_id, encoded state) for
+        # checkpoints saved by this process, LRU ordered
+        self._state_cache: "OrderedDict[str, Tuple[float, str, bytes]]" = OrderedDict()
+        # thread_id -> latest checkpoint_id saved by this process
+        self._latest_by_thread: Dict[str, str] = {}
         super().__init__()
 
-    async def _get_db_session(self) -> AsyncSession:
-        """Get database session."""
-        if self.db_session:
-            return self.db_session
-        return await get_session().__anext__()
+    def _cache_state(self, thread_id: str, checkpoint_id: str, state: bytes) -> None:
+        """
+        Remember a just-saved checkpoint so reads right after it skip the database.
+
+        Args:
+            thread_id: Thread the checkpoint belongs to
+            checkpoint_id: Checkpoint ID
+            state: Encoded state as stored in agent_states
+        """
+        self._state_cache[checkpoint_id] = (
+            time.monotonic() + settings.CHECKPOINT_CACHE_TTL, thread_id, state
+        )
+        self._state_cache.move_to_end(checkpoint_id)
+        self._latest_by_thread[thread_id] = checkpoint_id
+
+        while len(self._state_cache) > settings.CHECKPOINT_CACHE_SIZE:
+            evicted_id, (_, evicted_thread, _) = self._state_cache.popitem(last=False)
+            if self._latest_by_thread.get(evicted_thread) == evicted_id:
+                del self._latest_by_thread[evicted_thread]
+
+    def _cached_state(
+        self,
+        checkpoint_id: Optional[str],
+        thread_id: Optional[str]
+    ) -> Optional[bytes]:
+        """
+        Look up a cached checkpoint by ID, or the thread's latest one.
+
+        Only checkpoints saved by this process are cached, so with several
+        workers a thread's latest checkpoint may be newer than the cached
+        one for up to CHECKPOINT_CACHE_TTL seconds.
+
+        Args:
+            checkpoint_id: Checkpoint ID, if requested explicitly
+            thread_id: Thread ID, used when no checkpoint ID is given
+
+        Returns:
+            Encoded state, or None on a miss
+        """
+        if not checkpoint_id:
+            checkpoint_id = self._latest_by_thread.get(thread_id)
+        entry = self._state_cache.get(checkpoint_id) if checkpoint_id else None
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        self._state_cache.move_to_end(checkpoint_id)
+        return entry[2]
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Provide the session for one checkpointer call.
+
+        The injected session is rolled back on error but left open.
+        Otherwise a session is taken from the factory and closed on exit,
+        returning its connection to the pool.
+        """
+        if self.db_session is not None:
+            try:
+                yield self.db_session
+            except Exception:
+                await self.db_session.rollback()
+                raise
+            return
+
+        async with self._session_factory() as session:
+            yield session
 
     def _serialize_checkpoint(self, checkpoint: Checkpoint) -> Dict[str, Any]:
         """
@@ -68,7 +315,7 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
         # Convert checkpoint to JSON-serializable format
         return {
             "id": checkpoint.get("id", str(uuid4())),
-            "channel_values": self._serialize_state(checkpoint.get("channel_values", {})),
+            "channel_values": checkpoint.get("channel_values", {}),
             "channel_versions": checkpoint.get("channel_versions", {}),
             "versions_seen": checkpoint.get("versions_seen", {}),
             "pending_sends": checkpoint.get("pending_sends", []),
@@ -86,56 +333,12 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
         """
         return {
             "id": data.get("id"),
-            "channel_values": self._deserialize_state(data.get("channel_values", {})),
+            "channel_values": data.get("channel_values", {}),
             "channel_versions": data.get("channel_versions", {}),
             "versions_seen": data.get("versions_seen", {}),
             "pending_sends": data.get("pending_sends", []),
         }
 
-    def _serialize_state(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Serialize state for JSON storage.
-
-        Handles special types like datetime, UUID, etc.
-
-        Args:
-            state: State dictionary
-
-        Returns:
-            JSON-serializable state
-        """
-        serialized = {}
-        for key, value in state.items():
-            if isinstance(value, datetime):
-                serialized[key] = value.isoformat()
-            elif isinstance(value, UUID):
-                serialized[key] = str(value)
-            elif hasattr(value, 'model_dump'):  # Pydantic models
-                serialized[key] = value.model_dump()
-            elif isinstance(value, (list, dict)):
-                serialized[key] = self._serialize_state(value) if isinstance(value, dict) else [
-                    self._serialize_state(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                serialized[key] = value
-        return serialized
-
-    def _deserialize_state(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Deserialize state from JSON storage.
-
-        Args:
-            state: JSON-serializable state
-
-        Returns:
-            Deserialized state
-        """
-        deserialized = {}
-        for key, value in state.items():
-            deserialized[key] = value
-        return deserialized
-
     def _serialize_metadata(self, metadata: CheckpointMetadata) -> Dict[str, Any]:
         """
         Serialize checkpoint metadata.
@@ -179,6 +382,10 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
         """
         Save checkpoint to database.
 
+        With CHECKPOINT_BATCH_WRITES enabled and the checkpoint write
+        buffer running, the row is queued for a batched INSERT and this
+        returns without waiting for it to be committed.
+
         Args:
             config: Runnable configuration
             checkpoint: Checkpoint to save
@@ -187,74 +394,96 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
         Returns:
             Updated configuration with checkpoint ID
         """
-        session = await self._get_db_session()
-
-        try:
-            # Get thread ID from config
-            thread_id = config.get("configurable", {}).get("thread_id")
-            if not thread_id:
-                thread_id = str(uuid4())
-
-            # Get parent checkpoint ID if exists
-            parent_checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
-
-            # Serialize checkpoint and metadata
-            checkpoint_data = self._serialize_checkpoint(checkpoint)
-            metadata_data = self._serialize_metadata(metadata)
-
-            # Get next node from metadata if available
-            next_node = None
-            writes = metadata.get("writes", {})
-            if writes:
-                next_node = list(writes.keys())[0] if writes else None
-
-            # Check if session exists
-            stmt = select(Session).where(Session.id == thread_id)
-            result = await session.execute(stmt)
-            session_obj = result.scalar_one_or_none()
-
-            # Create session if doesn't exist
-            if not session_obj:
-                session_obj = Session(
-                    id=thread_id,
-                    user_id="system",  # Default user for checkpointer
-                    status="active"
-                )
-                session.add(session_obj)
-                await session.flush()
-
-            # Create checkpoint record
-            checkpoint_id = str(uuid4())
-
-            # Store in AgentState table
-            db_state = DBAgentState(
-                id=checkpoint_id,
-                session_id=thread_id,
-                thread_id=thread_id,
-                state={
-                    "checkpoint": checkpoint_data,
-                    "metadata": metadata_data,
-                    "parent_checkpoint_id": parent_checkpoint_id,
-                    "next_node": next_node,
-                }
-            )
-            session.add(db_state)
-            await session.commit()
+        # Get thread ID from config
+        thread_id = config.get("configurable", {}).get("thread_id")
+        if not thread_id:
+            thread_id = str(uuid4())
+
+        # Get parent checkpoint ID if exists
+        parent_checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
+
+        # Serialize checkpoint and metadata
+        checkpoint_data = self._serialize_checkpoint(checkpoint)
+        metadata_data = self._serialize_metadata(metadata)
+
+        # Get next node from metadata if available
+        next_node = next(iter(metadata.get("writes") or {}), None)
+
+        # Create checkpoint record; IDs are bound as native UUIDs and only
+        # turned into strings in the returned config
+        checkpoint_id = uuid4()
+        row = {
+            "id": checkpoint_id,
+            # The thread is the session; agent_states keys on session_id
+            "session_id": UUID(str(thread_id)),
+            # Encoding and compression run in a worker thread
+            "state": await asyncio.to_thread(_pack_state, {
+                "checkpoint": checkpoint_data,
+                "metadata": metadata_data,
+                "parent_checkpoint_id": parent_checkpoint_id,
+                "next_node": next_node,
+            }),
+        }
 
-            # Update config with new checkpoint ID
-            new_config = {
-                "configurable": {
-                    **config.get("configurable", {}),
-                    "thread_id": thread_id,
-                    "checkpoint_id": checkpoint_id,
-                }
+        # Update config with new checkpoint ID
+        new_config = {
+            "configurable": {
+                **config.get("configurable", {}),
+                "thread_id": thread_id,
+                "checkpoint_id": str(checkpoint_id),
             }
+        }
 
+        write_buffer = get_checkpoint_write_buffer()
+        if settings.CHECKPOINT_BATCH_WRITES and write_buffer.running:
+            await write_buffer.add(row)
+            # Served from the cache until the batch is committed
+            self._cache_state(thread_id, str(checkpoint_id), row["state"])
             return new_config
 
-        except Exception as e:
-            await session.rollback()
-            raise e
+        async with self._session() as session:
+            # Store in AgentState table, creating the session if it
+            # doesn't exist, in one statement
+            await write_checkpoints(session, [row])
+            await session.commit()
+
+        self._cache_state(thread_id, str(checkpoint_id), row["state"])
+        return new_config
+
+    async def _aget_state(self, config: RunnableConfig) -> Optional[Dict[str, Any]]:
+        """
+        Load and decode the stored state for a config.
+
+        Args:
+            config: Runnable configuration
+
+        Returns:
+            Decoded state (checkpoint, metadata, parent_checkpoint_id,
+            next_node) or None if there is no matching checkpoint
+        """
+        # Get checkpoint ID from config
+        checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
+        thread_id = config.get("configurable", {}).get("thread_id")
+
+        if checkpoint_id:
+            # Get specific checkpoint
+            stmt, params = _STATE_BY_ID, {"checkpoint_id": UUID(str(checkpoint_id))}
+        elif thread_id:
+            # Get latest checkpoint for thread (thread/created_at index)
+            stmt, params = _LATEST_STATE, {"thread_id": UUID(str(thread_id))}
+        else:
+            return None
+
+        # Checkpoints this process just saved are read back from memory
+        state = self._cached_state(checkpoint_id, thread_id)
+        if state is None:
+            async with self._session() as session:
+                state = await session.scalar(stmt, params)
+
+        if state is None:
+            return None
+
+        return (await _unpack_states([state]))[0]
 
     async def aget(
         self,
@@ -269,46 +498,15 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
         Returns:
             Tuple of (checkpoint, metadata) or (None, None)
         """
-        session = await self._get_db_session()
-
-        try:
-            # Get checkpoint ID from config
-            checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
-            thread_id = config.get("configurable", {}).get("thread_id")
-
-            if checkpoint_id:
-                # Get specific checkpoint
-                stmt = select(DBAgentState).where(DBAgentState.id == checkpoint_id)
-            elif thread_id:
-                # Get latest checkpoint for thread
-                stmt = (
-                    select(DBAgentState)
-                    .where(DBAgentState.thread_id == thread_id)
-                    .order_by(DBAgentState.created_at.desc())
-                    .limit(1)
-                )
-            else:
-                return None, None
-
-            result = await session.execute(stmt)
-            db_state = result.scalar_one_or_none()
-
-            if not db_state:
-                return None, None
-
-            # Deserialize checkpoint and metadata
-            state_data = db_state.state
-            checkpoint_data = state_data.get("checkpoint", {})
-            metadata_data = state_data.get("metadata", {})
-
-            checkpoint = self._deserialize_checkpoint(checkpoint_data)
-            metadata = self._deserialize_metadata(metadata_data)
-
-            return checkpoint, metadata
-
-        except Exception as e:
-            await session.rollback()
-            raise e
+        state_data = await self._aget_state(config)
+        if state_data is None:
+            return None, None
+
+        # Deserialize checkpoint and metadata
+        checkpoint = self._deserialize_checkpoint(state_data.get("checkpoint", {}))
+        metadata = self._deserialize_metadata(state_data.get("metadata", {}))
+
+        return checkpoint, metadata
 
     async def alist(
         self,
@@ -319,6 +517,9 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
         """
         List checkpoints for a thread.
 
+        Checkpoints and metadata are returned as read-only mappings that
+        decode the stored state on first access.
+
         Args:
             config: Runnable configuration
             limit: Maximum number of checkpoints to return
@@ -327,60 +528,41 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
         Returns:
             List of (config, checkpoint, metadata) tuples
         """
-        session = await self._get_db_session()
-
-        try:
-            thread_id = config.get("configurable", {}).get("thread_id")
-            if not thread_id:
-                return []
-
-            # Build query
-            stmt = (
-                select(DBAgentState)
-                .where(DBAgentState.thread_id == thread_id)
-                .order_by(DBAgentState.created_at.desc())
-                .limit(limit)
-            )
-
-            # Filter by before checkpoint if specified
-            if before:
-                before_id = before.get("configurable", {}).get("checkpoint_id")
-                if before_id:
-                    before_checkpoint = await session.execute(
-                        select(DBAgentState).where(DBAgentState.id == before_id)
-                    )
-                    before_state = before_checkpoint.scalar_one_or_none()
-                    if before_state:
-                        stmt = stmt.where(
-                            DBAgentState.created_at < before_state.created_at
-                        )
-
-            result = await session.execute(stmt)
-            db_states = result.scalars().all()
-
-            checkpoints = []
-            for db_state in reversed(db_states):
-                state_data = db_state.state
-                checkpoint_data = state_data.get("checkpoint", {})
-                metadata_data = state_data.get("metadata", {})
-
-                checkpoint = self._deserialize_checkpoint(checkpoint_data)
-                metadata = self._deserialize_metadata(metadata_data)
-
-                config_data = {
-                    "configurable": {
-                        "thread_id": db_state.thread_id,
-                        "checkpoint_id": str(db_state.id),
-                    }
+        thread_id = config.get("configurable", {}).get("thread_id")
+        if not thread_id:
+            return []
+
+        # Only the needed columns, in one query even when filtering by
+        # the before checkpoint
+        stmt = _LIST_STATES
+        params = {"thread_id": UUID(str(thread_id)), "limit": limit}
+
+        before_id = before.get("configurable", {}).get("checkpoint_id") if before else None
+        if before_id:
+            stmt = _LIST_STATES_BEFORE
+            params["before_id"] = UUID(str(before_id))
+
+        async with self._session() as session:
+            result = await session.execute(stmt, params)
+            db_states = result.all()
+
+        checkpoints = []
+        for db_state in db_states:
+            # Decoded only when the caller reads the checkpoint or metadata
+            state = _LazyState(db_state.state)
+            checkpoint = _LazyView(state, "checkpoint", self._deserialize_checkpoint)
+            metadata = _LazyView(state, "metadata", self._deserialize_metadata)
+
+            config_data = {
+                "configurable": {
+                    "thread_id": str(db_state.session_id),
+                    "checkpoint_id": str(db_state.id),
                 }
+            }
 
-                checkpoints.append((config_data, checkpoint, metadata))
-
-            return checkpoints
+            checkpoints.append((config_data, checkpoint, metadata))
 
-        except Exception as e:
-            await session.rollback()
-            raise e
+        return checkpoints
 
     async def aput_writes(
         self,
@@ -413,12 +595,14 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
         Returns:
             Tuple of (checkpoint, parent_config, metadata) or None
         """
-        checkpoint, metadata = await self.aget(config)
-        if not checkpoint:
+        state_data = await self._aget_state(config)
+        if state_data is None:
             return None
 
-        # Get parent config
-        state_data = checkpoint.get("metadata", {})
+        checkpoint = self._deserialize_checkpoint(state_data.get("checkpoint", {}))
+        metadata = self._deserialize_metadata(state_data.get("metadata", {}))
+
+        # Get parent config (stored next to the checkpoint, not in it)
         parent_checkpoint_id = state_data.get("parent_checkpoint_id")
 
         parent_config = None
@@ -433,24 +617,32 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
         return checkpoint, parent_config or {}, metadata
 
 
-# Global checkpointer instance
+# Global checkpointer instance and the process that created it
 _postgres_checkpointer: Optional[PostgresCheckpointSaver] = None
+_postgres_checkpointer_pid: Optional[int] = None
 
 
 async def get_checkpointer() -> PostgresCheckpointSaver:
     """
     Get or create global checkpointer instance.
 
+    There is no await between the check and the assignment, so concurrent
+    coroutines can't create two instances. A forked child process gets a
+    fresh instance instead of inheriting its parent's cache.
+
     Returns:
         PostgreSQL checkpointer instance
     """
-    global _postgres_checkpointer
-    if _postgres_checkpointer is None:
+    global _postgres_checkpointer, _postgres_checkpointer_pid
+    pid = os.getpid()
+    if _postgres_checkpointer is None or _postgres_checkpointer_pid != pid:
         _postgres_checkpointer = PostgresCheckpointSaver()
+        _postgres_checkpointer_pid = pid
     return _postgres_checkpointer
 
 
 def reset_checkpointer():
     """Reset global checkpointer instance (for testing)."""
-    global _postgres_checkpointer
+    global _postgres_checkpointer, _postgres_checkpointer_pid
     _postgres_checkpointer = None
+    _postgres_checkpointer_pid = None
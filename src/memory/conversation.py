@@ -4,7 +4,16 @@ Conversation Memory service for Orbit AI Agent.
 Manages conversation history, context, and summarization.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import time
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from contextlib import aclosing, asynccontextmanager
+from functools import lru_cache
+from itertools import accumulate
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 from uuid import UUID
 
@@ -17,12 +26,71 @@ from langchain_core.messages import (
 )
 
 from sqlalchemy import select, update, delete, and_, or_, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.db.models import Session, Message, MessageRole
-from src.db.repositories import SessionRepository, MessageRepository
-from src.db.engine import get_session
-from src.llm.factory import llm_factory
+from src.api.cache import get_response_cache, session_namespace, single_worker
+from src.db.models import Session, Message, MessageRole, SessionSummary
+from src.db.repositories import SessionRepository, MessageRepository, SessionSummaryRepository
+from src.db.engine import async_session
+from src.db.write_buffer import get_message_write_buffer
+from src.memory.summary_batcher import get_summary_batcher
+from src.config import settings
+
+logger = logging.getLogger("orbit.memory.conversation")
+
+# Static summarizer instructions, sent as a system message ahead of the
+# conversation so the prompt prefix is byte-identical on every call
+SUMMARIZER_SYSTEM_PROMPT = """You are a conversation summarizer. Create a concise summary of this conversation.
+
+The summary should:
+- Capture the main topics and themes discussed
+- Highlight key questions and answers
+- Note any important decisions or conclusions
+- Be 2-3 paragraphs maximum"""
+
+# LangChain message class for each stored message role
+_ROLE_TO_MESSAGE_CLASS: Dict[MessageRole, type] = {
+    MessageRole.USER: HumanMessage,
+    MessageRole.ASSISTANT: AIMessage,
+    MessageRole.SYSTEM: SystemMessage,
+    MessageRole.TOOL: ToolMessage,
+}
+
+# Summary transcript label for each LangChain message type
+_TYPE_LABELS: Dict[str, str] = {
+    "human": "HUMAN",
+    "ai": "AI",
+    "system": "SYSTEM",
+    "tool": "TOOL",
+}
+
+# Rough estimate: 1 token ≈ 4 chars
+_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=10000)
+def _estimate_tokens(message_id: UUID, content_length: int) -> int:
+    """
+    Estimate a message's token count (cached per message).
+
+    Messages are immutable once stored, so the estimate is keyed by ID;
+    the content length is part of the key so an edited row is re-estimated.
+    """
+    return content_length // _CHARS_PER_TOKEN
+
+
+# Summaries by message window digest, LRU ordered. Shared by every
+# ConversationMemory in the process, so a summary made by a background
+# refresh is served to the request path without a database lookup.
+_summary_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _summary_key(messages: List[Message]) -> str:
+    """Digest of the ordered message IDs a summary was generated from."""
+    digest = hashlib.blake2b(digest_size=16)
+    for message in messages:
+        digest.update(message.id.bytes)
+    return digest.hexdigest()
 
 
 class ConversationMemory:
@@ -32,22 +100,57 @@ class ConversationMemory:
     Handles storing, retrieving, and summarizing conversations.
     """
 
-    def __init__(self, db_session: AsyncSession = None):
+    def __init__(
+        self,
+        db_session: AsyncSession = None,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+    ):
         """
         Initialize conversation memory.
 
         Args:
-            db_session: Async SQLAlchemy session (optional)
+            db_session: Async SQLAlchemy session (optional), e.g. the
+                request-scoped one; when omitted each call uses its own
+                pooled session, so one instance can serve concurrent tasks
+            session_factory: Factory for the per-call sessions
         """
         self.db_session = db_session
-        self.session_repo = SessionRepository(db_session)
-        self.message_repo = MessageRepository(db_session)
+        self._session_factory = session_factory
+        # In-flight background summary refreshes by session
+        self._summary_tasks: Dict[str, asyncio.Task] = {}
+        # (session_id, version, read args) -> (expires_at, messages), LRU
+        # ordered; bumping a session's version invalidates its entries.
+        # Writes made by other workers can't be seen here, so the cache is
+        # only used when a single worker serves the API
+        self._cache_conversations = single_worker()
+        self._conversation_cache: "OrderedDict[Tuple, Tuple[float, List[Message]]]" = OrderedDict()
+        # Session -> version set by its last invalidation, LRU ordered and
+        # bounded; sessions without a record use the newest evicted version
+        self._conversation_versions: "OrderedDict[str, int]" = OrderedDict()
+        self._conversation_clock = 0
+        self._evicted_version = 0
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Provide the session for one memory call.
 
-    async def _get_db_session(self) -> AsyncSession:
-        """Get database session."""
-        if self.db_session:
-            return self.db_session
-        return await get_session().__anext__()
+        The injected session is rolled back on error but left open.
+        Otherwise a session is taken from the factory and closed on exit,
+        returning its connection to the pool; an AsyncSession must not be
+        shared by concurrent tasks, so the process-wide instance never
+        holds one.
+        """
+        if self.db_session is not None:
+            try:
+                yield self.db_session
+            except Exception:
+                await self.db_session.rollback()
+                raise
+            return
+
+        async with self._session_factory() as session:
+            yield session
 
     async def create_session(
         self,
@@ -66,10 +169,8 @@ class ConversationMemory:
         Returns:
             Created session
         """
-        session = await self._get_db_session()
-
-        try:
-            new_session = await self.session_repo.create(
+        async with self._session() as session:
+            new_session = await SessionRepository(session).create(
                 user_id=user_id,
                 title=title,
                 status="active",
@@ -77,9 +178,6 @@ class ConversationMemory:
             )
             await session.commit()
             return new_session
-        except Exception as e:
-            await session.rollback()
-            raise e
 
     async def get_session(self, session_id: str) -> Optional[Session]:
         """
@@ -91,72 +189,131 @@ class ConversationMemory:
         Returns:
             Session or None
         """
-        session = await self._get_db_session()
-        return await self.session_repo.get_by_id(session_id)
+        async with self._session() as session:
+            return await SessionRepository(session).get_by_id(session_id)
 
     async def add_message(
         self,
         session_id: str,
         role: MessageRole,
         content: str,
-        meta: Optional[Dict[str, Any]] = None
+        meta: Optional[Dict[str, Any]] = None,
+        strict: bool = False
     ) -> Message:
         """
         Add a message to the conversation.
 
+        When the message write buffer is running the insert is batched
+        with concurrent writes; the call still returns only after the
+        batch is committed.
+
         Args:
             session_id: Session UUID as string
             role: Message role (user, assistant, system, tool)
             content: Message content
             meta: Optional metadata
+            strict: Bypass the write buffer and insert in this call's
+                own transaction
 
         Returns:
             Created message
         """
-        session = await self._get_db_session()
+        write_buffer = get_message_write_buffer()
+        if not strict and write_buffer.running:
+            message = await write_buffer.add(
+                session_id=session_id,
+                role=role,
+                content=content,
+                meta=meta
+            )
+            self._invalidate_conversation(session_id)
+            self.schedule_summary_refresh(session_id)
+            return message
 
-        try:
-            message = await self.message_repo.create(
+        async with self._session() as session:
+            message = await MessageRepository(session).create(
                 session_id=session_id,
                 role=role,
                 content=content,
                 meta=meta or {}
             )
             await session.commit()
-            return message
-        except Exception as e:
-            await session.rollback()
-            raise e
+
+        self._invalidate_conversation(session_id)
+        self.schedule_summary_refresh(session_id)
+        return message
 
     async def get_conversation_history(
         self,
         session_id: str,
         limit: Optional[int] = None,
-        before: Optional[datetime] = None
+        before: Optional[datetime] = None,
+        role: Optional[MessageRole] = None,
+        after: Optional[datetime] = None
     ) -> List[Message]:
         """
         Get conversation history for a session.
 
+        Results are cached per session until a message is added to it
+        (or CONVERSATION_CACHE_TTL passes), so repeated reads on every
+        chat turn skip the database.
+
         Args:
             session_id: Session UUID as string
             limit: Maximum number of messages to return
             before: Get messages before this timestamp
+            role: Only return messages with this role
+            after: Get messages after this timestamp
 
         Returns:
             List of messages
         """
-        session_db = await self._get_db_session()
+        cache_key = (
+            str(session_id), self._conversation_version(str(session_id)),
+            limit, before, role, after
+        )
+        entry = self._conversation_cache.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._conversation_cache.move_to_end(cache_key)
+            return list(entry[1])
 
-        try:
-            messages = await self.message_repo.get_conversation(
+        async with self._session() as session:
+            messages = await MessageRepository(session).get_conversation(
                 session_id=session_id,
                 limit=limit,
-                before=before
+                before=before,
+                role=role,
+                after=after
             )
-            return messages
-        except Exception as e:
-            await session_db.rollback()
-            raise e
+
+        # Skip caching if the session changed while the query ran
+        if (
+            self._cache_conversations
+            and cache_key[1] == self._conversation_version(str(session_id))
+        ):
+            self._conversation_cache[cache_key] = (
+                time.monotonic() + settings.CONVERSATION_CACHE_TTL, messages
+            )
+            self._conversation_cache.move_to_end(cache_key)
+            while len(self._conversation_cache) > settings.CONVERSATION_CACHE_SIZE:
+                self._conversation_cache.popitem(last=False)
+        return list(messages)
+
+    def _conversation_version(self, session_id: str) -> int:
+        """Current cache version of a session's conversation."""
+        return self._conversation_versions.get(session_id, self._evicted_version)
+
+    def _invalidate_conversation(self, session_id: str) -> None:
+        """Drop cached conversation reads and API responses for a session."""
+        session_id = str(session_id)
+        # Versions come from one counter, so a session whose record is
+        # evicted falls back to a version at least as new as its last one
+        self._conversation_clock += 1
+        self._conversation_versions[session_id] = self._conversation_clock
+        self._conversation_versions.move_to_end(session_id)
+        while len(self._conversation_versions) > settings.CONVERSATION_CACHE_SIZE:
+            _, self._evicted_version = self._conversation_versions.popitem(last=False)
+        get_response_cache().clear(session_namespace(session_id))
 
     async def get_messages_for_llm(
         self,
@@ -175,24 +332,38 @@ class ConversationMemory:
         Returns:
             List of LangChain messages
         """
-        messages_db = await self.get_conversation_history(
-            session_id=session_id,
-            limit=max_messages
-        )
+        async with self._session() as session:
+            # Only role and content are needed, so skip building Message objects
+            rows = await MessageRepository(session).get_conversation_projected(
+                session_id=session_id,
+                limit=max_messages
+            )
+
+        return self._to_langchain_messages(rows, include_system)
+
+    def _to_langchain_messages(
+        self,
+        messages_db: List[Message],
+        include_system: bool = True
+    ) -> List[BaseMessage]:
+        """
+        Convert database messages to LangChain messages.
 
+        Args:
+            messages_db: Messages in chronological order
+            include_system: Whether to include system messages
+
+        Returns:
+            List of LangChain messages
+        """
         langchain_messages = []
         for msg in messages_db:
             if not include_system and msg.role == MessageRole.SYSTEM:
                 continue
 
-            if msg.role == MessageRole.USER:
-                langchain_messages.append(HumanMessage(content=msg.content))
-            elif msg.role == MessageRole.ASSISTANT:
-                langchain_messages.append(AIMessage(content=msg.content))
-            elif msg.role == MessageRole.SYSTEM:
-                langchain_messages.append(SystemMessage(content=msg.content))
-            elif msg.role == MessageRole.TOOL:
-                langchain_messages.append(ToolMessage(content=msg.content))
+            message_class = _ROLE_TO_MESSAGE_CLASS.get(msg.role)
+            if message_class is not None:
+                langchain_messages.append(message_class(content=msg.content))
 
         return langchain_messages
 
@@ -204,7 +375,12 @@ class ConversationMemory:
         """
         Get messages that fit within a token budget.
 
-        Uses a simple estimation (roughly 4 chars per token).
+        Keeps a sliding window of the last CONTEXT_WINDOW_MESSAGES
+        messages, so the tail sent to the LLM stays identical between
+        turns (and its prompt prefix cacheable). Only when that window
+        is over budget are older messages folded into chunk summaries
+        via summarize_and_compress. Uses a simple estimation (roughly 4
+        chars per token).
 
         Args:
             session_id: Session UUID as string
@@ -213,31 +389,41 @@ class ConversationMemory:
         Returns:
             Tuple of (messages, token_count)
         """
-        messages_db = await self.get_conversation_history(session_id=session_id)
-        messages_db.reverse()  # Get most recent first
-
-        selected_messages = []
-        total_chars = 0
-        max_chars = max_tokens * 4  # Rough estimate: 1 token ≈ 4 chars
-
-        for msg in messages_db:
-            msg_chars = len(msg.content)
-            if total_chars + msg_chars > max_chars:
-                break
+        window = max(1, settings.CONTEXT_WINDOW_MESSAGES)
+
+        # One chunk of `window` rows holds the whole window, newest first
+        recent: "deque[Message]" = deque()
+        total_tokens = 0
+        async with self._session() as session, aclosing(
+            MessageRepository(session).get_conversation_reverse_chunked(
+                session_id, chunk_size=window
+            )
+        ) as messages_db:
+            async for msg in messages_db:
+                recent.appendleft(msg)
+                total_tokens += _estimate_tokens(msg.id, len(msg.content))
+                if len(recent) >= window:
+                    break
 
-            total_chars += msg_chars
+        if total_tokens <= max_tokens:
+            return self._to_langchain_messages(recent), total_tokens
 
-            if msg.role == MessageRole.USER:
-                selected_messages.insert(0, HumanMessage(content=msg.content))
-            elif msg.role == MessageRole.ASSISTANT:
-                selected_messages.insert(0, AIMessage(content=msg.content))
-            elif msg.role == MessageRole.SYSTEM:
-                selected_messages.insert(0, SystemMessage(content=msg.content))
-            elif msg.role == MessageRole.TOOL:
-                selected_messages.insert(0, ToolMessage(content=msg.content))
+        # Over budget: summarize all but the newest half of the window
+        context = await self.summarize_and_compress(
+            session_id=session_id,
+            max_messages=max(1, window // 2)
+        )
 
-        estimated_tokens = total_chars // 4
-        return selected_messages, estimated_tokens
+        # Still over budget: drop the oldest entries (summaries first). The
+        # running totals newest-first are computed in one pass and the
+        # cutoff found by bisection
+        running_tokens = list(accumulate(
+            len(message.content) // _CHARS_PER_TOKEN for message in reversed(context)
+        ))
+        keep = bisect_right(running_tokens, max_tokens)
+        if keep == 0:
+            return [], 0
+        return context[len(context) - keep:], running_tokens[keep - 1]
 
     async def summarize_conversation(
         self,
@@ -247,7 +433,8 @@ class ConversationMemory:
         """
         Summarize a long conversation.
 
-        Uses LLM to create a concise summary of the conversation.
+        Uses a lightweight LLM to create a concise summary of the
+        conversation. Summaries are cached until a new message arrives.
 
         Args:
             session_id: Session UUID as string
@@ -256,38 +443,174 @@ class ConversationMemory:
         Returns:
             Conversation summary or None
         """
-        messages = await self.get_messages_for_llm(
+        messages_db = await self.get_conversation_history(
             session_id=session_id,
-            max_messages=max_messages
+            limit=max_messages
         )
 
-        if not messages:
+        if not messages_db:
             return None
 
-        # Use LLM to summarize
-        llm = llm_factory(temperature=0.3)
+        # Reuse the summary of this exact message window if one was made
+        cache_key = _summary_key(messages_db)
+        cached = _summary_cache.get(cache_key)
+        if cached is not None:
+            _summary_cache.move_to_end(cache_key)
+            return cached
 
-        prompt = f"""You are a conversation summarizer. Create a concise summary of this conversation.
+        # Fall back to a summary persisted by an earlier or background run
+        stored = await self._get_stored_summary(
+            session_id, messages_db[-1].id, len(messages_db)
+        )
+        if stored is not None:
+            self._cache_summary(cache_key, stored)
+            return stored
 
-The summary should:
-- Capture the main topics and themes discussed
-- Highlight key questions and answers
-- Note any important decisions or conclusions
-- Be 2-3 paragraphs maximum
+        summary = await self._summarize_messages(
+            self._to_langchain_messages(messages_db)
+        )
+        if summary is None:
+            return None
 
-Conversation:
+        self._cache_summary(cache_key, summary)
+        await self._store_summary(
+            session_id, messages_db[-1].id, len(messages_db), summary
+        )
+        return summary
+
+    async def _summarize_messages(self, messages: List[BaseMessage]) -> Optional[str]:
+        """
+        Summarize messages with the lightweight summary model.
+
+        Args:
+            messages: LangChain messages to summarize
+
+        Returns:
+            Summary text or None if the LLM call fails
+        """
+        prompt = f"""Conversation:
 {self._format_messages_for_summary(messages)}
 
 Summary:"""
 
         try:
-            from langchain_core.messages import HumanMessage
-            response = await llm.ainvoke([HumanMessage(content=prompt)])
-            return response.content
+            return await get_summary_batcher().submit(
+                prompt, system_prompt=SUMMARIZER_SYSTEM_PROMPT
+            )
         except Exception as e:
-            # Return None if summarization fails
+            logger.warning(f"Summarization failed: {e}")
             return None
 
+    def _cache_summary(self, cache_key: str, summary: str) -> None:
+        """Add a summary to the in-process LRU, evicting the oldest entry."""
+        _summary_cache[cache_key] = summary
+        _summary_cache.move_to_end(cache_key)
+        if len(_summary_cache) > settings.SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+
+    async def _get_stored_summary(
+        self,
+        session_id: str,
+        up_to_message_id: UUID,
+        message_count: int
+    ) -> Optional[str]:
+        """
+        Look up a persisted summary for an exact message window.
+
+        Args:
+            session_id: Session UUID as string
+            up_to_message_id: UUID of the newest summarized message
+            message_count: Number of messages summarized
+
+        Returns:
+            Summary text or None if not stored
+        """
+        try:
+            async with self._session() as session:
+                stored = await SessionSummaryRepository(session).get(
+                    session_id, up_to_message_id, message_count
+                )
+        except Exception as e:
+            logger.warning(f"Failed to read stored summary for session {session_id}: {e}")
+            return None
+        return stored.content if stored else None
+
+    async def _store_summary(
+        self,
+        session_id: str,
+        up_to_message_id: UUID,
+        message_count: int,
+        content: str
+    ) -> None:
+        """
+        Persist a generated summary so later requests can reuse it.
+
+        Failures are logged and ignored; the summary is still returned
+        to the caller.
+
+        Args:
+            session_id: Session UUID as string
+            up_to_message_id: UUID of the newest summarized message
+            message_count: Number of messages summarized
+            content: Summary text
+        """
+        try:
+            async with self._session() as session:
+                await SessionSummaryRepository(session).create(
+                    session_id=session_id,
+                    up_to_message_id=up_to_message_id,
+                    message_count=message_count,
+                    content=content
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to store summary for session {session_id}: {e}")
+
+    def schedule_summary_refresh(self, session_id: str) -> None:
+        """
+        Precompute the session summary in the background.
+
+        Keeps summary generation off the request path: once a session
+        reaches SUMMARY_BACKGROUND_THRESHOLD messages, the summary for
+        its newest message is generated and persisted so a later
+        summary request is served from storage. At most one refresh
+        runs per session; messages added meanwhile are picked up by the
+        next refresh.
+
+        Args:
+            session_id: Session UUID as string
+        """
+        if settings.SUMMARY_BACKGROUND_THRESHOLD <= 0:
+            return
+
+        task = self._summary_tasks.get(session_id)
+        if task is not None and not task.done():
+            return
+
+        task = asyncio.create_task(self._refresh_summary(session_id))
+        self._summary_tasks[session_id] = task
+        task.add_done_callback(
+            lambda t: self._summary_tasks.pop(session_id, None)
+            if self._summary_tasks.get(session_id) is t else None
+        )
+
+    async def _refresh_summary(self, session_id: str) -> None:
+        """
+        Generate and persist the latest summary in its own DB session.
+
+        Args:
+            session_id: Session UUID as string
+        """
+        try:
+            async with self._session_factory() as db:
+                memory = ConversationMemory(db)
+                count = await MessageRepository(db).count_by_session_id(session_id)
+                if count < settings.SUMMARY_BACKGROUND_THRESHOLD:
+                    return
+                await memory.summarize_conversation(session_id)
+        except Exception as e:
+            logger.warning(f"Background summary failed for session {session_id}: {e}")
+
     def _format_messages_for_summary(self, messages: List[BaseMessage]) -> str:
         """
         Format messages for summarization.
@@ -298,88 +621,117 @@ Summary:"""
         Returns:
             Formatted string
         """
-        formatted = []
-        for msg in messages:
-            role = msg.type
-            content = msg.content
-            formatted.append(f"{role.upper()}: {content}")
-        return "\n\n".join(formatted)
+        return "\n\n".join(
+            f"{_TYPE_LABELS.get(msg.type) or msg.type.upper()}: {msg.content}"
+            for msg in messages
+        )
 
     async def summarize_and_compress(
         self,
         session_id: str,
-        max_messages: int = 20
+        max_messages: int = 20,
+        chunk_size: Optional[int] = None
     ) -> List[BaseMessage]:
         """
-        Summarize conversation and replace old messages with summary.
+        Summarize conversation incrementally and build compressed context.
 
-        Compresses old messages into a single system message summary,
-        keeping recent messages intact.
+        Messages are summarized in rolling chunks: while more than
+        ``max_messages`` messages are not yet covered by a chunk summary,
+        the oldest ``chunk_size`` of them are summarized and stored.
+        Earlier chunks are never re-summarized, so each call only pays
+        for the messages added since the previous one. Messages are kept
+        in the database.
 
         Args:
             session_id: Session UUID as string
-            max_messages: Maximum messages to summarize
+            max_messages: Maximum messages to keep uncompressed
+            chunk_size: Messages per summary chunk (defaults to
+                SUMMARY_CHUNK_MESSAGES)
 
         Returns:
-            Updated message list (summary + recent messages)
-        """
-        # Get all messages
-        all_messages = await self.get_conversation_history(session_id=session_id)
-
-        if len(all_messages) <= max_messages:
-            # No need to compress
-            return await self.get_messages_for_llm(session_id=session_id)
-
-        # Summarize older messages
-        older_messages = all_messages[:-max_messages]
-        recent_messages = all_messages[-max_messages:]
-
-        # Convert to LangChain format
-        older_langchain = []
-        for msg in older_messages:
-            if msg.role == MessageRole.USER:
-                older_langchain.append(HumanMessage(content=msg.content))
-            elif msg.role == MessageRole.ASSISTANT:
-                older_langchain.append(AIMessage(content=msg.content))
-            elif msg.role == MessageRole.SYSTEM:
-                older_langchain.append(SystemMessage(content=msg.content))
-            elif msg.role == MessageRole.TOOL:
-                older_langchain.append(ToolMessage(content=msg.content))
-
-        # Generate summary
-        summary = await self.summarize_conversation(
-            session_id=session_id,
-            max_messages=len(older_messages)
-        )
-
-        if not summary:
-            return await self.get_messages_for_llm(session_id=session_id)
+            Compressed context (recent chunk summaries + recent messages)
+        """
+        chunk_size = max(1, chunk_size or settings.SUMMARY_CHUNK_MESSAGES)
+
+        async with self._session() as session:
+            chunks = await SessionSummaryRepository(session).get_chunks(session_id)
+        pending = await self._get_unsummarized_messages(session_id, chunks)
+
+        # Oldest chunks to fold so at most max_messages stay unsummarized
+        to_summarize: List[List[Message]] = []
+        while len(pending) > max_messages:
+            to_summarize.append(pending[:chunk_size])
+            pending = pending[chunk_size:]
+
+        if to_summarize:
+            # Summarize every chunk concurrently so the summary batcher can
+            # send them in one LLM batch instead of one round-trip each
+            summaries = await asyncio.gather(*(
+                self._summarize_messages(self._to_langchain_messages(chunk))
+                for chunk in to_summarize
+            ))
+
+            # Chunks must stay contiguous: store up to the first failure and
+            # keep the rest as plain messages
+            new_chunks = []
+            for chunk, summary in zip(to_summarize, summaries):
+                if summary is None:
+                    break
+                new_chunks.append({
+                    "start_message_id": chunk[0].id,
+                    "up_to_message_id": chunk[-1].id,
+                    "message_count": len(chunk),
+                    "content": summary,
+                })
+            stored = len(new_chunks)
+
+            if new_chunks:
+                async with self._session() as session:
+                    chunks.extend(
+                        await SessionSummaryRepository(session).create_chunks(session_id, new_chunks)
+                    )
+                    await session.commit()
+                # Cached summary responses predate the new chunks
+                get_response_cache().clear(session_namespace(session_id))
+
+            unsummarized = [msg for chunk in to_summarize[stored:] for msg in chunk]
+            pending = unsummarized + pending
+
+        # Assemble context from the most recent chunk summaries
+        context: List[BaseMessage] = [
+            SystemMessage(content=f"Conversation Summary: {chunk.content}")
+            for chunk in chunks[-settings.SUMMARY_MAX_CHUNKS:]
+        ]
+        context.extend(self._to_langchain_messages(pending))
+        return context
+
+    async def _get_unsummarized_messages(
+        self,
+        session_id: str,
+        chunks: List[SessionSummary]
+    ) -> List[Message]:
+        """
+        Get messages newer than the last chunk summary.
 
-        # Replace old messages with summary
-        session = await self._get_db_session()
+        Args:
+            session_id: Session UUID as string
+            chunks: Existing chunk summaries in chronological order
 
-        try:
-            # Delete old messages
-            for msg in older_messages:
-                await self.message_repo.delete(msg.id)
+        Returns:
+            Messages not yet covered by a chunk summary
+        """
+        if not chunks:
+            return await self.get_conversation_history(session_id=session_id)
 
-            # Add summary as system message
-            await self.message_repo.create(
+        # One query: the last summarized message's timestamp is resolved
+        # in SQL (falling back to the chunk's own if it was deleted)
+        async with self._session() as session:
+            return await MessageRepository(session).get_conversation_after_message(
                 session_id=session_id,
-                role=MessageRole.SYSTEM,
-                content=f"Conversation Summary: {summary}",
-                meta={"is_summary": True}
+                message_id=chunks[-1].up_to_message_id,
+                fallback_after=chunks[-1].created_at
             )
 
-            await session.commit()
-
-            # Return updated messages
-            return await self.get_messages_for_llm(session_id=session_id)
-
-        except Exception as e:
-            await session.rollback()
-            raise e
-
     async def search_conversations(
         self,
         user_id: str,
@@ -397,39 +749,14 @@ Summary:"""
         Returns:
             List of (session, messages) tuples
         """
-        session_db = await self._get_db_session()
-
-        try:
-            # Search messages by content
-            matching_messages = await self.message_repo.search_by_content(
+        async with self._session() as session:
+            # One query: the latest match per session, with its session
+            matching_messages = await MessageRepository(session).search_by_content_for_user(
+                user_id=user_id,
                 query=query,
-                limit=limit * 5  # Get more to filter by user
+                limit=limit
             )
-
-            # Filter by user_id and deduplicate by session
-            seen_sessions = set()
-            results = []
-
-            for msg in matching_messages:
-                if msg.session_id in seen_sessions:
-                    continue
-
-                # Get session to verify user_id
-                session_obj = await self.session_repo.get_by_id(str(msg.session_id))
-                if not session_obj or session_obj.user_id != user_id:
-                    continue
-
-                seen_sessions.add(msg.session_id)
-                results.append((session_obj, [msg]))
-
-                if len(results) >= limit:
-                    break
-
-            return results
-
-        except Exception as e:
-            await session_db.rollback()
-            raise e
+            return [(msg.session, [msg]) for msg in matching_messages]
 
     async def get_recent_sessions(
         self,
@@ -448,19 +775,13 @@ Summary:"""
         Returns:
             List of recent sessions
         """
-        session_db = await self._get_db_session()
-
-        try:
-            since_date = datetime.now(timezone.utc) - timedelta(days=days)
-            sessions = await self.session_repo.get_recent_sessions(
+        since_date = datetime.now(timezone.utc) - timedelta(days=days)
+        async with self._session() as session:
+            return await SessionRepository(session).get_recent_sessions(
                 user_id=user_id,
                 limit=limit,
                 since_date=since_date
             )
-            return sessions
-        except Exception as e:
-            await session_db.rollback()
-            raise e
 
     async def update_session_title(
         self,
@@ -477,18 +798,13 @@ Summary:"""
         Returns:
             Updated session
         """
-        session_db = await self._get_db_session()
-
-        try:
-            updated_session = await self.session_repo.update(
+        async with self._session() as session:
+            updated_session = await SessionRepository(session).update(
                 session_id=session_id,
                 title=title
             )
-            await session_db.commit()
+            await session.commit()
             return updated_session
-        except Exception as e:
-            await session_db.rollback()
-            raise e
 
     async def archive_session(
         self,
@@ -503,15 +819,10 @@ Summary:"""
         Returns:
             Archived session
         """
-        session_db = await self._get_db_session()
-
-        try:
-            archived_session = await self.session_repo.archive(session_id)
-            await session_db.commit()
+        async with self._session() as session:
+            archived_session = await SessionRepository(session).archive(session_id)
+            await session.commit()
             return archived_session
-        except Exception as e:
-            await session_db.rollback()
-            raise e
 
     async def delete_session(
         self,
@@ -528,28 +839,29 @@ Summary:"""
         Returns:
             True if successful
         """
-        session_db = await self._get_db_session()
-
-        try:
+        async with self._session() as session:
+            session_repo = SessionRepository(session)
             if soft_delete:
-                await self.session_repo.soft_delete(session_id)
+                await session_repo.soft_delete(session_id)
             else:
-                await self.session_repo.delete(session_id)
-            await session_db.commit()
-            return True
-        except Exception as e:
-            await session_db.rollback()
-            raise e
+                await session_repo.delete(session_id)
+            await session.commit()
+
+        self._invalidate_conversation(session_id)
+        return True
 
 
 # Global memory instance
 _conversation_memory: Optional[ConversationMemory] = None
 
 
-async def get_conversation_memory() -> ConversationMemory:
+def get_conversation_memory() -> ConversationMemory:
     """
     Get or create global conversation memory instance.
 
+    Synchronous: creating the instance does no I/O, so callers on hot
+    paths don't pay for an await.
+
     Returns:
         Conversation memory instance
     """
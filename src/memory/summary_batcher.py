@@ -0,0 +1,232 @@
+"""
+Batched dispatch of summarization prompts.
+
+Collects summary prompts submitted within a short window, grouped by
+summary model, and sends each group to the LLM with a single ``abatch``
+call. Identical prompts submitted concurrently (e.g. a background
+refresh racing an on-demand summary of the same session) share one
+LLM call.
+
+Fixed instructions are passed separately as a system prompt, so every
+request for a model starts with the same bytes and providers can reuse
+their cached prompt prefix.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from src.config import settings
+from src.llm.factory import llm_factory
+
+logger = logging.getLogger("orbit.memory.summary_batcher")
+
+# Small, cheap models used for summarization when SUMMARY_LLM_MODEL is unset
+SUMMARY_DEFAULT_MODELS = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-5-haiku-latest",
+    "gemini": "gemini-2.5-flash-lite",
+    "glm": "glm-4.5-air",
+}
+
+
+class SummaryBatcher:
+    """
+    Coalesces concurrent summarization prompts into batched LLM calls.
+
+    The first prompt for a model opens a window of ``max_delay`` seconds;
+    the window is flushed when it closes or once ``max_batch`` distinct
+    prompts are pending, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = settings.SUMMARY_BATCH_SIZE,
+        max_delay: float = settings.SUMMARY_BATCH_WINDOW_MS / 1000
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_batch: Maximum distinct prompts per LLM batch
+            max_delay: Seconds to wait for a batch to fill
+        """
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        # (provider, model) -> (system prompt, prompt) -> future
+        self._pending: Dict[
+            Tuple[str, Optional[str]], Dict[Tuple[Optional[str], str], asyncio.Future]
+        ] = {}
+        self._timers: Dict[Tuple[str, Optional[str]], asyncio.TimerHandle] = {}
+        # Running flushes; the loop only keeps weak references
+        self._tasks: Set[asyncio.Task] = set()
+        self._llms: Dict[Tuple[str, Optional[str]], object] = {}
+
+    async def submit(
+        self,
+        prompt: str,
+        provider: Optional[str] = None,
+        model_name: Optional[str] = None,
+        system_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Submit a prompt and wait for its completion.
+
+        Args:
+            prompt: Summarization prompt
+            provider: LLM provider (defaults to SUMMARY_LLM_PROVIDER, then
+                DEFAULT_LLM_PROVIDER)
+            model_name: Model name (defaults to SUMMARY_LLM_MODEL, then a
+                small model for the provider)
+            system_prompt: Static instructions sent as a leading system
+                message; keep it identical between calls
+
+        Returns:
+            Generated summary text
+
+        Raises:
+            Exception: If the LLM call for this prompt fails
+        """
+        provider = provider or settings.SUMMARY_LLM_PROVIDER or settings.DEFAULT_LLM_PROVIDER
+        model_name = model_name or settings.SUMMARY_LLM_MODEL or SUMMARY_DEFAULT_MODELS.get(provider)
+        key = (provider, model_name)
+
+        pending = self._pending.setdefault(key, {})
+        future = pending.get((system_prompt, prompt))
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            pending[(system_prompt, prompt)] = future
+
+            if len(pending) >= self.max_batch:
+                self._dispatch(key)
+            elif key not in self._timers:
+                self._timers[key] = asyncio.get_running_loop().call_later(
+                    self.max_delay, self._dispatch, key
+                )
+
+        # Shield so one cancelled caller does not cancel a shared prompt
+        return await asyncio.shield(future)
+
+    def _dispatch(self, key: Tuple[str, Optional[str]]) -> None:
+        """
+        Take the pending batch for a model and start flushing it.
+
+        Args:
+            key: (provider, model) batch key
+        """
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(key, None)
+        if batch:
+            task = asyncio.create_task(self._flush(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def cancel(self) -> None:
+        """Cancel pending timers and running flushes, failing their waiters."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+
+        for batch in self._pending.values():
+            for future in batch.values():
+                future.cancel()
+        self._pending.clear()
+
+        for task in self._tasks:
+            task.cancel()
+
+    async def _flush(
+        self,
+        key: Tuple[str, Optional[str]],
+        batch: Dict[Tuple[Optional[str], str], asyncio.Future]
+    ) -> None:
+        """
+        Run one batch through the LLM and resolve its futures.
+
+        Args:
+            key: (provider, model) batch key
+            batch: Mapping of (system prompt, prompt) to awaiting future
+        """
+        prompts: List[Tuple[Optional[str], str]] = list(batch)
+
+        try:
+            llm = self._get_llm(key)
+            responses = await llm.abatch(
+                [self._build_messages(system_prompt, prompt) for system_prompt, prompt in prompts],
+                return_exceptions=True
+            )
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Summary batch of {len(prompts)} failed: {e}")
+            responses = [e] * len(prompts)
+
+        for prompt, response in zip(prompts, responses):
+            future = batch[prompt]
+            if future.done():
+                continue
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response.content)
+
+    @staticmethod
+    def _build_messages(system_prompt: Optional[str], prompt: str) -> List[BaseMessage]:
+        """Build the chat messages for one prompt, static instructions first."""
+        if system_prompt is None:
+            return [HumanMessage(content=prompt)]
+        return [SystemMessage(content=system_prompt), HumanMessage(content=prompt)]
+
+    def _get_llm(self, key: Tuple[str, Optional[str]]):
+        """
+        Get or create the summary LLM for a batch key.
+
+        Args:
+            key: (provider, model) batch key
+
+        Returns:
+            LangChain chat model
+        """
+        llm = self._llms.get(key)
+        if llm is None:
+            provider, model_name = key
+            llm = llm_factory(
+                provider=provider,
+                model_name=model_name,
+                temperature=0.3,
+                max_tokens=settings.SUMMARY_MAX_TOKENS
+            )
+            self._llms[key] = llm
+        return llm
+
+
+# Global batcher instance
+_summary_batcher: Optional[SummaryBatcher] = None
+
+
+def get_summary_batcher() -> SummaryBatcher:
+    """
+    Get or create global summary batcher.
+
+    Returns:
+        SummaryBatcher instance
+    """
+    global _summary_batcher
+    if _summary_batcher is None:
+        _summary_batcher = SummaryBatcher()
+    return _summary_batcher
+
+
+def reset_summary_batcher():
+    """Reset global summary batcher (for testing)."""
+    global _summary_batcher
+    if _summary_batcher is not None:
+        _summary_batcher.cancel()
+    _summary_batcher = None
@@ -4,12 +4,13 @@ Base tool class for Orbit AI Agent tools.
 All tools should inherit from this class to ensure consistency.
 """
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Optional, Type, Dict, Any
+from typing import Any, Callable, Dict, Optional, Type
 from enum import Enum
 
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 
 class ToolCategory(str, Enum):
@@ -159,12 +160,17 @@ class OrbitTool(BaseTool, ABC):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        try:
-            if hasattr(self, "args_schema") and self.args_schema:
-                self.args_schema.model_validate(input_data)
+        schema = self.args_schema
+        # args_schema may also be a plain JSON schema dict; only models validate
+        if not (isinstance(schema, type) and issubclass(schema, BaseModel)):
             return True, None
-        except Exception as e:
-            return False, f"Validation error: {str(e)}"
+
+        # Call the compiled core validator directly (what model_validate wraps)
+        try:
+            schema.__pydantic_validator__.validate_python(input_data)
+        except ValidationError as e:
+            return False, f"Validation error: {e}"
+        return True, None
 
     @abstractmethod
     async def _arun(self, *args: Any, **kwargs: Any) -> str:
@@ -234,11 +240,17 @@ class OrbitTool(BaseTool, ABC):
             else:
                 result = await self._arun(*args, **kwargs)
 
-            # Try to parse result as ToolOutput if possible
-            if hasattr(self, "return_schema") and self.return_schema:
+            # Try to parse result as ToolOutput if it looks like JSON; plain
+            # text results skip the parse (and the exception) entirely
+            validate_json = self._return_validator()
+            if (
+                validate_json is not None
+                and isinstance(result, str)
+                and result[:1] in ("{", "[")
+            ):
                 try:
-                    self.return_schema.model_validate_json(result)
-                except Exception:
+                    validate_json(result)
+                except ValidationError:
                     pass  # Keep result as string if parsing fails
 
             return result
@@ -252,6 +264,46 @@ class OrbitTool(BaseTool, ABC):
                 suggested_fix=self.get_suggested_fix(e),
             )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the JSON schemas of concrete tools when the class is defined."""
+        super().__pydantic_init_subclass__(**kwargs)
+        if not getattr(cls, "__abstractmethods__", None):
+            cls.get_json_schemas()
+
+    @classmethod
+    @functools.cache
+    def get_json_schemas(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the JSON schemas of the tool's args_schema and return_schema.
+
+        The schemas are fixed per class, so they are built once, when the
+        class is defined; treat the returned dicts as read-only.
+
+        Returns:
+            Dict with "input_schema" and/or "output_schema" for the
+            schemas the tool declares
+        """
+        schemas = {}
+        # Pydantic fields are not class attributes, so read the declared
+        # defaults from model_fields
+        for field_name, key in (("args_schema", "input_schema"), ("return_schema", "output_schema")):
+            field = cls.model_fields.get(field_name)
+            model = field.default if field is not None else None
+            if isinstance(model, type) and issubclass(model, BaseModel):
+                schemas[key] = model.model_json_schema()
+        return schemas
+
+    @classmethod
+    @functools.cache
+    def _return_validator(cls) -> Optional[Callable[[str], Any]]:
+        """Get the JSON validator of the class's return_schema, if it has one."""
+        field = cls.model_fields.get("return_schema")
+        schema = field.default if field is not None else getattr(cls, "return_schema", None)
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            return schema.__pydantic_validator__.validate_json
+        return None
+
     def get_suggested_fix(self, error: Exception) -> Optional[str]:
         """
         Get suggested fix for an error (can be overridden).
@@ -275,9 +327,13 @@ class OrbitTool(BaseTool, ABC):
         return None
 
     @classmethod
+    @functools.cache
     def get_metadata(cls) -> Dict[str, Any]:
         """
         Get tool metadata for registration.
+
+        Metadata is fixed per class, so it is built once per class and the
+        same dict is returned on later calls; treat it as read-only.
         """
 
         def get_field_val(name, default):
@@ -317,8 +373,9 @@ class OrbitTool(BaseTool, ABC):
         Returns:
             True if safe, False otherwise
         """
-        danger_level = cls.danger_level if hasattr(cls, "danger_level") else 0
-        return danger_level <= user_permission_level
+        # Fields are not class attributes on pydantic models; read the
+        # declared default from the cached metadata
+        return cls.get_metadata()["danger_level"] <= user_permission_level
 
     @classmethod
     def requires_confirmation_for_user(cls, user_permission_level: int = 1) -> bool:
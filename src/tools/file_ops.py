@@ -5,12 +5,13 @@ Provides file reading, writing, and directory operations via NestJS Bridge.
 Split into separate tools for easier LLM understanding and usage.
 """
 
-from typing import Optional
+import asyncio
+from typing import List, Optional
 
 from pydantic import Field
 
 from src.tools.base import OrbitTool, ToolCategory, ToolInput
-from src.bridge.orchestrator_client import orchestrator_client
+from src.bridge.orchestrator_client import get_orchestrator_client
 
 
 class ListFilesInput(ToolInput):
@@ -27,6 +28,12 @@ class ReadFileInput(ToolInput):
     path: str = Field(..., description="Path to the file to read")
 
 
+class ReadFilesInput(ToolInput):
+    """Input schema for reading several files."""
+
+    paths: List[str] = Field(..., min_length=1, description="Paths of the files to read")
+
+
 class WriteFileInput(ToolInput):
     """Input schema for writing a file."""
 
@@ -55,13 +62,18 @@ class DeletePathInput(ToolInput):
     force: bool = Field(False, description="Force delete without confirmation")
 
 
+# Largest file prefix returned by read_file
+READ_FILE_MAX_BYTES = 10000
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def _format_size(size: int) -> str:
     """Format file size for human readability."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024:
-            return f"{size} {unit}"
-        size = int(size / 1024)
-    return f"{size} TB"
+    # Each unit is 10 bits wider than the previous one
+    unit = min((max(size, 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size >> (10 * unit)} {_SIZE_UNITS[unit]}"
 
 
 class ListFilesTool(OrbitTool):
@@ -76,7 +88,7 @@ class ListFilesTool(OrbitTool):
 
     async def _arun(self, path: str = ".") -> str:
         try:
-            response = await orchestrator_client.list_files(path=path)
+            response = await get_orchestrator_client().list_files(path=path)
 
             if response.exit_code != 0:
                 raise Exception(f"Failed to list files: {response.stderr}")
@@ -99,7 +111,10 @@ class ReadFileTool(OrbitTool):
 
     async def _arun(self, path: str) -> str:
         try:
-            response = await orchestrator_client.read_file(path=path)
+            # Only the first READ_FILE_MAX_BYTES cross the wire
+            response = await get_orchestrator_client().read_file(
+                path=path, max_bytes=READ_FILE_MAX_BYTES
+            )
 
             if response.exit_code != 0:
                 raise Exception(f"Failed to read file: {response.stderr}")
@@ -107,10 +122,8 @@ class ReadFileTool(OrbitTool):
             content = response.stdout or ""
             result = f"Contents of '{path}':\n\n{content}"
 
-            if len(result) > 10000:
-                result = (
-                    result[:10000] + "\n\n[... Content truncated - file too large ...]"
-                )
+            if response.truncated:
+                result += "\n\n[... Content truncated - file too large ...]"
 
             return result
 
@@ -118,6 +131,42 @@ class ReadFileTool(OrbitTool):
             raise Exception(f"Error reading file: {str(e)}")
 
 
+class ReadFilesTool(OrbitTool):
+    """Read contents of several files at once."""
+
+    name: str = "read_files"
+    description: str = (
+        "Read and return the contents of several files in one call. "
+        "Prefer this over repeated read_file calls when you need multiple files."
+    )
+    category: ToolCategory = ToolCategory.SYSTEM
+    danger_level: int = 1
+    requires_confirmation: bool = False
+    args_schema: type = ReadFilesInput
+
+    async def _arun(self, paths: List[str]) -> str:
+        client = get_orchestrator_client()
+        # Reads issued together are coalesced into one Bridge batch request
+        responses = await asyncio.gather(
+            *(client.read_file(path=path, max_bytes=READ_FILE_MAX_BYTES) for path in paths),
+            return_exceptions=True,
+        )
+
+        sections = []
+        for path, response in zip(paths, responses):
+            if isinstance(response, BaseException):
+                sections.append(f"Error reading '{path}': {response}")
+            elif response.exit_code != 0:
+                sections.append(f"Failed to read '{path}': {response.stderr}")
+            else:
+                section = f"Contents of '{path}':\n\n{response.stdout or ''}"
+                if response.truncated:
+                    section += "\n\n[... Content truncated - file too large ...]"
+                sections.append(section)
+
+        return "\n\n".join(sections)
+
+
 class WriteFileTool(OrbitTool):
     """Write content to a file."""
 
@@ -132,7 +181,7 @@ class WriteFileTool(OrbitTool):
         self, path: str, content: str, mode: str = "write", create_dirs: bool = True
     ) -> str:
         try:
-            response = await orchestrator_client.write_file(
+            response = await get_orchestrator_client().write_file(
                 path=path, content=content, mode=mode, create_dirs=create_dirs
             )
 
@@ -157,7 +206,7 @@ class CreateDirectoryTool(OrbitTool):
 
     async def _arun(self, path: str, create_parents: bool = True) -> str:
         try:
-            response = await orchestrator_client.create_directory(
+            response = await get_orchestrator_client().create_directory(
                 path=path, create_parents=create_parents
             )
 
@@ -186,7 +235,7 @@ class DeletePathTool(OrbitTool):
         self, path: str, recursive: bool = False, force: bool = False
     ) -> str:
         try:
-            response = await orchestrator_client.delete_path(
+            response = await get_orchestrator_client().delete_path(
                 path=path, recursive=recursive, force=force
             )
 
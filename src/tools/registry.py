@@ -4,8 +4,13 @@ Tool registry for Orbit AI Agent.
 Provides auto-discovery and registration of tools.
 """
 
+import importlib
 import inspect
-from typing import Dict, List, Type, Optional, Any, Callable
+import logging
+import pkgutil
+from bisect import bisect_right, insort
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Type, Optional, Any, Callable, Tuple
 from pathlib import Path
 
 from src.tools.base import OrbitTool
@@ -13,12 +18,15 @@ from src.tools.shell import ShellTool
 from src.tools.file_ops import (
     ListFilesTool,
     ReadFileTool,
+    ReadFilesTool,
     WriteFileTool,
     CreateDirectoryTool,
     DeletePathTool,
 )
 from src.tools.web.tavily import WebSearchTool, NewsSearchTool
 
+logger = logging.getLogger("orbit.tools.registry")
+
 
 class ToolRegistry:
     """
@@ -31,6 +39,17 @@ class ToolRegistry:
         """Initialize empty registry."""
         self._tools: Dict[str, Type[OrbitTool]] = {}
         self._tool_instances: Dict[str, OrbitTool] = {}
+        # Read-only live views handed out by get_all_tools/get_all_instances
+        self._tools_view = MappingProxyType(self._tools)
+        self._instances_view = MappingProxyType(self._tool_instances)
+        # Indexes maintained by register_tool so lookups don't rescan tools
+        self._by_category: Dict[str, List[str]] = {}
+        # (danger_level, name), sorted
+        self._by_danger: List[Tuple[int, str]] = []
+        # Tool schemas by name, built on first request
+        self._schema_cache: Dict[str, Dict[str, Any]] = {}
+        # Lowercased name and description per tool, for search_tools
+        self._search_text: Dict[str, Tuple[str, str]] = {}
 
     def register_tool(self, tool_class: Type[OrbitTool]) -> None:
         """
@@ -50,8 +69,22 @@ class ToolRegistry:
         tool_instance = tool_class()
         metadata = tool_class.get_metadata()
 
-        self._tools[metadata["name"]] = tool_class
-        self._tool_instances[metadata["name"]] = tool_instance
+        name = metadata["name"]
+        if name in self._tools:
+            self._unindex(name)
+            self._schema_cache.pop(name, None)
+
+        self._tools[name] = tool_class
+        self._tool_instances[name] = tool_instance
+        self._by_category.setdefault(metadata["category"], []).append(name)
+        insort(self._by_danger, (metadata["danger_level"], name))
+        self._search_text[name] = (name.lower(), metadata.get("description", "").lower())
+
+    def _unindex(self, name: str) -> None:
+        """Remove a tool from the lookup indexes before it is re-registered."""
+        metadata = self._tools[name].get_metadata()
+        self._by_category[metadata["category"]].remove(name)
+        self._by_danger.remove((metadata["danger_level"], name))
 
     def register_tools(self, tool_classes: List[Type[OrbitTool]]) -> None:
         """
@@ -75,23 +108,25 @@ class ToolRegistry:
         """
         return self._tool_instances.get(tool_name)
 
-    def get_all_tools(self) -> Dict[str, Type[OrbitTool]]:
+    def get_all_tools(self) -> Mapping[str, Type[OrbitTool]]:
         """
         Get all registered tool classes.
 
         Returns:
-            Dictionary mapping tool names to tool classes
+            Read-only view mapping tool names to tool classes; it reflects
+            later registrations, so copy it to keep a snapshot
         """
-        return self._tools.copy()
+        return self._tools_view
 
-    def get_all_instances(self) -> Dict[str, OrbitTool]:
+    def get_all_instances(self) -> Mapping[str, OrbitTool]:
         """
         Get all tool instances.
 
         Returns:
-            Dictionary mapping tool names to tool instances
+            Read-only view mapping tool names to tool instances; it reflects
+            later registrations, so copy it to keep a snapshot
         """
-        return self._tool_instances.copy()
+        return self._instances_view
 
     def get_tools_by_category(self, category: str) -> List[str]:
         """
@@ -103,11 +138,7 @@ class ToolRegistry:
         Returns:
             List of tool names in the category
         """
-        return [
-            name
-            for name, tool_class in self._tools.items()
-            if tool_class.get_metadata().get("category") == category
-        ]
+        return self._by_category.get(category, []).copy()
 
     def get_safe_tools_for_user(
         self, user_permission_level: int = 1
@@ -121,11 +152,14 @@ class ToolRegistry:
         Returns:
             Dictionary of tool names to safe tool instances
         """
-        safe_tools = {}
-        for name, tool_instance in self._tool_instances.items():
-            if tool_instance.is_safe_for_user(user_permission_level):
-                safe_tools[name] = tool_instance
-        return safe_tools
+        # Tools are sorted by danger level: the safe ones are a prefix
+        cutoff = bisect_right(
+            self._by_danger, user_permission_level, key=lambda entry: entry[0]
+        )
+        return {
+            name: self._tool_instances[name]
+            for _, name in self._by_danger[:cutoff]
+        }
 
     def get_tools_requiring_confirmation(
         self, user_permission_level: int = 1
@@ -183,47 +217,52 @@ class ToolRegistry:
         """
         # Import the package
         try:
-            package = __import__(package_name)
+            package = importlib.import_module(package_name)
         except ImportError:
             return 0
 
         discovered_count = 0
 
-        # Scan all modules in the package
-        for name, _ in inspect.getmembers(package):
-            # Skip private modules and __init__
-            if not isinstance(name, str) or name.startswith("_") or name == "__init__":
+        # Walk every submodule, including ones the package's __init__ does
+        # not import itself
+        modules = [package]
+        for module_info in pkgutil.walk_packages(
+            getattr(package, "__path__", []),
+            prefix=f"{package.__name__}.",
+            onerror=lambda name: logger.warning(f"Failed to import package {name}"),
+        ):
+            if module_info.name.rsplit(".", 1)[-1].startswith("_"):
                 continue
-
-            # Get the module
-            module = getattr(package, name)
-
-            # Skip if it's not a module (e.g., package-level attributes)
-            if not inspect.ismodule(module):
-                continue
-
-            # Find all classes in the module
-            for _, obj in inspect.getmembers(module):
-                if inspect.isclass(obj) and issubclass(obj, base_class):
-                    # Skip the base class itself
-                    if obj is base_class:
-                        continue
-
-                    # Skip abstract classes
-                    if inspect.isabstract(obj):
-                        continue
-
-                    # Skip classes defined in other modules
-                    if obj.__module__ != module.__name__:
-                        continue
-
-                    # Register the tool
-                    try:
-                        self.register_tool(obj)
-                        discovered_count += 1
-                    except Exception as e:
-                        # Log error but continue discovering other tools
-                        print(f"Warning: Failed to register tool {obj.__name__}: {e}")
+            try:
+                modules.append(importlib.import_module(module_info.name))
+            except Exception as e:
+                logger.warning(f"Failed to import module {module_info.name}: {e}")
+
+        for module in modules:
+            # Find all classes defined in the module
+            for obj in list(vars(module).values()):
+                if not (isinstance(obj, type) and issubclass(obj, base_class)):
+                    continue
+
+                # Skip the base class itself
+                if obj is base_class:
+                    continue
+
+                # Skip abstract classes
+                if inspect.isabstract(obj):
+                    continue
+
+                # Skip classes defined in other modules
+                if obj.__module__ != module.__name__:
+                    continue
+
+                # Register the tool
+                try:
+                    self.register_tool(obj)
+                    discovered_count += 1
+                except Exception as e:
+                    # Log error but continue discovering other tools
+                    logger.warning(f"Failed to register tool {obj.__name__}: {e}")
 
         return discovered_count
 
@@ -238,22 +277,13 @@ class ToolRegistry:
             List of matching tool names
         """
         query_lower = query.lower()
-        matches = []
-
-        for name, tool_class in self._tools.items():
-            metadata = tool_class.get_metadata()
-            # Search in tool name
-            if query_lower in name.lower():
-                matches.append(name)
-                continue
-
-            # Search in description
-            description = metadata.get("description", "").lower()
-            if query_lower in description:
-                matches.append(name)
-                continue
 
-        return list(set(matches))  # Remove duplicates
+        # Search in tool name, then description
+        return [
+            name
+            for name, (name_lower, description) in self._search_text.items()
+            if query_lower in name_lower or query_lower in description
+        ]
 
     def format_tools_for_llm(self, tools: Optional[List[str]] = None) -> List[str]:
         """
@@ -291,29 +321,13 @@ class ToolRegistry:
         Returns:
             Tool schema dictionary or None if tool not found
         """
-        tool_class = self._tools.get(tool_name)
-        if tool_class is None:
-            return None
-
-        metadata = tool_class.get_metadata()
-        schema = {
-            "name": metadata["name"],
-            "description": metadata["description"],
-            "category": metadata.get("category"),
-            "danger_level": metadata.get("danger_level", 0),
-            "requires_confirmation": metadata.get("requires_confirmation", False),
-            "allowed_environments": metadata.get("allowed_environments", []),
-            "module": metadata.get("module"),
-            "class": metadata.get("class"),
-        }
-
-        # Add input/output schema if available
-        if hasattr(tool_class, "args_schema") and tool_class.args_schema:
-            schema["input_schema"] = tool_class.args_schema.model_json_schema()
-        if hasattr(tool_class, "return_schema") and tool_class.return_schema:
-            schema["output_schema"] = tool_class.return_schema.model_json_schema()
-
-        return schema
+        schema = self._schema_cache.get(tool_name)
+        if schema is None:
+            tool_class = self._tools.get(tool_name)
+            if tool_class is None:
+                return None
+            schema = self._schema_cache[tool_name] = _build_schema(tool_class)
+        return schema.copy()
 
     def get_all_schemas(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -330,6 +344,34 @@ class ToolRegistry:
         return schemas
 
 
+def _build_schema(tool_class: Type[OrbitTool]) -> Dict[str, Any]:
+    """
+    Build the schema description of a tool class.
+
+    Args:
+        tool_class: Tool class
+
+    Returns:
+        Tool schema dictionary
+    """
+    metadata = tool_class.get_metadata()
+    schema = {
+        "name": metadata["name"],
+        "description": metadata["description"],
+        "category": metadata.get("category"),
+        "danger_level": metadata.get("danger_level", 0),
+        "requires_confirmation": metadata.get("requires_confirmation", False),
+        "allowed_environments": metadata.get("allowed_environments", []),
+        "module": metadata.get("module"),
+        "class": metadata.get("class"),
+    }
+
+    # Add input/output schema if available (precomputed per class)
+    schema.update(tool_class.get_json_schemas())
+
+    return schema
+
+
 # Singleton registry instance
 _global_registry: Optional[ToolRegistry] = None
 
@@ -354,6 +396,7 @@ def get_tool_registry() -> ToolRegistry:
         # Register file operation tools
         _global_registry.register_tool(ListFilesTool)
         _global_registry.register_tool(ReadFileTool)
+        _global_registry.register_tool(ReadFilesTool)
         _global_registry.register_tool(WriteFileTool)
         _global_registry.register_tool(CreateDirectoryTool)
         _global_registry.register_tool(DeletePathTool)
@@ -4,7 +4,7 @@ import shlex
 from pydantic import BaseModel, Field
 
 from src.tools.base import OrbitTool, ToolCategory, ToolInput, ToolError
-from src.bridge.orchestrator_client import orchestrator_client, BridgeCommandResponse
+from src.bridge.orchestrator_client import get_orchestrator_client, BridgeCommandResponse
 
 
 class ShellToolInput(ToolInput):
@@ -71,7 +71,7 @@ class ShellTool(OrbitTool):
             args = parts[1:]
 
             # Execute via Bridge
-            response = await orchestrator_client.execute_command(cmd, args, cwd)
+            response = await get_orchestrator_client().execute_command(cmd, args, cwd)
 
             if response.exit_code != 0:
                 error_msg = f"Command failed with exit code {response.exit_code}"
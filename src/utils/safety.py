@@ -1,71 +1,183 @@
-from typing import Dict, Any, Tuple
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import Dict, Any, Optional, Tuple
+import asyncio
 import json
+import logging
 import re
+import time
+import orjson
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import Runnable
 from src.llm.factory import llm_factory
 from src.agent.prompts.safety import safety_prompt
+from src.config import settings
+
+logger = logging.getLogger("orbit.safety")
 
 # Simple allowlist for common, low-risk commands
 # Only applied if no complex shell operators are present
-SAFE_PREFIXES = [
-    "ls", "pwd", "echo", "cat", "grep", "find", 
+SAFE_PREFIXES = (
+    "ls", "pwd", "echo", "cat", "grep", "find",
     "git status", "git log", "git diff", "git show",
     "npm list", "pip list"
-]
+)
+
+# SAFE_PREFIXES by token count, so the whitelist check is a hash lookup
+# of the command's first one or two words whatever the list's length
+_SAFE_COMMANDS = frozenset(prefix for prefix in SAFE_PREFIXES if " " not in prefix)
+_SAFE_SUBCOMMANDS = frozenset(
+    tuple(prefix.split()) for prefix in SAFE_PREFIXES if " " in prefix
+)
+
+# Characters that imply chaining, redirection or substitution; tested
+# with frozenset.isdisjoint, a C-level scan that stops at the first hit
+DANGEROUS_CHARS = frozenset(";&|><`$")
+
+# Unambiguously destructive commands, rejected without asking the LLM:
+# recursive delete of /, filesystem formatting, dd onto a device, fork bomb
+_DENY_RE = re.compile(
+    r"\brm\s+(?:-[a-z]*r[a-z]*f[a-z]*|-[a-z]*f[a-z]*r[a-z]*|--no-preserve-root)\b[^|;&]*\s/(?:\*|\s|$)"
+    r"|\bmkfs(?:\.\w+)?\b"
+    r"|\bdd\b[^|;&]*\bof=/dev/"
+    r"|:\(\)\s*\{",
+    re.IGNORECASE,
+)
+
+# Body of a ```json (or bare ```) code block in an LLM answer
+_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
+# Normalized command -> (expires_at, (is_safe, reason)), LRU ordered
+_safety_cache: "OrderedDict[str, Tuple[float, Tuple[bool, str]]]" = OrderedDict()
+# In-flight LLM checks by normalized command
+_inflight_checks: Dict[str, asyncio.Task] = {}
+
+# Safety-check chain, built on first use and shared by all checks
+_safety_chain: Optional[Runnable] = None
+
 
-DANGEROUS_CHARS_REGEX = re.compile(r"[;&|><`$]")
+def _get_safety_chain() -> Runnable:
+    """Get the safety-check chain (low temperature for deterministic checks)."""
+    global _safety_chain
+    if _safety_chain is None:
+        _safety_chain = safety_prompt | llm_factory(temperature=0) | StrOutputParser()
+    return _safety_chain
+
+
+def reset_safety_chain():
+    """Reset the cached safety-check chain (for testing or after settings change)."""
+    global _safety_chain
+    _safety_chain = None
 
 async def is_safe_command(command: str) -> Tuple[bool, str]:
     """
     Analyzes a shell command to determine if it is safe to execute.
     Returns (is_safe: bool, reason: str).
     """
-    print(f"DEBUG: Checking safety for '{command}'")
-    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Checking safety for {command!r}")
+
     if not command or not command.strip():
         return False, "Empty command"
 
     clean_cmd = command.strip()
-    
-    # 1. heuristic check: If simple command in whitelist, allow it.
+
+    # 1. Known-destructive patterns are rejected outright
+    if _DENY_RE.search(clean_cmd):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Rejected by deny list: {clean_cmd!r}")
+        return False, "Matches a known dangerous pattern"
+
+    # 2. heuristic check: If simple command in whitelist, allow it.
     # Check for dangerous characters that imply chaining or redirection
-    if not DANGEROUS_CHARS_REGEX.search(clean_cmd):
-        for prefix in SAFE_PREFIXES:
-            if clean_cmd.startswith(prefix):
-                 if clean_cmd == prefix or clean_cmd.startswith(prefix + " "):
-                     print(f"DEBUG: Allowed by whitelist: {prefix}")
-                     return True, "Whitelisted safe command"
-    
-    # 2. LLM check for everything else
-    # Initialize LLM (use low temp for deterministic safety checks)
-    llm = llm_factory(temperature=0)
+    if DANGEROUS_CHARS.isdisjoint(clean_cmd):
+        tokens = clean_cmd.split(None, 2)
+        if tokens[0] in _SAFE_COMMANDS:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Allowed by whitelist: {tokens[0]}")
+            return True, "Whitelisted safe command"
+        if tuple(tokens[:2]) in _SAFE_SUBCOMMANDS:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Allowed by whitelist: {' '.join(tokens[:2])}")
+            return True, "Whitelisted safe command"
     
-    # Create the chain
-    chain = safety_prompt | llm | StrOutputParser()
+    # 3. LLM check for everything else; repeated commands are answered
+    # from the verdict cache and concurrent duplicates share one LLM call
+    key = _normalize_command(clean_cmd)
+    cached = _safety_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        _safety_cache.move_to_end(key)
+        return cached[1]
+
+    task = _inflight_checks.get(key)
+    if task is None:
+        task = asyncio.create_task(_check_with_llm(command))
+        _inflight_checks[key] = task
+        task.add_done_callback(lambda _: _inflight_checks.pop(key, None))
 
     try:
-        # Execute the chain
-        result_text = await chain.ainvoke({"command": command})
-        print(f"DEBUG: LLM Output for '{command}': {result_text}")
-        
-        # Clean up Markdown code blocks if present
-        json_str = result_text.strip()
-        if "```json" in json_str:
-            json_str = json_str.split("```json")[1].split("```")[0].strip()
-        elif "```" in json_str:
-             json_str = json_str.split("```")[1].split("```")[0].strip()
-             
-        data = json.loads(json_str)
-        
-        is_safe = data.get("safe", False)
-        reason = data.get("reason", "Unknown risk")
-        
-        return is_safe, reason
-        
-    except json.JSONDecodeError:
-        print(f"ERROR: Failed to parse JSON: {result_text}")
+        # Shield so one cancelled caller does not cancel a shared check
+        verdict = await asyncio.shield(task)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse safety verdict JSON: {e.doc}")
         return False, "Safety check failed: Invalid JSON response from LLM"
     except Exception as e:
-        print(f"ERROR: Safety check exception: {e}")
+        logger.error(f"Safety check exception: {e}")
         # Default to unsafe if we can't be sure
         return False, f"Safety check failed: {str(e)}"
+
+    _cache_verdict(key, verdict)
+    return verdict
+
+
+async def _check_with_llm(command: str) -> Tuple[bool, str]:
+    """Ask the LLM whether a command is safe; raises if the answer is unusable."""
+    # Stream the answer and stop once the verdict object is closed, so
+    # the check doesn't wait for whatever the model adds after it
+    parts = []
+    depth = 0
+    json_str = None
+    async with aclosing(_get_safety_chain().astream({"command": command})) as stream:
+        async for chunk in stream:
+            parts.append(chunk)
+            opened = chunk.count("{")
+            if opened or depth:
+                depth += opened - chunk.count("}")
+                if depth <= 0:
+                    result_text = "".join(parts)
+                    json_str = result_text[result_text.index("{"):result_text.rindex("}") + 1]
+                    break
+
+    if json_str is None:
+        result_text = "".join(parts)
+        # Unwrap a Markdown code block if present
+        fenced = _FENCE_RE.search(result_text)
+        json_str = fenced.group(1) if fenced else result_text
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"LLM output for {command!r}: {result_text}")
+
+    data = orjson.loads(json_str.strip())
+
+    is_safe = data.get("safe", False)
+    reason = data.get("reason", "Unknown risk")
+
+    return is_safe, reason
+
+
+def _normalize_command(command: str) -> str:
+    """
+    Collapse whitespace so trivially different spellings share a cache key.
+
+    Quoting is kept as written: shlex-splitting would map e.g.
+    echo "$(cmd)" and echo '$(cmd)' to the same key although only the
+    first one runs cmd.
+    """
+    return " ".join(command.split())
+
+
+def _cache_verdict(key: str, verdict: Tuple[bool, str]) -> None:
+    """Add an LLM verdict to the LRU, evicting the oldest entry."""
+    _safety_cache[key] = (time.monotonic() + settings.SAFETY_CACHE_TTL, verdict)
+    _safety_cache.move_to_end(key)
+    if len(_safety_cache) > settings.SAFETY_CACHE_SIZE:
+        _safety_cache.popitem(last=False)
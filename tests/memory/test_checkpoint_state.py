@@ -0,0 +1,76 @@
+"""
+Unit tests for the checkpoint state encoding (zstd-compressed orjson).
+"""
+
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import orjson
+from pydantic import BaseModel
+
+from src.memory.checkpointer import (
+    _STATE_FORMAT_JSON,
+    _STATE_FORMAT_ZSTD,
+    _STATE_OFFLOAD_BYTES,
+    _pack_state,
+    _unpack_state,
+    _unpack_states,
+)
+
+
+class ToolCall(BaseModel):
+    """Pydantic value stored in an agent state."""
+
+    name: str
+    args: dict
+
+
+def test_pack_state_round_trip():
+    """Packed state decodes back to its JSON form."""
+    run_id = uuid4()
+    created = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    state = {
+        "messages": ["hi", "there"],
+        "run_id": run_id,
+        "created": created,
+        "tool": ToolCall(name="ls", args={"path": "/tmp"}),
+    }
+
+    packed = _pack_state(state)
+
+    assert packed[0] == _STATE_FORMAT_ZSTD
+    assert _unpack_state(packed) == {
+        "messages": ["hi", "there"],
+        "run_id": str(run_id),
+        "created": created.isoformat(),
+        "tool": {"name": "ls", "args": {"path": "/tmp"}},
+    }
+
+
+def test_pack_state_rejects_unknown_types():
+    """Values neither orjson nor Pydantic can encode raise TypeError."""
+    with pytest.raises(TypeError):
+        _pack_state({"value": object()})
+
+
+def test_unpack_plain_json_state():
+    """Rows migrated from the JSONB column are stored uncompressed."""
+    data = bytes([_STATE_FORMAT_JSON]) + orjson.dumps({"step": 3})
+
+    assert _unpack_state(data) == {"step": 3}
+
+
+def test_unpack_unknown_format():
+    """An unknown format tag is an error, not garbage state."""
+    with pytest.raises(ValueError):
+        _unpack_state(bytes([99]) + b"{}")
+
+
+@pytest.mark.asyncio
+async def test_unpack_states_large_batch():
+    """Large batches are decoded off the event loop with the same result."""
+    states = [{"blob": "x" * _STATE_OFFLOAD_BYTES, "index": i} for i in range(2)]
+    blobs = [bytes([_STATE_FORMAT_JSON]) + orjson.dumps(state) for state in states]
+
+    assert await _unpack_states(blobs) == states
@@ -0,0 +1,224 @@
+"""
+Unit tests for the in-process response and conversation caches.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api import cache as cache_module
+from src.api.cache import ResponseCache, get_response_cache, reset_response_cache, session_namespace
+from src.db.models import MessageRole
+from src.memory import conversation as conversation_module
+from src.memory.conversation import ConversationMemory
+
+
+class FakeClock:
+    """Replacement for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeSession:
+    """Async session stand-in; the fake repository does the work."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        pass
+
+
+class FakeMessageRepository:
+    """Records conversation reads and stores created messages in memory."""
+
+    reads = 0
+    messages = []
+    read_delay = 0
+
+    def __init__(self, session):
+        self.session = session
+
+    async def get_conversation(self, session_id, **kwargs):
+        type(self).reads += 1
+        snapshot = list(self.messages)
+        await asyncio.sleep(self.read_delay)
+        return snapshot
+
+    async def create(self, session_id, role, content, meta):
+        self.messages.append(content)
+        return content
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time.monotonic for the cache modules."""
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def memory(monkeypatch):
+    """ConversationMemory backed by FakeMessageRepository."""
+    FakeMessageRepository.reads = 0
+    FakeMessageRepository.messages = []
+    FakeMessageRepository.read_delay = 0
+    monkeypatch.setattr(conversation_module, "MessageRepository", FakeMessageRepository)
+    monkeypatch.setattr(conversation_module, "single_worker", lambda: True)
+    reset_response_cache()
+    memory = ConversationMemory(session_factory=FakeSession)
+    monkeypatch.setattr(memory, "schedule_summary_refresh", lambda session_id: None)
+    yield memory
+    reset_response_cache()
+
+
+def test_response_cache_expires_entries(clock):
+    """Entries are served until their TTL passes."""
+    cache = ResponseCache(max_entries=10)
+    cache.set("ns", "key", "value", expire=30)
+
+    assert cache.get("ns", "key") == "value"
+    clock.now += 31
+    assert cache.get("ns", "key") is None
+
+
+def test_response_cache_evicts_least_recently_used(clock):
+    """Reading an entry protects it from eviction."""
+    cache = ResponseCache(max_entries=2)
+    cache.set("ns", "a", 1, expire=30)
+    cache.set("ns", "b", 2, expire=30)
+    cache.get("ns", "a")
+    cache.set("ns", "c", 3, expire=30)
+
+    assert cache.get("ns", "a") == 1
+    assert cache.get("ns", "b") is None
+    assert cache.get("ns", "c") == 3
+
+
+def test_response_cache_clears_one_namespace(clock):
+    """Clearing a namespace leaves other namespaces cached."""
+    cache = ResponseCache(max_entries=10)
+    cache.set(session_namespace("1"), "detail", "one", expire=30)
+    cache.set(session_namespace("2"), "detail", "two", expire=30)
+
+    cache.clear(session_namespace("1"))
+
+    assert cache.get(session_namespace("1"), "detail") is None
+    assert cache.get(session_namespace("2"), "detail") == "two"
+
+
+def test_response_cache_clear_after_eviction_and_expiry(clock):
+    """Evicted and expired entries leave the namespace index consistent."""
+    cache = ResponseCache(max_entries=2)
+    cache.set(session_namespace("1"), "detail", "one", expire=10)
+    cache.set(session_namespace("1"), "messages", "many", expire=30)
+    cache.set(session_namespace("2"), "detail", "two", expire=30)
+    clock.now += 20
+    assert cache.get(session_namespace("1"), "messages") == "many"
+
+    cache.clear(session_namespace("1"))
+    cache.clear(session_namespace("3"))
+
+    assert cache.get(session_namespace("1"), "messages") is None
+    assert cache.get(session_namespace("2"), "detail") == "two"
+    assert cache._namespaces == {session_namespace("2"): {"detail"}}
+
+
+def test_disabled_response_cache_stores_nothing(clock):
+    """A disabled cache always misses."""
+    cache = ResponseCache(max_entries=10, enabled=False)
+    cache.set("ns", "key", "value", expire=30)
+
+    assert cache.get("ns", "key") is None
+
+
+def test_response_cache_disabled_with_several_workers(monkeypatch):
+    """The global cache is only enabled when served by one worker."""
+    monkeypatch.setattr(cache_module.settings, "DEBUG", False)
+    monkeypatch.setattr(cache_module.settings, "WORKERS", 4)
+    reset_response_cache()
+    try:
+        assert not get_response_cache().enabled
+    finally:
+        reset_response_cache()
+
+
+@pytest.mark.asyncio
+async def test_conversation_history_is_cached(memory):
+    """Repeated reads of an unchanged session skip the repository."""
+    first = await memory.get_conversation_history("s1")
+    second = await memory.get_conversation_history("s1")
+
+    assert first == second == []
+    assert FakeMessageRepository.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_add_message_invalidates_caches(memory, monkeypatch):
+    """Adding a message drops cached history and cached API responses."""
+    monkeypatch.setattr(get_response_cache(), "enabled", True)
+    get_response_cache().set(session_namespace("s1"), "detail", "stale", expire=30)
+    await memory.get_conversation_history("s1")
+
+    await memory.add_message("s1", MessageRole.USER, "hello", strict=True)
+    history = await memory.get_conversation_history("s1")
+
+    assert history == ["hello"]
+    assert FakeMessageRepository.reads == 2
+    assert get_response_cache().get(session_namespace("s1"), "detail") is None
+
+
+@pytest.mark.asyncio
+async def test_read_racing_a_write_is_not_cached(memory):
+    """A read that started before a write does not repopulate the cache."""
+    FakeMessageRepository.read_delay = 0.02
+    read = asyncio.create_task(memory.get_conversation_history("s1"))
+    await asyncio.sleep(0)
+    await memory.add_message("s1", MessageRole.USER, "hello", strict=True)
+
+    assert await read == []
+    FakeMessageRepository.read_delay = 0
+    assert await memory.get_conversation_history("s1") == ["hello"]
+
+
+@pytest.mark.asyncio
+async def test_conversation_cache_disabled_with_several_workers(monkeypatch):
+    """Other workers' writes can't invalidate the cache, so it is not used."""
+    FakeMessageRepository.reads = 0
+    FakeMessageRepository.messages = []
+    FakeMessageRepository.read_delay = 0
+    monkeypatch.setattr(conversation_module, "MessageRepository", FakeMessageRepository)
+    monkeypatch.setattr(conversation_module, "single_worker", lambda: False)
+    memory = ConversationMemory(session_factory=FakeSession)
+
+    await memory.get_conversation_history("s1")
+    await memory.get_conversation_history("s1")
+
+    assert FakeMessageRepository.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_conversation_versions_are_bounded(memory, monkeypatch):
+    """Version records are evicted without reviving stale cached reads."""
+    monkeypatch.setattr(conversation_module.settings, "CONVERSATION_CACHE_SIZE", 2)
+    await memory.get_conversation_history("s1")
+    await memory.add_message("s1", MessageRole.USER, "hello", strict=True)
+
+    for session_id in ("s2", "s3", "s4"):
+        memory._invalidate_conversation(session_id)
+
+    assert list(memory._conversation_versions) == ["s3", "s4"]
+    assert await memory.get_conversation_history("s1") == ["hello"]
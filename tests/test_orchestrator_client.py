@@ -0,0 +1,238 @@
+"""
+Unit tests for the Bridge client (OrchestratorClient).
+
+The Bridge is replaced by an httpx.MockTransport that records requests.
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bridge import orchestrator_client as client_module
+from src.bridge.orchestrator_client import OrchestratorClient
+
+
+def _result(command):
+    """Bridge response echoing the command that produced it."""
+    line = " ".join([command["command"], *command["args"]])
+    return {"stdout": line, "stderr": "", "exit_code": 0, "duration_ms": 1}
+
+
+class FakeBridge:
+    """Records requests and answers them like the Bridge would."""
+
+    def __init__(self, batch_status=None, execute_delay=0, files_api=False):
+        self.batch_status = batch_status
+        self.execute_delay = execute_delay
+        self.files_api = files_api
+        self.requests = []
+
+    async def __call__(self, request):
+        body = orjson.loads(request.content) if request.content else None
+        self.requests.append((request.url.path, body))
+        if request.url.path == "/api/v1/commands/execute":
+            await asyncio.sleep(self.execute_delay)
+            return httpx.Response(200, json=_result(body))
+        if request.url.path == "/api/v1/commands/batch":
+            if self.batch_status is not None:
+                return httpx.Response(self.batch_status)
+            return httpx.Response(200, json=[_result(command) for command in body])
+        if request.url.path.startswith("/api/v1/files") and self.files_api:
+            return httpx.Response(200, json={"stdout": "", "stderr": "", "exit_code": 0, "duration_ms": 1})
+        return httpx.Response(404)
+
+    def paths(self):
+        return [path for path, _ in self.requests]
+
+
+@pytest_asyncio.fixture
+async def bridge():
+    """FakeBridge wired into a fresh OrchestratorClient."""
+    fake = FakeBridge()
+    client = OrchestratorClient(base_url="http://bridge.test")
+    await client.client.aclose()
+    client.client = httpx.AsyncClient(
+        base_url="http://bridge.test", transport=httpx.MockTransport(fake)
+    )
+    fake.client = client
+    yield fake
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_batch(bridge):
+    """Reads issued together go out as a single batch request."""
+    results = await asyncio.gather(
+        bridge.client.read_file("a.txt"),
+        bridge.client.read_file("b.txt"),
+        bridge.client.get_file_info("c.txt"),
+    )
+
+    assert [result.stdout for result in results] == ["cat a.txt", "cat b.txt", "stat c.txt"]
+    assert bridge.paths() == ["/api/v1/commands/batch"]
+
+
+@pytest.mark.asyncio
+async def test_lone_read_is_sent_as_single_command(bridge):
+    """A read with nothing to coalesce with uses the plain endpoint."""
+    result = await bridge.client.read_file("a.txt")
+
+    assert result.stdout == "cat a.txt"
+    assert bridge.paths() == ["/api/v1/commands/execute"]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting(bridge, monkeypatch):
+    """Reaching the batch limit sends the pending commands immediately."""
+    monkeypatch.setattr(client_module.settings, "BRIDGE_COALESCE_WINDOW_MS", 60_000)
+    monkeypatch.setattr(client_module.settings, "BRIDGE_COALESCE_MAX_BATCH", 2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(bridge.client.read_file("a"), bridge.client.read_file("b")),
+        timeout=1,
+    )
+
+    assert [result.stdout for result in results] == ["cat a", "cat b"]
+
+
+@pytest.mark.parametrize("status", [404, 405])
+@pytest.mark.asyncio
+async def test_batch_falls_back_to_single_commands(bridge, status):
+    """Without a batch endpoint commands are sent one by one, and that is remembered."""
+    bridge.batch_status = status
+
+    results = await asyncio.gather(bridge.client.read_file("a"), bridge.client.read_file("b"))
+    await asyncio.gather(bridge.client.read_file("c"), bridge.client.read_file("d"))
+
+    assert [result.stdout for result in results] == ["cat a", "cat b"]
+    assert bridge.paths() == [
+        "/api/v1/commands/batch",
+        "/api/v1/commands/execute",
+        "/api/v1/commands/execute",
+        "/api/v1/commands/execute",
+        "/api/v1/commands/execute",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_server_error_fails_every_caller(bridge):
+    """Other batch errors are raised to all coalesced callers."""
+    bridge.batch_status = 500
+
+    results = await asyncio.gather(
+        bridge.client.read_file("a"), bridge.client.read_file("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, Exception) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_close_sends_pending_commands(bridge, monkeypatch):
+    """Closing the client sends commands still waiting in the window."""
+    monkeypatch.setattr(client_module.settings, "BRIDGE_COALESCE_WINDOW_MS", 60_000)
+    read = asyncio.create_task(bridge.client.read_file("a"))
+    await asyncio.sleep(0)
+
+    await bridge.client.close()
+
+    assert (await read).stdout == "cat a"
+
+
+@pytest.mark.asyncio
+async def test_listing_is_cached(bridge):
+    """A repeated listing is served from the cache."""
+    first = await bridge.client.list_files("src")
+    second = await bridge.client.list_files("src/")
+
+    assert first.stdout == second.stdout == "ls -la src"
+    assert len(bridge.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_listing_expires(bridge, monkeypatch):
+    """Listings are refetched once BRIDGE_LIST_CACHE_TTL has passed."""
+    monkeypatch.setattr(client_module.settings, "BRIDGE_LIST_CACHE_TTL", 0.01)
+    await bridge.client.list_files("src")
+    await asyncio.sleep(0.02)
+    await bridge.client.list_files("src")
+
+    assert len(bridge.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_parent_listings(bridge):
+    """Writing a file drops the listings of the directories above it."""
+    bridge.files_api = True
+    await bridge.client.list_files("src")
+    await bridge.client.list_files("docs")
+
+    await bridge.client.write_file("src/pkg/new.py", "x")
+    await bridge.client.list_files("src")
+    await bridge.client.list_files("docs")
+
+    listings = [body for path, body in bridge.requests if body and body.get("command") == "ls"]
+    assert [listing["args"][1] for listing in listings] == ["src", "docs", "src"]
+
+
+@pytest.mark.asyncio
+async def test_listing_racing_a_write_is_not_cached(bridge):
+    """A listing fetched while a write runs is not served afterwards."""
+    bridge.execute_delay = 0.02
+    listing = asyncio.create_task(bridge.client.list_files("src"))
+    await asyncio.sleep(0.005)
+    bridge.execute_delay = 0
+    await bridge.client.delete_path("src/old.py")
+    await listing
+
+    await bridge.client.list_files("src")
+
+    listings = [body for path, body in bridge.requests if body and body.get("command") == "ls"]
+    assert len(listings) == 2
+
+
+@pytest.mark.asyncio
+async def test_mutating_command_clears_listings(bridge):
+    """A command that may change files drops every cached listing."""
+    await bridge.client.list_files("src")
+    await bridge.client.execute_command("git", ["checkout", "main"])
+    await bridge.client.list_files("src")
+
+    listings = [body for path, body in bridge.requests if body and body.get("command") == "ls"]
+    assert len(listings) == 2
+
+
+@pytest.mark.parametrize("cmd, args", [
+    ("env", ["rm", "-rf", "src/old"]),
+    ("find", ["src", "-name", "*.pyc", "-delete"]),
+    ("find", ["src", "-exec", "rm", "{}", "+"]),
+    ("tree", ["-o", "src/tree.txt"]),
+    ("cat", ["a.txt", ">", "src/b.txt"]),
+])
+@pytest.mark.asyncio
+async def test_commands_that_can_write_clear_listings(bridge, cmd, args):
+    """Commands able to change files without shell operators are not read-only."""
+    await bridge.client.list_files("src")
+    await bridge.client.execute_command(cmd, args)
+    await bridge.client.list_files("src")
+
+    listings = [body for path, body in bridge.requests if body and body.get("command") == "ls"]
+    assert len(listings) == 2
+
+
+@pytest.mark.asyncio
+async def test_read_only_command_keeps_listings(bridge):
+    """Read-only commands without shell operators leave the cache alone."""
+    await bridge.client.list_files("src")
+    await bridge.client.execute_command("grep", ["-r", "TODO", "src"])
+    await bridge.client.list_files("src")
+
+    listings = [body for path, body in bridge.requests if body and body.get("command") == "ls"]
+    assert len(listings) == 1
@@ -0,0 +1,143 @@
+"""
+Unit tests for the WebSocket outgoing event queue and its sender.
+"""
+
+import asyncio
+import os
+import sys
+
+import orjson
+import pytest
+from fastapi import WebSocketDisconnect
+from pydantic import BaseModel
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api.v1.agent import _StreamEventQueue, _drain_events
+
+
+class FakeWebSocket:
+    """Records sent frames; raises once `fail_after` frames were sent."""
+
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+        self.frames = []
+
+    async def send_text(self, text):
+        if self.fail_after is not None and len(self.frames) >= self.fail_after:
+            raise WebSocketDisconnect(code=1006)
+        self.frames.append(orjson.loads(text))
+
+
+class ToolResult(BaseModel):
+    """Pydantic value carried by a tool_result event."""
+
+    exit_code: int
+
+
+async def _drain(queue):
+    """Pop every pending event."""
+    events = []
+    while len(queue):
+        events.append(await queue.get())
+        await queue.task_done()
+    return events
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_non_chunk_event():
+    """The oldest droppable event makes room for a new one."""
+    queue = _StreamEventQueue(maxsize=3)
+    await queue.put_event({"type": "chunk", "content": "a"})
+    await queue.put_event({"type": "step", "content": "1"})
+    await queue.put_event({"type": "step", "content": "2"})
+
+    await asyncio.wait_for(queue.put_event({"type": "chunk", "content": "b"}), timeout=1)
+
+    assert await _drain(queue) == [
+        {"type": "chunk", "content": "a"},
+        {"type": "step", "content": "2"},
+        {"type": "chunk", "content": "b"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dropped_events_do_not_block_join():
+    """Evicted events are not waited for by join()."""
+    queue = _StreamEventQueue(maxsize=1)
+    await queue.put_event({"type": "step"})
+    await queue.put_event({"type": "tool_result"})
+
+    await _drain(queue)
+    await asyncio.wait_for(queue.join(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_never_dropped():
+    """With only chunks pending the producer waits for the consumer."""
+    queue = _StreamEventQueue(maxsize=2)
+    await queue.put_event({"type": "chunk", "content": "a"})
+    await queue.put_event({"type": "chunk", "content": "b"})
+
+    put = asyncio.create_task(queue.put_event({"type": "chunk", "content": "c"}))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+
+    assert await queue.get() == {"type": "chunk", "content": "a"}
+    await queue.task_done()
+    await asyncio.wait_for(put, timeout=1)
+    assert [event["content"] for event in await _drain(queue)] == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_closed_queue_stops_producer():
+    """A closed queue unblocks join() and waiting puts, and refuses new events."""
+    queue = _StreamEventQueue(maxsize=1)
+    await queue.put_event({"type": "chunk", "content": "a"})
+    put = asyncio.create_task(queue.put_event({"type": "chunk", "content": "b"}))
+    join = asyncio.create_task(queue.join())
+    await asyncio.sleep(0)
+
+    await queue.close()
+
+    await asyncio.wait_for(join, timeout=1)
+    with pytest.raises(WebSocketDisconnect):
+        await asyncio.wait_for(put, timeout=1)
+    with pytest.raises(WebSocketDisconnect):
+        await queue.put_event({"type": "step"})
+
+
+@pytest.mark.asyncio
+async def test_sender_closes_queue_when_client_disconnects():
+    """A failed send closes the queue instead of silently dropping events."""
+    websocket = FakeWebSocket(fail_after=1)
+    queue = _StreamEventQueue(maxsize=8)
+    await queue.put_event({"type": "step", "step": 1})
+    await queue.put_event({"type": "step", "step": 2})
+
+    await asyncio.wait_for(_drain_events(websocket, queue), timeout=1)
+
+    assert queue.closed
+    assert websocket.frames == [{"type": "step", "step": 1}]
+    with pytest.raises(WebSocketDisconnect):
+        await queue.put_event({"type": "step", "step": 3})
+
+
+@pytest.mark.asyncio
+async def test_sender_encodes_models_and_survives_bad_values():
+    """Pydantic values are encoded; unencodable events become error frames."""
+    websocket = FakeWebSocket()
+    queue = _StreamEventQueue(maxsize=8)
+    sender = asyncio.create_task(_drain_events(websocket, queue))
+    await queue.put_event({"type": "tool_result", "result": ToolResult(exit_code=0)})
+    await queue.put_event({"type": "tool_result", "result": object()})
+    await queue.put_event({"type": "chunk", "content": "still streaming"})
+
+    await asyncio.wait_for(queue.join(), timeout=1)
+    sender.cancel()
+
+    assert not queue.closed
+    assert websocket.frames[0] == {"type": "tool_result", "result": {"exit_code": 0}}
+    assert websocket.frames[1]["type"] == "error"
+    assert websocket.frames[2] == {"type": "chunk", "content": "still streaming"}
@@ -0,0 +1,172 @@
+"""
+Unit tests for the message and checkpoint write-behind buffers.
+
+The database is replaced by recording _flush implementations and fake
+session factories, so these tests only exercise the batching logic.
+"""
+
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import write_buffer
+from src.db.write_buffer import CheckpointWriteBuffer, MessageWriteBuffer, _WriteBuffer
+
+
+class RecordingMessageBuffer(MessageWriteBuffer):
+    """Message buffer that records batches instead of inserting them."""
+
+    def __init__(self, flush_delay: float = 0, **kwargs):
+        super().__init__(**kwargs)
+        self.flush_delay = flush_delay
+        self.batches = []
+
+    async def _flush(self, batch):
+        await asyncio.sleep(self.flush_delay)
+        self.batches.append([row["content"] for row, _ in batch])
+        for row, future in batch:
+            if not future.done():
+                future.set_result(row["content"])
+
+
+def _fake_session_factory(failures: int):
+    """Session factory whose first `failures` transactions raise."""
+    calls = {"count": 0}
+
+    class FakeSession:
+        @asynccontextmanager
+        async def begin(self):
+            calls["count"] += 1
+            if calls["count"] <= failures:
+                raise ConnectionError("database unavailable")
+            yield
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    return FakeSession, calls
+
+
+def test_write_buffer_is_abstract():
+    """The shared flusher cannot be instantiated without _flush."""
+    with pytest.raises(TypeError):
+        _WriteBuffer(max_batch=1, max_delay=0)
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full():
+    """A full batch is flushed without waiting for the delay."""
+    buffer = RecordingMessageBuffer(max_batch=3, max_delay=10)
+    buffer.start()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(buffer.add("s", "user", str(i)) for i in range(3))),
+        timeout=1,
+    )
+
+    assert results == ["0", "1", "2"]
+    assert buffer.batches == [["0", "1", "2"]]
+    await buffer.stop()
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_delay():
+    """A partial batch is flushed once max_delay has passed."""
+    buffer = RecordingMessageBuffer(max_batch=10, max_delay=0.01)
+    buffer.start()
+
+    result = await asyncio.wait_for(buffer.add("s", "user", "only"), timeout=1)
+
+    assert result == "only"
+    assert buffer.batches == [["only"]]
+    await buffer.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_writes_batch_in_flight():
+    """Rows already taken off the queue are written by stop()."""
+    buffer = RecordingMessageBuffer(flush_delay=0.05, max_batch=4, max_delay=10)
+    buffer.start()
+
+    adds = [asyncio.create_task(buffer.add("s", "user", str(i))) for i in range(6)]
+    await asyncio.sleep(0.01)
+    await buffer.stop()
+
+    assert await asyncio.wait_for(asyncio.gather(*adds), timeout=1) == [str(i) for i in range(6)]
+    assert buffer.batches == [["0", "1", "2", "3"], ["4", "5"]]
+    assert not buffer.running
+
+
+@pytest.mark.asyncio
+async def test_add_after_stop_raises():
+    """A stopped buffer refuses new rows instead of leaving them unflushed."""
+    buffer = RecordingMessageBuffer(max_batch=4, max_delay=0.01)
+    buffer.start()
+    await buffer.stop()
+
+    with pytest.raises(RuntimeError):
+        await buffer.add("s", "user", "late")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_flusher_fails_waiting_callers():
+    """Callers of a batch lost to cancellation get an exception, not a hang."""
+    buffer = RecordingMessageBuffer(flush_delay=10, max_batch=1, max_delay=0)
+    buffer.start()
+
+    add = asyncio.create_task(buffer.add("s", "user", "lost"))
+    await asyncio.sleep(0.01)
+    buffer._task.cancel()
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(add, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_flush_retries_transient_errors(monkeypatch):
+    """A failed checkpoint batch is retried until it is written."""
+    written = []
+
+    async def fake_write_checkpoints(session, rows):
+        written.append(list(rows))
+
+    monkeypatch.setattr(write_buffer, "write_checkpoints", fake_write_checkpoints)
+    monkeypatch.setattr(write_buffer.asyncio, "sleep", _no_sleep)
+    factory, calls = _fake_session_factory(failures=2)
+    buffer = CheckpointWriteBuffer(session_factory=factory, max_retries=3)
+
+    await buffer._flush([{"id": 1}])
+
+    assert calls["count"] == 3
+    assert written == [[{"id": 1}]]
+    assert buffer.failed_rows == 0
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_flush_counts_dropped_rows(monkeypatch):
+    """Rows still failing after the last retry are counted in failed_rows."""
+    async def fake_write_checkpoints(session, rows):
+        pass
+
+    monkeypatch.setattr(write_buffer, "write_checkpoints", fake_write_checkpoints)
+    monkeypatch.setattr(write_buffer.asyncio, "sleep", _no_sleep)
+    factory, calls = _fake_session_factory(failures=10)
+    buffer = CheckpointWriteBuffer(session_factory=factory, max_retries=2)
+
+    await buffer._flush([{"id": 1}, {"id": 2}])
+
+    assert calls["count"] == 3
+    assert buffer.failed_rows == 2
+
+
+async def _no_sleep(delay):
+    """Stand-in for asyncio.sleep so retry backoff doesn't slow tests."""